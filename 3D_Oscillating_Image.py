@@ -1,7 +1,5 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from matplotlib.animation import FuncAnimation, PillowWriter
+from bridge_sim.animate import ModeShapeScene, render_frames, write_animation
 
 # === 1) Physical / simulation parameters ===
 m = 1000.0             # mass (kg)
@@ -40,38 +38,14 @@ phi = np.sin(np.pi * x / L)
 # sample 100 frames evenly from the time series
 frames_idx = np.linspace(0, len(t)-1, 100, dtype=int)
 
-# === 5) Set up figure & initial line ===
-fig = plt.figure()
-ax = fig.add_subplot(111, projection='3d')
-line, = ax.plot(x, np.zeros_like(x), A[frames_idx[0]] * phi, linewidth=2)
+# === 5) Render frames in parallel & stream them to a GIF ===
+# each worker process builds its own figure (axes scaled to the first
+# frame, camera at elev=20, azim=-60) and renders a chunk of frames;
+# frames are written in order as they arrive, so memory stays bounded
+scene = ModeShapeScene(x, phi, A[frames_idx[0]], zeta=zeta)
 
-ax.set_xlabel('Span (m)')
-ax.set_ylabel('Width')
-ax.set_zlabel('Deflection (m)')
-ax.set_title(f'Bridge Oscillation (ζ={zeta})')
+if __name__ == "__main__":
+    frames = render_frames(scene, A[frames_idx])
+    write_animation(frames, "bridge_oscillation_slow.gif", fps=10)  # 100 ms per frame (slower)
 
-# fix camera angle
-ax.view_init(elev=20, azim=-60)
-
-# === 6) Update function ===
-def update(frame):
-    w = A[frame] * phi
-    line.set_data(x, np.zeros_like(x))
-    line.set_3d_properties(w)
-    return line,
-
-# === 7) Animate & save as GIF ===
-ani = FuncAnimation(
-    fig,
-    update,
-    frames=frames_idx,
-    interval=100,   # milliseconds between frames (slower)
-    blit=True
-)
-
-writer = PillowWriter(fps=10)  # frames per second for GIF
-ani.save("bridge_oscillation_slow.gif", writer=writer)
-
-plt.close(fig)
-
-print("Saved animation as bridge_oscillation_slow.gif")
+    print("Saved animation as bridge_oscillation_slow.gif")
@@ -1,6 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.signal import TransferFunction, bode
+from bridge_sim.figures import bode_figure
+from bridge_sim.frf import find_resonances
+from bridge_sim.models import sdof_matrices
 
 # 1) System parameters
 m = 1000.0                 # mass (kg)
@@ -17,20 +20,11 @@ sys = TransferFunction(num, den)
 w = np.logspace(-1, 2, 500)    # rad/s from 0.1 to 100
 w, mag, phase = bode(sys, w=w)
 
-# 4) Plot magnitude (dB) and phase (deg)
-fig, (ax1, ax2) = plt.subplots(2,1, figsize=(8,6), sharex=True)
+# Locate the resonance exactly (the 500-point grid only brackets it)
+res = find_resonances(*sdof_matrices(m, c, k), 1.0, w[0], w[-1])
 
-ax1.semilogx(w, mag, 'b', lw=2)
-ax1.set_ylabel('Magnitude (dB)')
-ax1.set_title('Bode Plot of Bridge SDOF Transfer Function')
-ax1.grid(True, which='both', ls='--', alpha=0.5)
-
-ax2.semilogx(w, phase, 'r', lw=2)
-ax2.set_xlabel('Frequency (rad/s)')
-ax2.set_ylabel('Phase (deg)')
-ax2.grid(True, which='both', ls='--', alpha=0.5)
-
-plt.tight_layout()
-plt.show()
-# Save the figure
-plt.savefig("Bode_Plot_Bridge_SDOF.png", dpi=300)
\ No newline at end of file
+# 4) Plot magnitude (dB) and phase (deg), peaks marked
+bode_figure(w, mag, phase, res)
+# Save the figure (before show, which may clear it)
+plt.savefig("Bode_Plot_Bridge_SDOF.png", dpi=300)
+plt.show()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from bridge_sim.analytic import sdof_closed_form
+from bridge_sim.figures import displacement_over_time_figure
 
 # === 1) SYSTEM PARAMETERS ===
 m = 1000.0                # mass (kg)
@@ -31,35 +33,11 @@ for i, t in enumerate(t_vals):
     y += (h/6)*(k1 + 2*k2 + 2*k3 + k4)
 
 # === 4) ANALYTICAL (HOMOGENEOUS + PARTICULAR) SOLUTION ===
-# 4a) particular
-denom = np.sqrt((omega_n**2 - Omega**2)**2 + (2*zeta*omega_n*Omega)**2)
-X = (F0/m)/denom
-phi = np.arctan2(2*zeta*omega_n*Omega, omega_n**2 - Omega**2)
-x_part = X * np.sin(Omega*t_vals - phi)
-
-# 4b) homogeneous
-omega_d = omega_n*np.sqrt(1 - zeta**2)
-# initial homogeneous conditions:
-x_h0 = 0 - x_part[0]
-v_h0 = 0 - (X*Omega*np.cos(-phi))
-C1 = x_h0
-C2 = (v_h0 + zeta*omega_n*C1)/omega_d
-x_hom = np.exp(-zeta*omega_n*t_vals)*(C1*np.cos(omega_d*t_vals) + C2*np.sin(omega_d*t_vals))
-
-x_exact = x_part + x_hom
+# closed form for x(0)=0, x'(0)=0, valid for any damping ratio
+x_exact = sdof_closed_form(m, k, zeta, F0, Omega, t_vals)[0]
 
 # === 5) PLOT EVERYTHING ===
-plt.figure(figsize=(10,6))
-plt.plot(t_vals, x_vals,      label="Numerical Solution (RK4)",      lw=2)
-plt.plot(t_vals, x_exact, '--',label="Analytical Solution",            lw=2)
-plt.axhline(F0/k, color='gray', ls='--', label='Static Deflection F₀/k')
-
-plt.xlabel("Time (s)")
-plt.ylabel("Displacement x(t) [m]")
-plt.title("Bridge Displacement Over Time")
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-# Save the figure
-plt.savefig("Bridge_Displacement_Over_Time.png", dpi=300)
\ No newline at end of file
+displacement_over_time_figure(t_vals, x_vals, x_exact, F0/k)
+# Save the figure (before show, which may clear it)
+plt.savefig("Bridge_Displacement_Over_Time.png", dpi=300)
+plt.show()
\ No newline at end of file
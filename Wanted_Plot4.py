@@ -1,25 +1,25 @@
+import numpy as np
+from bridge_sim.sweep import frequency_sweep
+
+# Same 4-mass system as Wanted_3D_Plot2.py
+m = 1e5      # kg, each mass
+k0 = 2e7     # N/m, spring to ground at each mass
+kc = 1e7     # N/m, coupling spring between adjacent masses
+c0 = 2*np.sqrt(k0*m)*0.01  # Ns/m, damping (zeta ~ 0.01)
+cc = c0      # Ns/m, coupling damper (for simplicity)
+F0 = 1e6     # N, forcing amplitude
+dt = 0.005   # time step (s)
+t_end = 50   # maximum simulation time (s)
+
 # Compare theoretical and numerical amplitude over frequencies
 freqs = [1.0, 1.5, 2.0, 2.25, 2.5, 3.0]  # Hz
-results = []
-for f in freqs:
-    omega = 2*np.pi*f
-    state = np.zeros(8)
-    # simulate symmetric forcing at each freq
-    for i in range(n_steps):
-        state = rk4_step(derivatives, state, i*dt, dt, F0, omega)
-    # take max displacement after 80% of simulation to approximate steady-state amplitude
-    sol = np.zeros(n_steps+1)
-    # (reuse sol array for brevity)
-    state = np.zeros(8)
-    for i in range(n_steps):
-        state = rk4_step(derivatives, state, i*dt, dt, F0, omega)
-        sol[i+1] = state[0]
-    amp_num = np.max(np.abs(sol[int(n_steps*0.8):]))
-    # theoretical amplitude (single-DOF formula)
-    A_theo = F0/np.sqrt((k0 - m*omega**2)**2 + (c0*omega)**2)
-    results.append((f, A_theo, amp_num))
-# Print results
-print("Freq (Hz)  A_theo (m)  A_num (m)  RelError")
-for f, A_t, A_n in results:
-    rel = (A_n - A_t)/A_t if A_t!=0 else 0
-    print(f"{f:6.2f}   {A_t:7.3f}     {A_n:7.3f}   {rel:6.3%}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    # symmetric forcing at each freq, one run per freq spread over all cores;
+    # each run stops once the cycle amplitude and phase have converged
+    results = frequency_sweep(freqs, m, k0, c0, kc, cc, F0, dt, t_end,
+                              steady_tol=1e-4)
+    # Print results
+    print("Freq (Hz)  A_theo (m)  A_num (m)  RelError")
+    for r in results.itertuples(index=False):
+        print(f"{r.freq_hz:6.2f}   {r.A_theo:7.3f}     {r.A_num:7.3f}   {r.rel_error:6.3%}")
@@ -0,0 +1,106 @@
+"""Reusable simulation engines for the bridge oscillation scripts.
+
+The plotting scripts in the project root import from here so that every
+figure and table is produced by the same integrators.
+
+Names are imported lazily: ``from bridge_sim import rk4_sdof_batch`` only
+loads the module that defines it, so light-weight users (and the batch
+CLI, ``python -m bridge_sim``) do not pay for scipy or pandas up front.
+"""
+import importlib
+
+# public name -> defining submodule
+_EXPORTS = {
+    "AdaptiveResult": "adaptive",
+    "DenseOutput": "adaptive",
+    "dopri5": "adaptive",
+    "sdof_closed_form": "analytic",
+    "unit_mass_response": "analytic",
+    "ModeShapeScene": "animate",
+    "render_frames": "animate",
+    "write_animation": "animate",
+    "broadcast_cases": "batched",
+    "rk4_linear_batch": "batched",
+    "rk4_sdof_batch": "batched",
+    "rk4_sdof_chunks": "batched",
+    "ResultCache": "cache",
+    "make_key": "cache",
+    "ChunkedColumnWriter": "columnar",
+    "ColumnStore": "columnar",
+    "export_table": "columnar",
+    "ExactPropagator": "exact",
+    "HarmonicPropagator": "exact",
+    "four_mass_propagator": "exact",
+    "sdof_propagator": "exact",
+    "MinerDamage": "fatigue",
+    "RainflowCounter": "fatigue",
+    "RainflowRecorder": "fatigue",
+    "SNCurve": "fatigue",
+    "rainflow": "fatigue",
+    "turning_points": "fatigue",
+    "SampledForce": "forcing",
+    "csv_to_npy": "forcing",
+    "open_force": "forcing",
+    "run_sampled": "forcing",
+    "FrequencyResponse": "frf",
+    "Resonances": "frf",
+    "find_resonances": "frf",
+    "frequency_response": "frf",
+    "sdof_response": "frf",
+    "MatrixRK4": "kernel",
+    "deck_lattice": "lattice",
+    "lattice_coordinates": "lattice",
+    "lattice_edges": "lattice",
+    "sparse_coupled_matrices": "lattice",
+    "ModalSolver": "modal",
+    "modal_basis": "modal",
+    "coupled_matrices": "models",
+    "four_mass_matrices": "models",
+    "sdof_matrices": "models",
+    "state_space": "models",
+    "History": "recorders",
+    "RingBuffer": "recorders",
+    "Stats": "recorders",
+    "run_recorded": "recorders",
+    "refine_axis": "refine",
+    "Spectrogram": "spectral",
+    "spectrogram": "spectral",
+    "spectrogram_figure": "spectral",
+    "swept_sine_spectrogram": "spectral",
+    "SteadyState": "steady",
+    "SteadyStateDetector": "steady",
+    "integrate_until_steady": "steady",
+    "frequency_sweep": "sweep",
+    "theoretical_amplitude": "sweep",
+    "FourMassModel": "sysid",
+    "Identification": "sysid",
+    "SDOFModel": "sysid",
+    "identify": "sysid",
+    "KalmanFilter": "twin",
+    "LatencyHistogram": "twin",
+    "replay": "twin",
+    "run_twin": "twin",
+    "sdof_filter": "twin",
+    "socket_source": "twin",
+    "compact_figure": "webexport",
+    "write_compact_html": "webexport",
+    "TurbulentWind": "wind",
+    "davenport_spectrum": "wind",
+    "kaimal_spectrum": "wind",
+    "monte_carlo": "wind",
+    "summarize": "wind",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("." + _EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,159 @@
+"""Adaptive Dormand-Prince 5(4) integrator with dense output.
+
+Uses the same derivative interface as the scripts' RK4 helpers,
+f(y, t, *args) -> dy/dt, but chooses its own steps: every step carries
+an embedded 4th-order error estimate, steps whose error exceeds the
+budget  atol + rtol*|y|  are rejected and retried smaller, and smooth,
+well-damped stretches are crossed with large steps.  A 4th-order
+continuous extension gives the solution at arbitrary times without
+forcing the step size.
+
+    def deriv(y, t):
+        x, v = y
+        return np.array([v, (F0*np.sin(Omega*t) - c*v - k*x)/m])
+
+    res = dopri5(deriv, [0.0, 0.0], (0, 60), rtol=1e-8, atol=1e-10,
+                 t_eval=np.arange(0, 60.01, 0.01))
+    res.y[:, 0], res.n_fev
+"""
+from collections import namedtuple
+
+import numpy as np
+
+AdaptiveResult = namedtuple(
+    "AdaptiveResult",
+    ["t", "y", "sol", "n_fev", "n_accepted", "n_rejected"])
+AdaptiveResult.__doc__ = """\
+t, y     -- output times and states (rows); the accepted step ends unless
+            t_eval was given
+sol      -- DenseOutput, callable at any time inside the integration span
+n_fev    -- number of derivative evaluations"""
+
+# Dormand-Prince tableau
+_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1])
+_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+]
+_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# difference between the 5th- and embedded 4th-order weights
+_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# continuous extension: y(t0 + theta h) = y0 + h K^T P [theta, theta^2, theta^3, theta^4]
+_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+
+class DenseOutput:
+    """Piecewise quartic interpolant over all accepted steps."""
+
+    def __init__(self, t_starts, hs, y_starts, Qs):
+        self.t_starts = np.asarray(t_starts)
+        self.hs = np.asarray(hs)
+        self.y_starts = np.asarray(y_starts)
+        self.Qs = np.asarray(Qs)         # (n_steps, n, 4)
+
+    def __call__(self, t):
+        t = np.atleast_1d(np.asarray(t, dtype=float))
+        i = np.clip(np.searchsorted(self.t_starts, t, side="right") - 1,
+                    0, len(self.t_starts) - 1)
+        theta = (t - self.t_starts[i]) / self.hs[i]
+        powers = np.cumprod(np.repeat(theta[:, None], 4, axis=1), axis=1)
+        return self.y_starts[i] + self.hs[i, None]*np.einsum("snj,sj->sn", self.Qs[i], powers)
+
+
+def _rms_norm(x):
+    return np.sqrt(np.mean(x*x))
+
+
+def _initial_step(f, t0, y0, f0, args, rtol, atol):
+    """Hairer-Wanner starting step estimate (costs one extra evaluation)."""
+    scale = atol + rtol*np.abs(y0)
+    d0, d1 = _rms_norm(y0/scale), _rms_norm(f0/scale)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01*d0/d1
+    f1 = f(y0 + h0*f0, t0 + h0, *args)
+    d2 = _rms_norm((f1 - f0)/scale)/h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0*1e-3)
+    else:
+        h1 = (0.01/max(d1, d2))**(1/5)
+    return min(100*h0, h1)
+
+
+def dopri5(f, y0, t_span, args=(), rtol=1e-6, atol=1e-9, h0=None,
+           max_step=np.inf, t_eval=None):
+    """
+    Integrate y' = f(y, t, *args) over t_span = (t0, t1) to the error
+    budget atol + rtol*|y| per step.  Returns an AdaptiveResult.
+    """
+    t, t_end = map(float, t_span)
+    y = np.array(y0, dtype=float)
+    n = y.size
+    K = np.empty((7, n))
+    K[0] = f(y, t, *args)
+    n_fev = 1
+    if h0 is None:
+        h = _initial_step(f, t, y, K[0], args, rtol, atol)
+        n_fev += 1
+    else:
+        h = float(h0)
+
+    ts, ys = [t], [y.copy()]
+    t_starts, hs, y_starts, Qs = [], [], [], []
+    n_acc = n_rej = 0
+    rejected_last = False
+
+    # remainders this small are rounding drift, not a step still to take
+    snap = 4*np.finfo(float).eps*max(1.0, abs(t_end))
+    while t < t_end:
+        h = min(h, max_step, t_end - t)
+        if t_end - (t + h) <= snap:
+            h = t_end - t
+        for s in range(1, 6):
+            K[s] = f(y + h*(np.dot(_A[s], K[:s])), t + _C[s]*h, *args)
+        y_new = y + h*np.dot(_B[:6], K[:6])
+        K[6] = f(y_new, t + h, *args)
+        n_fev += 6
+
+        scale = atol + rtol*np.maximum(np.abs(y), np.abs(y_new))
+        err = _rms_norm(h*np.dot(_E, K)/scale)
+
+        if err <= 1.0:
+            t_starts.append(t); hs.append(h); y_starts.append(y)
+            Qs.append(K.T @ _P)
+            t += h
+            if t_end - t <= snap:
+                t = t_end
+            y = y_new
+            K[0] = K[6]          # first-same-as-last
+            ts.append(t); ys.append(y.copy())
+            n_acc += 1
+            factor = 10.0 if err == 0 else min(10.0, 0.9*err**-0.2)
+            if rejected_last:
+                factor = min(factor, 1.0)
+            rejected_last = False
+        else:
+            n_rej += 1
+            factor = max(0.2, 0.9*err**-0.2)
+            rejected_last = True
+            if h*factor < 1e-14*max(1.0, abs(t)):
+                raise RuntimeError(f"step size underflow at t={t}")
+        h *= factor
+
+    sol = DenseOutput(t_starts, hs, y_starts, Qs) if t_starts else None
+    if t_eval is not None:
+        t_out = np.asarray(t_eval, dtype=float)
+        y_out = sol(t_out) if sol is not None else np.tile(ys[0], (t_out.size, 1))
+    else:
+        t_out, y_out = np.array(ts), np.array(ys)
+    return AdaptiveResult(t_out, y_out, sol, n_fev, n_acc, n_rej)
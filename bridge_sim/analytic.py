@@ -0,0 +1,117 @@
+"""Closed-form response of the forced SDOF bridge model.
+
+    m x'' + c x' + k x = F0 sin(Omega t),   c = 2 zeta sqrt(k m)
+
+is solved exactly for any damping ratio.  The particular part is the
+steady harmonic  X sin(Omega t - phi)  (or the secular  t cos(omega_n t)
+term for undamped resonance); the homogeneous part, with a0, b0 the
+initial displacement/velocity left over after the particular part, is
+
+    x_h = a0 C(t) + (b0 + s a0) D(t),   v_h = b0 C(t) - (s b0 + omega_n^2 a0) D(t)
+
+with s = zeta omega_n and, per regime,
+
+    zeta < 1:  C = e^{-st} cos(wd t),  D = e^{-st} sin(wd t) / wd
+    zeta = 1:  C = e^{-st},            D = t e^{-st}
+    zeta > 1:  C = e^{-st} cosh(r t),  D = e^{-st} sinh(r t) / r
+
+The regime is chosen per case, so one call covers mixed damping ratios,
+and evaluation is a handful of ufuncs per point -- a cheap reference for
+the integrators and a replacement for them wherever a closed form exists.
+"""
+import numpy as np
+
+from .batched import broadcast_cases
+
+CRITICAL_TOL = 1e-12    # |zeta - 1| below this is treated as critical
+
+
+def _regime_terms(wn, zeta, t):
+    """C(t), D(t) above for per-case wn, zeta (shape (n, 1)) and times t."""
+    s = zeta*wn
+    C = np.empty(np.broadcast_shapes(s.shape, t.shape))
+    D = np.empty_like(C)
+    under = (zeta < 1 - CRITICAL_TOL)[:, 0]
+    over = (zeta > 1 + CRITICAL_TOL)[:, 0]
+    critical = ~(under | over)
+
+    if under.any():
+        w = wn[under]*np.sqrt(1 - zeta[under]**2)
+        decay = np.exp(-s[under]*t)
+        C[under] = decay*np.cos(w*t)
+        D[under] = decay*np.sin(w*t)/w
+    if critical.any():
+        decay = np.exp(-s[critical]*t)
+        C[critical] = decay
+        D[critical] = t*decay
+    if over.any():
+        r = wn[over]*np.sqrt(zeta[over]**2 - 1)
+        # e^{-st} cosh(rt) and e^{-st} sinh(rt)/r from the two decaying
+        # exponentials; expm1 keeps the difference accurate for small r t
+        slow = np.exp((r - s[over])*t)
+        fast = np.exp(-(r + s[over])*t)
+        C[over] = 0.5*(slow + fast)
+        D[over] = -slow*np.expm1(-2*r*t)/(2*r)
+    return C, D
+
+
+def unit_mass_response(wn, zeta, f, Omega, x0, v0, t):
+    """
+    x, v of  x'' + 2 zeta wn x' + wn^2 x = f sin(Omega t)  for per-case
+    arrays of shape (n,) and 1-D t; results have shape (n, len(t)).
+    The mass-normalized core of sdof_closed_form, also used for the
+    modal coordinates in modal.ModalSolver.
+    """
+    wn, zeta, f, Omega, x0, v0 = (a[:, None] for a in (wn, zeta, f, Omega, x0, v0))
+    t = np.asarray(t, dtype=float)[None, :]
+
+    # undamped drive exactly at resonance has no bounded particular solution
+    secular = ((zeta == 0) & np.isclose(Omega, wn, rtol=1e-12, atol=0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        X = np.where(secular, 0.0,
+                     f/np.hypot(wn**2 - Omega**2, 2*zeta*wn*Omega))
+        half = np.where(secular, f/(2*wn), 0.0)
+    phi = np.arctan2(2*zeta*wn*Omega, wn**2 - Omega**2)
+
+    # steady harmonic  X sin(Omega t - phi)  plus  -half t cos(wn t)
+    arg = Omega*t - phi
+    x = X*np.sin(arg)
+    v = X*Omega*np.cos(arg)
+    if secular.any():
+        wt = wn*t
+        x -= half*t*np.cos(wt)
+        v -= half*(np.cos(wt) - wt*np.sin(wt))
+
+    # homogeneous part from what the particular part leaves of x0, v0
+    a0 = x0 + X*np.sin(phi)
+    b0 = v0 - X*Omega*np.cos(phi) + half
+    s = zeta*wn
+    C, D = _regime_terms(wn, zeta, t)
+    x += a0*C + (b0 + s*a0)*D
+    v += b0*C - (s*b0 + wn**2*a0)*D
+    return x, v
+
+
+def sdof_closed_form(m, k, zeta, F0, Omega, t, x0=0.0, v0=0.0,
+                     return_velocity=False):
+    """
+    Exact x(t) of m x'' + c x' + k x = F0 sin(Omega t), c = 2 zeta sqrt(k m),
+    for many cases at once -- the analytic counterpart of rk4_sdof_batch.
+
+    m, k, zeta, F0, Omega, x0, v0 may be scalars or arrays; they are
+    broadcast against each other and flattened to n_cases, each case using
+    the formula for its own damping regime.  Returns x with shape
+    (n_cases, len(t)) (and v of the same shape if return_velocity=True).
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    if t.ndim != 1:
+        raise ValueError("t must be a 1-D array")
+    m, k, zeta, F0, Omega, x0, v0 = broadcast_cases(m, k, zeta, F0, Omega, x0, v0)
+    if np.any(m <= 0) or np.any(k <= 0):
+        raise ValueError("m and k must be positive")
+    if np.any(zeta < 0):
+        raise ValueError("zeta must be non-negative")
+    x, v = unit_mass_response(np.sqrt(k/m), zeta, F0/m, Omega, x0, v0, t)
+    if return_velocity:
+        return x, v
+    return x
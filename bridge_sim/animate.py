@@ -0,0 +1,244 @@
+"""Parallel frame rendering for the mode-shape animation.
+
+FuncAnimation + PillowWriter redraw every frame of the 3D axes in one
+process and Pillow keeps all frames in memory until the GIF is written.
+Here each worker process owns its own figure (built once by the scene's
+setup()), renders a chunk of frames to raw RGB arrays, and the frames
+are streamed in order to the encoder:
+
+    scene = ModeShapeScene(x, phi, A[0], zeta=0.05)
+    frames = render_frames(scene, A[idx], processes=8)
+    write_animation(frames, "bridge_oscillation.gif", fps=10)   # or .mp4
+
+Only a bounded window of chunks is in flight, so memory does not grow
+with the number of frames.  A scene is any picklable object with
+setup() and render(value) -> (height, width, 3) uint8 array.
+"""
+import io
+import os
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+class ModeShapeScene:
+    """
+    First-mode deflection of the deck, A * phi(x), on 3D axes laid out
+    like 3D_Oscillating_Image.py.  The axes are scaled to the first
+    amplitude `initial` (as FuncAnimation would), then only the line moves.
+    """
+
+    def __init__(self, x, phi, initial=0.0, zeta=None, figsize=(6.4, 4.8), dpi=100,
+                 elev=20, azim=-60):
+        self.x = np.asarray(x, dtype=float)
+        self.phi = np.asarray(phi, dtype=float)
+        self.initial = float(initial)
+        self.zeta = zeta
+        self.figsize = figsize
+        self.dpi = dpi
+        self.view = (elev, azim)
+
+    def setup(self):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        self.fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        self.canvas = FigureCanvasAgg(self.fig)
+        ax = self.fig.add_subplot(111, projection='3d')
+        self.line, = ax.plot(self.x, np.zeros_like(self.x), self.initial*self.phi,
+                             linewidth=2)
+        ax.set_xlabel('Span (m)')
+        ax.set_ylabel('Width')
+        ax.set_zlabel('Deflection (m)')
+        if self.zeta is not None:
+            ax.set_title(f'Bridge Oscillation (ζ={self.zeta})')
+        ax.view_init(*self.view)
+
+    def render(self, amplitude):
+        self.line.set_data(self.x, np.zeros_like(self.x))
+        self.line.set_3d_properties(amplitude*self.phi)
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+_SCENE = None
+
+
+def _init_worker(scene):
+    global _SCENE
+    _SCENE = scene
+    _SCENE.setup()
+
+
+def _render_chunk(values):
+    return np.stack([_SCENE.render(v) for v in values])
+
+
+def render_frames(scene, values, processes=None, chunk_size=8, max_pending=None):
+    """
+    Yield scene.render(v) for every v in values, in order.  Frames are
+    rendered in chunks of chunk_size across `processes` workers (default:
+    all cores); at most max_pending chunks (default 2 per worker) are in
+    flight at once.  processes=1 renders in this process.
+    """
+    values = list(values)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        scene.setup()
+        for v in values:
+            yield scene.render(v)
+        return
+
+    max_pending = max_pending or 2*processes
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(scene,)) as pool:
+        pending = deque()
+        for start in range(0, len(values), chunk_size):
+            pending.append(pool.submit(_render_chunk, values[start:start + chunk_size]))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _gif_frame_parts(data):
+    """
+    (image descriptor, colour table, image data) of a single-frame GIF as
+    written by Pillow, with the global colour table moved into the
+    descriptor as a local one so the frame can be spliced into a stream.
+    """
+    flags = data[10]
+    pos = 13
+    table, bits = b"", 0
+    if flags & 0x80:
+        bits = flags & 0x07
+        table = data[pos:pos + 3*2**(bits + 1)]
+        pos += len(table)
+    while data[pos] == 0x21:                    # skip extensions
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    if data[pos] != 0x2C:
+        raise ValueError("no image descriptor in GIF frame")
+    desc = bytearray(data[pos:pos + 10])
+    pos += 10
+    if desc[9] & 0x80:                          # already has a local table
+        table = data[pos:pos + 3*2**((desc[9] & 0x07) + 1)]
+        pos += len(table)
+    else:
+        desc[9] = (desc[9] & 0x78) | 0x80 | bits
+    start = pos
+    pos += 1                                    # LZW minimum code size
+    while data[pos]:
+        pos += data[pos] + 1
+    return bytes(desc), table, data[start:pos + 1]
+
+
+class GifStreamWriter:
+    """
+    Animated GIF written frame by frame.  Each frame stores only the
+    bounding box of the pixels that changed since the previous one, with
+    its own palette, so only one previous frame is ever kept.
+    """
+
+    def __init__(self, path, fps=10, loop=0):
+        self.path = path
+        self.delay = int(round(100/fps))        # centiseconds
+        self.loop = loop
+        self.size = None
+        self._prev = None
+        self._f = open(path, "wb")
+
+    def write(self, rgb):
+        from PIL import Image
+        h, w = rgb.shape[:2]
+        if self.size is None:
+            self.size = (w, h)
+            self._f.write(b"GIF89a" + w.to_bytes(2, "little") + h.to_bytes(2, "little")
+                          + b"\x00\x00\x00")
+            if self.loop is not None:
+                self._f.write(b"!\xff\x0bNETSCAPE2.0\x03\x01"
+                              + int(self.loop).to_bytes(2, "little") + b"\x00")
+        elif (w, h) != self.size:
+            raise ValueError(f"frame size {w}x{h} differs from {self.size[0]}x{self.size[1]}")
+        top, left, bottom, right = 0, 0, h, w
+        if self._prev is not None:
+            changed = np.any(rgb != self._prev, axis=2)
+            rows, cols = np.flatnonzero(changed.any(1)), np.flatnonzero(changed.any(0))
+            if rows.size:
+                top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            else:                               # repeat frame: one unchanged pixel
+                bottom, right = 1, 1
+        self._prev = rgb
+        buf = io.BytesIO()
+        Image.fromarray(np.ascontiguousarray(rgb[top:bottom, left:right])).convert(
+            "P", palette=Image.Palette.ADAPTIVE).save(buf, "GIF")
+        desc, table, image = _gif_frame_parts(buf.getvalue())
+        offset = int(left).to_bytes(2, "little") + int(top).to_bytes(2, "little")
+        desc = desc[:1] + offset + desc[5:]
+        self._f.write(b"!\xf9\x04\x04" + self.delay.to_bytes(2, "little") + b"\x00\x00")
+        self._f.write(desc + table + image)
+
+    def close(self):
+        if not self._f.closed:
+            self._f.write(b";")
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FFmpegStreamWriter:
+    """Raw RGB frames piped to ffmpeg (matplotlib's animation.ffmpeg_path)."""
+
+    def __init__(self, path, fps=10, codec="libx264"):
+        self.path = path
+        self.fps = fps
+        self.codec = codec
+        self._proc = None
+
+    def write(self, rgb):
+        if self._proc is None:
+            from matplotlib import rcParams
+            h, w = rgb.shape[:2]
+            cmd = [rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}",
+                   "-r", str(self.fps), "-i", "-",
+                   "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-c:v", self.codec,
+                   "-pix_fmt", "yuv420p", self.path]
+            try:
+                self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            except FileNotFoundError:
+                raise RuntimeError(f"ffmpeg not found ({cmd[0]}); write a .gif instead "
+                                   "or set matplotlib's animation.ffmpeg_path") from None
+        self._proc.stdin.write(np.ascontiguousarray(rgb, dtype=np.uint8).tobytes())
+
+    def close(self):
+        if self._proc is not None:
+            self._proc.stdin.close()
+            if self._proc.wait():
+                raise RuntimeError(f"ffmpeg failed writing {self.path}")
+            self._proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_animation(frames, path, fps=10):
+    """Stream RGB frames to a .gif (Pillow) or any ffmpeg format; returns the frame count."""
+    writer = GifStreamWriter(path, fps) if path.lower().endswith(".gif") \
+        else FFmpegStreamWriter(path, fps)
+    n = 0
+    with writer:
+        for frame in frames:
+            writer.write(frame)
+            n += 1
+    return n
@@ -0,0 +1,124 @@
+"""Batched RK4 for many SDOF bridge cases at once.
+
+Instead of looping over damping ratios (or Ω, k, ...) and running one
+pure-Python RK4 loop per case, the displacements and velocities of every
+case are advanced together as two n_cases vectors, one vectorized RK4
+step per time step.
+"""
+import numpy as np
+
+
+def broadcast_cases(*params):
+    """Broadcast scalars / arrays of per-case parameters to flat 1-D arrays."""
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(p, dtype=float))
+                                   for p in params])
+    return [a.ravel().copy() for a in arrays]
+
+
+def _uniform_step(t):
+    """Step of the sample times t, which must be 1-D and uniformly spaced."""
+    t = np.asarray(t, dtype=float)
+    if t.ndim != 1 or t.size < 2:
+        raise ValueError("t must be a 1-D array with at least two samples")
+    steps = np.diff(t)
+    h = steps[0]
+    if h <= 0 or np.max(np.abs(steps - h)) > 1e-6*h:
+        raise ValueError("t must be increasing and uniformly spaced")
+    return t, h
+
+
+def rk4_sdof_batch(m, k, zeta, F0, Omega, t, x0=0.0, v0=0.0,
+                   return_velocity=False):
+    """
+    Integrate m x'' + c x' + k x = F0 sin(Omega t) for many cases with RK4.
+
+    All of m, k, zeta, F0, Omega, x0, v0 may be scalars or arrays; they are
+    broadcast against each other and flattened to n_cases.  c is taken as
+    2*zeta*sqrt(k*m) like the scripts.  t must be uniformly spaced
+    (ValueError otherwise).
+
+    Returns x with shape (n_cases, len(t)) where x[:, i] is the displacement
+    at t[i] (and v of the same shape if return_velocity=True).
+    """
+    t, h = _uniform_step(t)
+    m, k, zeta, F0, Omega, x0, v0 = broadcast_cases(m, k, zeta, F0, Omega, x0, v0)
+
+    # Fold 1/m into the coefficients once: a = f*sin(Omega t) - cm*v - km*x
+    cm = 2*zeta*np.sqrt(k*m) / m
+    km = k / m
+    fm = F0 / m
+
+    n = m.size
+    x, v = x0, v0
+    xs = np.empty((n, t.size))
+    vs = np.empty((n, t.size)) if return_velocity else None
+
+    def accel(x, v, time):
+        return fm*np.sin(Omega*time) - cm*v - km*x
+
+    for i, ti in enumerate(t):
+        xs[:, i] = x
+        if vs is not None:
+            vs[:, i] = v
+        # k1..k4 for x are the stage velocities, for v the stage accelerations
+        a1 = accel(x, v, ti)
+        v2 = v + 0.5*h*a1
+        a2 = accel(x + 0.5*h*v, v2, ti + 0.5*h)
+        v3 = v + 0.5*h*a2
+        a3 = accel(x + 0.5*h*v2, v3, ti + 0.5*h)
+        v4 = v + h*a3
+        a4 = accel(x + h*v3, v4, ti + h)
+        x = x + (h/6)*(v + 2*v2 + 2*v3 + v4)
+        v = v + (h/6)*(a1 + 2*a2 + 2*a3 + a4)
+
+    if return_velocity:
+        return xs, vs
+    return xs
+
+
+def rk4_sdof_chunks(m, k, zeta, F0, Omega, dt, T, x0=0.0, v0=0.0,
+                    chunk_steps=65536):
+    """
+    The rk4_sdof_batch integration over t = 0, dt, ..., T, yielded in blocks
+    of at most chunk_steps samples as (t, x, v) with x, v of shape
+    (n_cases, len(t)), so histories of any length can be streamed to disk.
+    """
+    n_samples = int(round(T/dt)) + 1
+    start = 0
+    x, v = x0, v0
+    while start < n_samples:
+        n = min(chunk_steps, n_samples - start)
+        # one extra sample carries the state over into the next block
+        t = (start + np.arange(n + 1))*dt
+        xs, vs = rk4_sdof_batch(m, k, zeta, F0, Omega, t, x, v, return_velocity=True)
+        yield t[:n], xs[:, :n], vs[:, :n]
+        x, v = xs[:, n], vs[:, n]
+        start += n
+
+
+def rk4_linear_batch(A, b, Omega, t, y0=None):
+    """
+    RK4 for a stack of linear systems y' = A_s y + b_s sin(Omega t) at once,
+    e.g. one multi-DOF model per parameter set.  A has shape (S, N, N), b
+    (S, N) and y0 (S, N) (default rest).  Returns the states, shape
+    (S, len(t), N).
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    t, h = _uniform_step(t)
+    y = np.zeros(b.shape) if y0 is None else np.array(y0, dtype=float)
+    ys = np.empty((b.shape[0], t.size, b.shape[1]))
+    AT = np.swapaxes(A, 1, 2)
+
+    def deriv(y, time):
+        # batched (S, N) @ (S, N, N)^T as one einsum over the stack
+        return np.einsum("sj,sjk->sk", y, AT) + b*np.sin(Omega*time)
+
+    for i, ti in enumerate(t):
+        ys[:, i] = y
+        k1 = deriv(y, ti)
+        k2 = deriv(y + 0.5*h*k1, ti + 0.5*h)
+        k3 = deriv(y + 0.5*h*k2, ti + 0.5*h)
+        k4 = deriv(y + h*k3, ti + h)
+        y = y + (h/6)*(k1 + 2*k2 + 2*k3 + k4)
+    return ys
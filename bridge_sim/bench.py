@@ -0,0 +1,269 @@
+"""Accuracy / throughput benchmark of the SDOF integrators.
+
+Every integrator is run over a grid of time step dt, damping ratio zeta,
+frequency ratio Omega/omega_n and horizon T, and compared with the closed
+form (analytic.sdof_closed_form).  One record per (integrator, case):
+
+    wall_s, steps_per_s, n_fev, max_err, rms_err, rel_max_err
+
+where errors are in metres over the whole horizon and rel_max_err is
+max_err divided by the peak exact displacement.  The report is JSON (or
+CSV by extension) so two versions can be compared:
+
+    python -m bridge_sim.bench --out bench.json
+    python -m bridge_sim.bench --compare bench.json     # exit 1 on regression
+
+With --compare no report is written unless --out names one, and --out
+may not be the baseline itself.
+
+Batched integrators advance all zeta values of a grid point in one call;
+their wall time is split evenly over the cases (batch_size records how
+many shared the call).
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from .analytic import sdof_closed_form
+
+# bridge parameters used throughout the scripts
+M, K, F0 = 1000.0, 4e4, 1000.0
+
+DEFAULT_GRID = dict(dt=[0.01, 0.005], zeta=[0.0, 0.05, 0.5, 1.0, 2.0],
+                    ratio=[0.5, 1.0, 2.0], T=[20.0])
+
+INTEGRATORS = {}
+
+
+def integrator(name, batched=False):
+    """Register fn(zetas, Omega, t) -> (x of shape (len(zetas), len(t)), n_fev per case)."""
+    def register(fn):
+        INTEGRATORS[name] = (fn, batched)
+        return fn
+    return register
+
+
+@integrator("rk4_loop")
+def _rk4_loop(zetas, Omega, t):
+    """The per-case pure-Python RK4 loop the scripts originally used."""
+    (zeta,) = zetas
+    c = 2*zeta*np.sqrt(K*M)
+    h = t[1] - t[0]
+    n_fev = 0
+
+    def deriv(y, tt):
+        nonlocal n_fev
+        n_fev += 1
+        x, v = y
+        return np.array([v, (F0*np.sin(Omega*tt) - c*v - K*x)/M])
+
+    y = np.array([0.0, 0.0])
+    xs = np.empty(t.size)
+    for i, ti in enumerate(t):
+        xs[i] = y[0]
+        k1 = deriv(y, ti)
+        k2 = deriv(y + 0.5*h*k1, ti + 0.5*h)
+        k3 = deriv(y + 0.5*h*k2, ti + 0.5*h)
+        k4 = deriv(y + h*k3, ti + h)
+        y = y + (h/6)*(k1 + 2*k2 + 2*k3 + k4)
+    return xs[None, :], n_fev
+
+
+@integrator("rk4_sdof_batch", batched=True)
+def _rk4_batch(zetas, Omega, t):
+    from .batched import rk4_sdof_batch
+    return rk4_sdof_batch(M, K, zetas, F0, Omega, t), 4*t.size
+
+
+@integrator("MatrixRK4")
+def _matrix_rk4(zetas, Omega, t):
+    from .kernel import MatrixRK4
+    from .models import sdof_matrices
+    (zeta,) = zetas
+    rk4 = MatrixRK4(*sdof_matrices(M, 2*zeta*np.sqrt(K*M), K), load=F0, Omega=Omega)
+    sol = rk4.run(np.zeros(2), t[1] - t[0], t.size - 1)
+    return sol[:, 0][None, :], 4*(t.size - 1)
+
+
+@integrator("exact_propagator")
+def _exact(zetas, Omega, t):
+    from .exact import clear_cache, sdof_propagator
+    (zeta,) = zetas
+    clear_cache()       # time the matrix exponential too
+    prop = sdof_propagator(M, 2*zeta*np.sqrt(K*M), K, F0, Omega, t[1] - t[0])
+    return prop.run(np.zeros(2), t.size - 1)[:, 0][None, :], 0
+
+
+@integrator("dopri5")
+def _dopri5(zetas, Omega, t):
+    from .adaptive import dopri5
+    (zeta,) = zetas
+    c = 2*zeta*np.sqrt(K*M)
+
+    def deriv(y, tt):
+        return np.array([y[1], (F0*np.sin(Omega*tt) - c*y[1] - K*y[0])/M])
+
+    res = dopri5(deriv, [0.0, 0.0], (t[0], t[-1]), rtol=1e-8, atol=1e-10, t_eval=t)
+    return res.y[:, 0][None, :], res.n_fev
+
+
+def _grid_points(grid):
+    for T in grid["T"]:
+        for dt in grid["dt"]:
+            for ratio in grid["ratio"]:
+                yield T, dt, ratio
+
+
+def run_benchmarks(grid=None, integrators=None, repeat=1):
+    """List of result records (dicts) for every integrator and grid case."""
+    grid = dict(DEFAULT_GRID, **(grid or {}))
+    names = integrators or list(INTEGRATORS)
+    omega_n = np.sqrt(K/M)
+    zetas = np.asarray(grid["zeta"], dtype=float)
+    records = []
+    for T, dt, ratio in _grid_points(grid):
+        t = np.arange(int(round(T/dt)) + 1)*dt
+        Omega = ratio*omega_n
+        exact = sdof_closed_form(M, K, zetas, F0, Omega, t)
+        for name in names:
+            fn, batched = INTEGRATORS[name]
+            groups = [np.arange(zetas.size)] if batched else [[i] for i in range(zetas.size)]
+            fn(zetas[groups[0]], Omega, t[:8])      # warm-up: imports, caches
+            for idx in groups:
+                best = np.inf
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    x, n_fev = fn(zetas[idx], Omega, t)
+                    best = min(best, time.perf_counter() - start)
+                wall = best / len(idx)
+                for j, i in enumerate(idx):
+                    err = x[j] - exact[i]
+                    max_err = float(np.max(np.abs(err)))
+                    records.append(dict(
+                        integrator=name, dt=dt, zeta=float(zetas[i]), ratio=ratio, T=T,
+                        n_steps=t.size - 1, batch_size=len(idx),
+                        wall_s=wall, steps_per_s=(t.size - 1)/wall if wall > 0 else None,
+                        n_fev=int(n_fev), max_err=max_err,
+                        rms_err=float(np.sqrt(np.mean(err**2))),
+                        rel_max_err=max_err/max(float(np.max(np.abs(exact[i]))), 1e-300)))
+    return records
+
+
+def _environment():
+    env = dict(python=platform.python_version(), numpy=np.__version__,
+               machine=platform.machine(), system=platform.system(),
+               timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    try:
+        env["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        env["git_commit"] = None
+    return env
+
+
+def write_report(records, path, grid=None):
+    """Write the records as JSON (with environment and grid) or CSV."""
+    if path.endswith(".csv"):
+        import pandas as pd
+        pd.DataFrame(records).to_csv(path, index=False)
+        return path
+    report = dict(environment=_environment(), grid=dict(DEFAULT_GRID, **(grid or {})),
+                  results=records)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+    return path
+
+
+def _case_key(r):
+    return (r["integrator"], r["dt"], r["zeta"], r["ratio"], r["T"])
+
+
+def compare(baseline, records, time_tol=1.5, error_tol=1.1, error_floor=1e-12):
+    """
+    Regressions of records against a baseline list: cases whose wall time
+    grew by more than time_tol x, or whose max error grew by more than
+    error_tol x (ignoring errors below error_floor).  Returns messages.
+    """
+    base = {_case_key(r): r for r in baseline}
+    problems = []
+    for r in records:
+        b = base.get(_case_key(r))
+        if b is None:
+            continue
+        label = "{0} dt={1} zeta={2} ratio={3} T={4}".format(*_case_key(r))
+        if r["wall_s"] > time_tol*b["wall_s"]:
+            problems.append(f"slower  {label}: {b['wall_s']:.3g}s -> {r['wall_s']:.3g}s")
+        if r["max_err"] > max(error_tol*b["max_err"], error_floor):
+            problems.append(f"error   {label}: {b['max_err']:.3g} -> {r['max_err']:.3g}")
+    return problems
+
+
+def _floats(text):
+    return [float(v) for v in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bridge_sim.bench",
+        description="Benchmark the SDOF integrators against the closed-form solution.")
+    parser.add_argument("--out", default=None,
+                        help="report path (.json or .csv; default: bench.json, "
+                             "or none with --compare)")
+    parser.add_argument("--integrators", default=None,
+                        help="comma-separated subset of: " + ", ".join(INTEGRATORS))
+    for name in DEFAULT_GRID:
+        parser.add_argument("--" + name, type=_floats, default=None,
+                            help="comma-separated values (default: %s)"
+                                 % ",".join(map(str, DEFAULT_GRID[name])))
+    parser.add_argument("--repeat", type=int, default=1, help="best of N timings")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="JSON report to check for time/error regressions")
+    parser.add_argument("--time-tol", type=float, default=1.5)
+    parser.add_argument("--error-tol", type=float, default=1.1)
+    args = parser.parse_args(argv)
+
+    grid = {name: getattr(args, name) for name in DEFAULT_GRID
+            if getattr(args, name) is not None}
+    names = args.integrators.split(",") if args.integrators else None
+    unknown = set(names or ()) - set(INTEGRATORS)
+    if unknown:
+        raise SystemExit(f"unknown integrator(s): {', '.join(sorted(unknown))}")
+    out = args.out
+    if args.compare is None:
+        out = out or "bench.json"
+    elif out is not None and os.path.abspath(out) == os.path.abspath(args.compare):
+        raise SystemExit("--out would overwrite the --compare baseline")
+
+    records = run_benchmarks(grid, names, args.repeat)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    if out is not None:
+        write_report(records, out, grid)
+        print(f"{len(records)} runs -> {out}")
+    else:
+        print(f"{len(records)} runs")
+
+    for name in names or INTEGRATORS:
+        rows = [r for r in records if r["integrator"] == name]
+        if rows:
+            print(f"  {name:18s} {np.median([r['steps_per_s'] or 0 for r in rows]):12.4g} steps/s"
+                  f"   max err {max(r['max_err'] for r in rows):.3g} m")
+
+    if args.compare:
+        problems = compare(baseline, records, args.time_tol, args.error_tol)
+        for p in problems:
+            print(p, file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""Content-addressed on-disk cache of simulation results.
+
+A run is identified by the SHA-256 of its parameters (model type, m, k,
+c, zeta, F0, Omega, dt, T, initial conditions, integrator, ...), so any
+script asking for the same run loads the stored history instead of
+integrating again.  A function passed as a parameter (the integrator)
+is keyed by its source code, its default arguments, the values captured
+in its closure and, recursively, the source of the functions of the same
+package it calls by global name, so two closures from one factory or an
+edit to a helper give different keys.  Module constants and C code are
+not followed; pass a version string for those (integrator_version="2").
+Every key includes CACHE_VERSION, so entries computed by older code are
+not picked up after a change.  Entries are stored either as one
+compressed ``.npz`` or as a directory of plain ``.npy`` files that can
+be memory-mapped.
+The cache is bounded in size; the least recently used entries are
+evicted first (last use is tracked through the file mtime).
+
+    cache = ResultCache()
+    X = cache.cached(lambda: rk4_sdof_batch(m, k, zetas, F0, Omega, t),
+                     model="sdof", integrator=rk4_sdof_batch, m=m, k=k,
+                     zeta=zetas, F0=F0, Omega=Omega, dt=h, T=20, x0=0, v0=0)
+"""
+import functools
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+DEFAULT_DIR = os.environ.get("BRIDGE_SIM_CACHE", ".sim_cache")
+DEFAULT_MAX_BYTES = 512 * 2**20
+# bump when stored results change meaning (array layout, model conventions)
+# 2: a bare-array result is stored under _SINGLE instead of "result"
+CACHE_VERSION = 2
+# entry name marking a result that compute() returned as a bare array
+_SINGLE = "__single__"
+
+
+def _code_names(code):
+    """Global names used by a code object and the functions nested in it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+
+def _canonical_callable(func, seen):
+    """Digest of a function: source, defaults, closure and package helpers."""
+    if isinstance(func, functools.partial):
+        return b"p" + b",".join(_canonical(v, seen) for v in
+                                (func.func, func.args, func.keywords))
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    parts = [source.encode()]
+    if inspect.isfunction(func) and func not in seen:
+        seen = seen | {func}               # stops at recursive calls
+        parts += [_canonical(func.__defaults__, seen), _canonical(func.__kwdefaults__, seen)]
+        for cell in func.__closure__ or ():
+            try:
+                parts.append(_canonical(cell.cell_contents, seen))
+            except ValueError:             # cell not filled yet
+                parts.append(b"<empty>")
+        package = (func.__module__ or "").partition(".")[0]
+        for name in sorted(_code_names(func.__code__)):
+            ref = func.__globals__.get(name)
+            if inspect.isfunction(ref) and (ref.__module__ or "").partition(".")[0] == package:
+                parts.append(name.encode() + b"=" + _canonical(ref, seen))
+    return b"f" + hashlib.sha256(b"\0".join(parts)).digest()
+
+
+def _canonical(value, seen=frozenset()):
+    """Stable byte representation of a parameter value."""
+    if isinstance(value, dict):
+        return b"{" + b",".join(_canonical(k, seen) + b":" + _canonical(value[k], seen)
+                                for k in sorted(value)) + b"}"
+    if isinstance(value, (list, tuple, np.ndarray)):
+        try:
+            a = np.asarray(value)
+        except ValueError:                 # ragged, e.g. a tuple of defaults
+            a = None
+        if a is not None and a.dtype.kind in "iufcb":
+            a = np.ascontiguousarray(a, dtype=np.float64 if a.dtype.kind in "iub" else a.dtype)
+            return b"a" + str(a.shape).encode() + a.dtype.str.encode() + a.tobytes()
+        return b"[" + b",".join(_canonical(v, seen) for v in value) + b"]"
+    if isinstance(value, (bool, np.bool_)):
+        return repr(bool(value)).encode()
+    if callable(value):
+        return _canonical_callable(value, seen)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        # 1, 1.0 and np.float64(1) describe the same run
+        return repr(float(value)).encode()
+    return repr(value).encode()
+
+
+def make_key(**params):
+    """Hex digest identifying a run with the given parameters."""
+    return hashlib.sha256(_canonical(dict(params, cache_version=CACHE_VERSION))).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded LRU store of result arrays keyed by make_key().
+
+    fmt="npz"  compressed single file per entry (smallest on disk)
+    fmt="npy"  one .npy per array, loaded memory-mapped (fastest to open)
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES, fmt="npz"):
+        if fmt not in ("npz", "npy"):
+            raise ValueError("fmt must be 'npz' or 'npy'")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + (".npz" if self.fmt == "npz" else ""))
+
+    def get(self, key):
+        """Stored arrays (dict) for key, or None on a miss."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        os.utime(path)                     # mark as recently used
+        if self.fmt == "npz":
+            with np.load(path) as data:
+                return {name: data[name] for name in data.files}
+        return {name[:-4]: np.load(os.path.join(path, name), mmap_mode="r")
+                for name in sorted(os.listdir(path)) if name.endswith(".npy")}
+
+    def put(self, key, arrays):
+        """Store a dict of arrays under key, then evict down to max_bytes."""
+        tmp = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        try:
+            if self.fmt == "npz":
+                staged = os.path.join(tmp, "entry.npz")
+                np.savez_compressed(staged, **arrays)
+            else:
+                staged = os.path.join(tmp, "entry")
+                os.mkdir(staged)
+                for name, a in arrays.items():
+                    np.save(os.path.join(staged, name + ".npy"), np.asarray(a))
+            path = self._path(key)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            os.replace(staged, path)       # atomic publish
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict()
+
+    def cached(self, compute, **params):
+        """
+        Result of compute() for these params, loaded from the cache when
+        present.  compute returns an array or a dict of arrays; the same
+        kind is returned on a hit as on a miss.
+        """
+        key = make_key(**params)
+        hit = self.get(key)
+        if hit is not None:
+            return hit[_SINGLE] if set(hit) == {_SINGLE} else hit
+        result = compute()
+        if isinstance(result, dict):
+            if _SINGLE in result:
+                raise ValueError(f"{_SINGLE!r} is reserved and cannot be a result name")
+            self.put(key, result)
+        else:
+            self.put(key, {_SINGLE: result})
+        return result
+
+    def _entries(self):
+        """(mtime, size, path) of every stored entry."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith(".tmp-"):
+                continue
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path):
+                size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            else:
+                size = os.path.getsize(path)
+            entries.append((os.path.getmtime(path), size, path))
+        return entries
+
+    def size(self):
+        """Total bytes currently stored."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove every entry."""
+        for _, _, path in self._entries():
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
@@ -0,0 +1,69 @@
+"""Headless batch entry point: regenerate figures, tables and pages by name.
+
+    python -m bridge_sim                          # everything
+    python -m bridge_sim Time_history.png steady_state_error.csv
+    python -m bridge_sim "*.html" --out site/
+    python -m bridge_sim --list
+
+All targets are built in one process, so simulations shared by several
+artifacts run once; --cache additionally keeps SDOF runs on disk across
+invocations.  Nothing is shown on screen and nothing blocks.
+"""
+import argparse
+import fnmatch
+import sys
+import time
+
+from .targets import TARGETS, Session, build
+
+
+def select(patterns):
+    """Target names matching any of the given names or glob patterns, in registry order."""
+    if not patterns:
+        return list(TARGETS)
+    chosen = []
+    for pattern in patterns:
+        matches = [name for name in TARGETS if fnmatch.fnmatchcase(name, pattern)]
+        if not matches:
+            raise SystemExit(f"unknown target {pattern!r} (see --list)")
+        chosen.extend(name for name in matches if name not in chosen)
+    return chosen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bridge_sim",
+        description="Regenerate the project's figures, tables and HTML pages.")
+    parser.add_argument("targets", nargs="*",
+                        help="artifact names or glob patterns (default: all)")
+    parser.add_argument("--out", default=".", help="output directory (default: .)")
+    parser.add_argument("--list", action="store_true", help="list the available targets")
+    parser.add_argument("--cache", nargs="?", const=".sim_cache", default=None,
+                        metavar="DIR", help="reuse SDOF runs from an on-disk result cache")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(TARGETS))
+        return 0
+
+    cache = None
+    if args.cache:
+        from .cache import ResultCache
+        cache = ResultCache(args.cache)
+    session = Session(args.out, cache=cache)
+
+    failed = []
+    for name in select(args.targets):
+        start = time.perf_counter()
+        try:
+            build(name, session)
+        except Exception as exc:      # keep going, report at the end
+            failed.append(name)
+            print(f"FAILED  {name}: {exc}", file=sys.stderr)
+            continue
+        print(f"{time.perf_counter() - start:7.2f}s  {session.path(name)}")
+
+    if failed:
+        print(f"{len(failed)} target(s) failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,168 @@
+"""Chunked columnar storage for long time histories.
+
+Instead of growing Python lists and writing one big CSV/XLSX at the end,
+ChunkedColumnWriter buffers each column (time, displacement, velocity,
+error, ...) in a fixed-size array and flushes full chunks to disk as the
+integration proceeds:
+
+    <directory>/manifest.json          column names, dtype, rows per chunk
+    <directory>/<column>.000000.npy    one plain .npy per column and chunk
+
+Memory use is bounded by one chunk regardless of run length, and the
+.npy chunks are memory-mapped when read back.  Spreadsheet export is an
+optional last step over a bounded row range (export_table).
+"""
+import json
+import os
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+XLSX_MAX_ROWS = 1048575        # Excel sheet limit minus the header row
+
+
+class ChunkedColumnWriter:
+    """Stream rows or blocks of named columns to fixed-size .npy chunks."""
+
+    def __init__(self, directory, columns, chunk_rows=65536, dtype="float64"):
+        self.directory = directory
+        self.columns = list(columns)
+        self.chunk_rows = int(chunk_rows)
+        self.dtype = np.dtype(dtype)
+        self._buf = {c: np.empty(self.chunk_rows, self.dtype) for c in self.columns}
+        self._fill = 0
+        self._chunks = []           # rows per flushed chunk
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def n_rows(self):
+        return sum(self._chunks) + self._fill
+
+    def append(self, **row):
+        """Add one row, e.g. append(time=t, x=x, v=v)."""
+        for c in self.columns:
+            self._buf[c][self._fill] = row[c]
+        self._fill += 1
+        if self._fill == self.chunk_rows:
+            self.flush()
+
+    def extend(self, **block):
+        """Add equally long 1-D arrays, one per column."""
+        block = {c: np.asarray(block[c]) for c in self.columns}
+        n = len(block[self.columns[0]])
+        pos = 0
+        while pos < n:
+            take = min(self.chunk_rows - self._fill, n - pos)
+            for c in self.columns:
+                self._buf[c][self._fill:self._fill + take] = block[c][pos:pos + take]
+            self._fill += take
+            pos += take
+            if self._fill == self.chunk_rows:
+                self.flush()
+
+    def flush(self):
+        """Write the buffered rows as a new chunk and update the manifest."""
+        if self._fill == 0:
+            return
+        index = len(self._chunks)
+        for c in self.columns:
+            np.save(os.path.join(self.directory, f"{c}.{index:06d}.npy"),
+                    self._buf[c][:self._fill])
+        self._chunks.append(self._fill)
+        self._fill = 0
+        self._write_manifest()
+
+    def _write_manifest(self):
+        manifest = {"columns": self.columns, "dtype": self.dtype.str,
+                    "chunks": self._chunks}
+        tmp = os.path.join(self.directory, MANIFEST + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(self.directory, MANIFEST))
+
+    def close(self):
+        self.flush()
+        self._write_manifest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ColumnStore:
+    """Read access to a directory written by ChunkedColumnWriter."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST)) as f:
+            manifest = json.load(f)
+        self.columns = manifest["columns"]
+        self.chunk_sizes = manifest["chunks"]
+        self._offsets = np.concatenate([[0], np.cumsum(self.chunk_sizes)]).astype(int)
+
+    @property
+    def n_rows(self):
+        return int(self._offsets[-1])
+
+    def _chunk(self, column, index):
+        return np.load(os.path.join(self.directory, f"{column}.{index:06d}.npy"),
+                       mmap_mode="r")
+
+    def chunks(self, columns=None):
+        """Yield one dict of memory-mapped column arrays per chunk."""
+        for i in range(len(self.chunk_sizes)):
+            yield {c: self._chunk(c, i) for c in (columns or self.columns)}
+
+    def read(self, column, start=0, stop=None):
+        """Rows [start, stop) of one column as an in-memory array."""
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        parts = []
+        first = max(np.searchsorted(self._offsets, start, side="right") - 1, 0)
+        for i in range(first, len(self.chunk_sizes)):
+            lo, hi = self._offsets[i], self._offsets[i + 1]
+            if lo >= stop:
+                break
+            parts.append(self._chunk(column, i)[max(start - lo, 0):min(stop, hi) - lo])
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def row_range(self, t_start, t_stop=np.inf, time_column="time"):
+        """(start, stop) row indices with t_start <= time < t_stop (time ascending)."""
+        start = stop = None
+        for i, chunk in enumerate(self.chunks([time_column])):
+            t = chunk[time_column]
+            if start is None and t[-1] >= t_start:
+                start = self._offsets[i] + np.searchsorted(t, t_start)
+            if t[-1] >= t_stop:
+                stop = self._offsets[i] + np.searchsorted(t, t_stop)
+                break
+        start = self.n_rows if start is None else int(start)
+        stop = self.n_rows if stop is None else int(stop)
+        return start, stop
+
+    def frame(self, start=0, stop=None, columns=None):
+        """pandas DataFrame of rows [start, stop)."""
+        import pandas as pd
+        return pd.DataFrame({c: self.read(c, start, stop) for c in (columns or self.columns)})
+
+
+def export_table(store, path, start=0, stop=None, columns=None, rename=None,
+                 max_rows=XLSX_MAX_ROWS):
+    """
+    Write rows [start, stop) of a ColumnStore to .csv or .xlsx (by
+    extension).  The slice must not exceed max_rows, so a spreadsheet is
+    never built from a whole multi-hour record by accident.
+    """
+    stop = store.n_rows if stop is None else min(stop, store.n_rows)
+    if stop - start > max_rows:
+        raise ValueError(f"{stop - start} rows requested, limit is {max_rows}; "
+                         "export a smaller slice")
+    df = store.frame(start, stop, columns)
+    if rename:
+        df = df.rename(columns=rename)
+    if path.endswith(".xlsx"):
+        df.to_excel(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+    return path
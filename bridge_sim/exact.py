@@ -0,0 +1,161 @@
+"""Exact discrete-time propagators for the linear bridge models.
+
+Every model in the project is linear and time-invariant, y' = A y + B u(t).
+Over one step of length dt the solution is
+
+    y(t+dt) = Phi y(t) + (input terms),   Phi = expm(A dt)
+
+so once Phi and the input matrices are known, each step is a single
+matrix-vector product with no truncation error:
+
+* ExactPropagator    -- u(t) linear between samples (first-order hold),
+                        exact for piecewise-linear loads.
+* HarmonicPropagator -- u(t) = b sin(Omega t), exact for sinusoidal wind.
+
+The matrices are built with one augmented matrix exponential (Van Loan)
+and cached per (system, dt, Omega).
+"""
+import numpy as np
+from scipy.linalg import expm
+
+from .models import four_mass_matrices, sdof_matrices, state_space
+from .recorders import run_recorded
+
+_CACHE = {}
+
+
+def _key(*arrays_and_scalars):
+    key = []
+    for a in arrays_and_scalars:
+        if isinstance(a, np.ndarray):
+            key.append((a.shape, a.tobytes()))
+        else:
+            key.append(a)
+    return tuple(key)
+
+
+def _foh_matrices(A, B, dt):
+    key = _key("foh", A, B, float(dt))
+    if key not in _CACHE:
+        n, p = B.shape
+        # z = [y, u, du/dt]:  y' = A y + B u,  u' = du/dt,  (du/dt)' = 0
+        Z = np.zeros((n + 2*p, n + 2*p))
+        Z[:n, :n] = A
+        Z[:n, n:n+p] = B
+        Z[n:n+p, n+p:] = np.eye(p)
+        E = expm(Z*dt)
+        Phi, G1, G2 = E[:n, :n], E[:n, n:n+p], E[:n, n+p:]
+        # y_{k+1} = Phi y_k + G1 u_k + G2 (u_{k+1} - u_k)/dt
+        _CACHE[key] = (Phi, G1 - G2/dt, G2/dt)
+    return _CACHE[key]
+
+
+def _harmonic_matrices(A, b, dt, Omega):
+    key = _key("harm", A, b, float(dt), float(Omega))
+    if key not in _CACHE:
+        n = A.shape[0]
+        # z = [y, sin(Omega t), cos(Omega t)]
+        Z = np.zeros((n + 2, n + 2))
+        Z[:n, :n] = A
+        Z[:n, n] = b
+        Z[n, n+1] = Omega
+        Z[n+1, n] = -Omega
+        E = expm(Z*dt)
+        _CACHE[key] = (E[:n, :n], E[:n, n:])
+    return _CACHE[key]
+
+
+class ExactPropagator:
+    """
+    Step y' = A y + B u(t) exactly for inputs u that vary linearly between
+    samples.  B has one column per input channel.
+    """
+
+    def __init__(self, A, B, dt):
+        self.A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        self.B = B.reshape(len(B), -1)  # a 1-D B is a single input channel
+        self.dt = float(dt)
+        self.Phi, self.Bd0, self.Bd1 = _foh_matrices(self.A, self.B, self.dt)
+
+    def step(self, y, u0, u1):
+        """State after one step, given the input at the start and end."""
+        return self.Phi @ y + self.Bd0 @ np.atleast_1d(u0) + self.Bd1 @ np.atleast_1d(u1)
+
+    def run(self, y0, u, recorders=None):
+        """
+        Propagate from y0 through input samples u (shape (n_steps+1, p) or
+        (n_steps+1,) for a single channel).  Returns the (n_steps+1, n)
+        state history with y0 in the first row, or with recorders the
+        final state (the recorders see every state, starting at t = 0).
+        """
+        u = np.asarray(u, dtype=float).reshape(len(u), -1)
+        # input contribution of every step, computed in bulk
+        g = u[:-1] @ self.Bd0.T + u[1:] @ self.Bd1.T
+        if recorders is not None:
+            rows = iter(g)
+            return run_recorded(lambda y, t: self.Phi @ y + next(rows), y0,
+                                self.dt, len(g), recorders)
+        return _recurse(self.Phi, g, y0)
+
+
+class HarmonicPropagator:
+    """
+    Step y' = A y + b sin(Omega t) exactly.  b is the state-space input
+    vector with the forcing amplitude already folded in (e.g. B @ F0_vector).
+    """
+
+    def __init__(self, A, b, dt, Omega):
+        self.A = np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float).ravel()
+        self.dt = float(dt)
+        self.Omega = float(Omega)
+        self.Phi, self.Gs = _harmonic_matrices(self.A, self.b, self.dt, self.Omega)
+
+    def step(self, y, t):
+        """State at t+dt from the state y at time t."""
+        return self.Phi @ y + self.Gs @ np.array([np.sin(self.Omega*t),
+                                                  np.cos(self.Omega*t)])
+
+    def run(self, y0, n_steps, t0=0.0, recorders=None):
+        """
+        (n_steps+1, n) state history on t0, t0+dt, ..., y0 in the first row,
+        or with recorders the final state (the history goes to them instead).
+        """
+        if recorders is not None:
+            return run_recorded(self.step, y0, self.dt, n_steps, recorders, t0)
+        tk = t0 + self.dt*np.arange(n_steps)
+        S = np.column_stack([np.sin(self.Omega*tk), np.cos(self.Omega*tk)])
+        return _recurse(self.Phi, S @ self.Gs.T, y0)
+
+
+def _recurse(Phi, g, y0):
+    """y_{k+1} = Phi y_k + g_k for every row of g."""
+    n_steps = g.shape[0]
+    ys = np.empty((n_steps + 1, Phi.shape[0]))
+    ys[0] = y0
+    PhiT = Phi.T
+    for i in range(n_steps):
+        ys[i+1] = ys[i] @ PhiT + g[i]
+    return ys
+
+
+def sdof_propagator(m, c, k, F0, Omega, dt):
+    """HarmonicPropagator for m x'' + c x' + k x = F0 sin(Omega t), state [x, v]."""
+    A, B = state_space(*sdof_matrices(m, c, k))
+    return HarmonicPropagator(A, B[:, 0]*F0, dt, Omega)
+
+
+def four_mass_propagator(m, k0, c0, kc, cc, load, Omega, dt):
+    """
+    HarmonicPropagator for the 4-corner deck under load*sin(Omega t), where
+    load holds the force amplitude on each corner, e.g. [F0, 0, F0, 0] for
+    wind on the left column only.  State is [x1..x4, v1..v4].
+    """
+    A, B = state_space(*four_mass_matrices(m, k0, c0, kc, cc))
+    return HarmonicPropagator(A, B @ np.asarray(load, dtype=float), dt, Omega)
+
+
+def clear_cache():
+    """Drop all cached transition matrices."""
+    _CACHE.clear()
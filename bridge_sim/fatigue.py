@@ -0,0 +1,254 @@
+"""Streaming rainflow cycle counting and Miner's-rule fatigue damage.
+
+The steady-state amplitude only tells half of the fatigue story: damage
+comes from every load cycle, large and small.  RainflowCounter counts
+the cycles of one or many histories chunk by chunk, as the integrators
+produce them, with the 4-point rule:
+
+    for four consecutive reversals A, B, C, D, the range B-C is a closed
+    cycle if |B - C| <= |A - B| and |B - C| <= |C - D|; B and C are removed.
+
+Turning points of each chunk are found with array operations; only the
+reversals (far fewer than samples) go through the stack, and what stays
+open between chunks is the small residue of unclosed reversals.  At the
+end the residue is counted as half cycles (the ASTM E1049 convention).
+Closed cycles go into a range histogram of fixed bin width and, with a
+MinerDamage accumulator, into Palmgren-Miner damage using exact ranges:
+
+    miner = MinerDamage(SNCurve(71.0), scale=stress_per_metre, n_channels=4)
+    counter = RainflowCounter(n_channels=4, bin_width=1e-3, miner=miner)
+    for t, x, v in rk4_sdof_chunks(m, k, zetas, F0, Omega, dt, T):
+        counter.feed(x)
+    counter.finish()
+    edges, counts = counter.histogram()
+    miner.damage                              # per channel
+
+Memory depends on the number of channels and histogram bins, not on the
+length of the history.
+"""
+import numpy as np
+
+
+def turning_points(x):
+    """
+    Indices of the reversals of a 1-D signal: both end points and every
+    local extremum (a plateau counts once, at its first sample).
+    """
+    x = np.asarray(x, dtype=float)
+    if x.size < 2:
+        return np.arange(x.size)
+    moving = np.flatnonzero(np.diff(x)) + 1          # samples that differ from the previous
+    if not moving.size:
+        return np.array([0])
+    d = np.sign(x[moving] - x[moving - 1])
+    # a sample where the signal arrives and then turns back is an extremum
+    turn = moving[:-1][d[1:] != d[:-1]]
+    return np.concatenate([[0], turn, [x.size - 1]])
+
+
+class SNCurve:
+    """
+    S-N curve in the EN 1993-1-9 form, in stress-range units (e.g. MPa).
+
+    N = n_c (delta_c / S)^m1 down to the constant-amplitude limit at n_d
+    cycles, N = n_d (delta_d / S)^m2 below it, and infinite life under the
+    cut-off at n_l cycles.  n_d=None gives a single slope m1 throughout;
+    n_l=None removes the cut-off.
+    """
+
+    def __init__(self, delta_c, m1=3.0, m2=5.0, n_c=2e6, n_d=5e6, n_l=1e8):
+        self.delta_c = float(delta_c)
+        self.m1, self.m2 = float(m1), float(m2)
+        self.n_c = float(n_c)
+        self.n_d = n_d
+        self.n_l = n_l
+        if n_d is None:
+            self.delta_d = 0.0
+            self.delta_l = 0.0 if n_l is None else self.delta_c*(n_c/n_l)**(1/m1)
+        else:
+            self.delta_d = self.delta_c*(n_c/n_d)**(1/m1)
+            self.delta_l = 0.0 if n_l is None else self.delta_d*(n_d/n_l)**(1/m2)
+
+    def cycles(self, S):
+        """Cycles to failure at stress ranges S (inf below the cut-off)."""
+        S = np.asarray(S, dtype=float)
+        with np.errstate(divide="ignore"):
+            N = np.where(S >= self.delta_d, self.n_c*(self.delta_c/S)**self.m1,
+                         (self.n_d or 0.0)*(self.delta_d/S)**self.m2)
+        return np.where(S > self.delta_l, N, np.inf)
+
+
+class MinerDamage:
+    """
+    Palmgren-Miner damage sum D = sum n_i / N(S_i) per channel, with stress
+    range S = scale * (counted range), e.g. scale = stress per metre of
+    deflection.  Fed by RainflowCounter.
+    """
+
+    def __init__(self, sn_curve, scale=1.0, n_channels=1):
+        self.sn_curve = sn_curve
+        self.scale = scale
+        self.damage = np.zeros(n_channels)
+
+    def add(self, channels, ranges, counts):
+        if len(ranges):
+            S = np.abs(self.scale*np.asarray(ranges))
+            np.add.at(self.damage, channels, counts/self.sn_curve.cycles(S))
+
+    def life(self, duration):
+        """Time to failure (D = 1) if the counted duration repeats indefinitely."""
+        with np.errstate(divide="ignore"):
+            return np.where(self.damage > 0, duration/self.damage, np.inf)
+
+
+class RainflowCounter:
+    """
+    Incremental rainflow counter for n_channels histories fed in chunks of
+    shape (n_channels, n_samples) -- the layout of rk4_sdof_batch and
+    rk4_sdof_chunks -- or (n_samples,) for a single channel.
+
+    Counted cycles go into a histogram of ranges with bins of bin_width
+    (grown as larger ranges appear) and to miner, a MinerDamage, if given.
+    """
+
+    def __init__(self, n_channels=1, bin_width=None, miner=None):
+        self.n_channels = n_channels
+        self.bin_width = bin_width
+        self.miner = miner
+        self.counts = np.zeros((n_channels, 0))
+        self.n_cycles = np.zeros(n_channels)
+        self._stacks = [[] for _ in range(n_channels)]
+        self._dir = np.zeros(n_channels)
+
+    def feed(self, x):
+        """
+        Count the cycles closed by the next chunk of samples.  Returns the
+        closed cycles as (channels, ranges, means) arrays.
+        """
+        x = np.asarray(x, dtype=float)
+        x = x.reshape(1, -1) if x.ndim == 1 else x
+        if x.shape[0] != self.n_channels:
+            raise ValueError(f"expected {self.n_channels} channels, got {x.shape[0]}")
+        channels, ranges, means = [], [], []
+        for c, v in enumerate(x):
+            stack = self._stacks[c]
+            if not stack:
+                if not v.size:
+                    continue
+                stack.append(v[0])
+            d = np.sign(np.diff(v, prepend=stack[-1]))
+            moving = d != 0
+            v, d = v[moving], d[moving]
+            if not v.size:
+                continue
+            if d[0] == self._dir[c]:
+                stack.pop()              # the open end point keeps going the same way
+            self._dir[c] = d[-1]
+            reversals = np.append(v[:-1][d[1:] != d[:-1]], v[-1])
+            r, m = _push(stack, reversals.tolist())
+            channels.extend([c]*len(r))
+            ranges.extend(r)
+            means.extend(m)
+        cycles = (np.array(channels, dtype=int), np.array(ranges), np.array(means))
+        self._count(*cycles[:2], 1.0)
+        return cycles
+
+    def finish(self):
+        """
+        Count the residue of every channel as half cycles and reset the
+        stacks.  Returns the half cycles as (channels, ranges, means).
+        """
+        channels, ranges, means = [], [], []
+        for c, stack in enumerate(self._stacks):
+            s = np.array(stack)
+            channels.extend([c]*max(s.size - 1, 0))
+            ranges.extend(np.abs(np.diff(s)))
+            means.extend(0.5*(s[1:] + s[:-1]))
+            stack.clear()
+        self._dir[:] = 0
+        cycles = (np.array(channels, dtype=int), np.array(ranges), np.array(means))
+        self._count(*cycles[:2], 0.5)
+        return cycles
+
+    def _count(self, channels, ranges, weight):
+        if not ranges.size:
+            return
+        np.add.at(self.n_cycles, channels, weight)
+        if self.miner is not None:
+            self.miner.add(channels, ranges, weight)
+        if self.bin_width:
+            idx = (ranges/self.bin_width).astype(int)
+            if idx.max() >= self.counts.shape[1]:
+                grow = idx.max() + 1 - self.counts.shape[1]
+                self.counts = np.pad(self.counts, ((0, 0), (0, grow)))
+            np.add.at(self.counts, (channels, idx), weight)
+
+    def histogram(self):
+        """(bin edges, counts of shape (n_channels, n_bins)) of the counted ranges."""
+        if not self.bin_width:
+            raise ValueError("the counter was created without a bin_width")
+        return np.arange(self.counts.shape[1] + 1)*self.bin_width, self.counts
+
+
+def _push(stack, reversals):
+    """Push reversals onto a channel's stack, closing cycles by the 4-point rule."""
+    ranges, means = [], []
+    for p in reversals:
+        stack.append(p)
+        while len(stack) >= 4:
+            b, c = stack[-3], stack[-2]
+            r = abs(b - c)
+            if r <= abs(stack[-4] - b) and r <= abs(c - stack[-1]):
+                ranges.append(r)
+                means.append(0.5*(b + c))
+                del stack[-3:-1]
+            else:
+                break
+    return ranges, means
+
+
+def rainflow(x, bin_width=None):
+    """
+    Rainflow count of complete histories x (shape (n_samples,) or
+    (n_channels, n_samples)) in one call; returns the finished
+    RainflowCounter.
+    """
+    x = np.asarray(x, dtype=float)
+    counter = RainflowCounter(1 if x.ndim == 1 else x.shape[0], bin_width)
+    counter.feed(x)
+    counter.finish()
+    return counter
+
+
+class RainflowRecorder:
+    """
+    Recorder (see recorders.py) that rainflow-counts y[dofs] on the fly,
+    buffering chunk steps at a time; samples before t_start are skipped.
+    The counter and its histogram are available after the run.
+    """
+
+    def __init__(self, dofs=None, bin_width=None, miner=None, t_start=-np.inf,
+                 chunk=4096):
+        self.dofs = dofs
+        self.bin_width = bin_width
+        self.miner = miner
+        self.t_start = t_start
+        self.chunk = chunk
+
+    def start(self, t0, dt, n_steps, size):
+        self._idx = slice(None) if self.dofs is None else np.atleast_1d(self.dofs)
+        width = len(range(size)[self._idx]) if self.dofs is None else self._idx.size
+        self.counter = RainflowCounter(width, self.bin_width, self.miner)
+        self._buf = np.empty((width, self.chunk))
+        self._fill = 0
+        self._last = n_steps
+
+    def record(self, i, t, y):
+        if t >= self.t_start:
+            self._buf[:, self._fill] = y[self._idx]
+            self._fill += 1
+        if self._fill == self.chunk or i == self._last:
+            self.counter.feed(self._buf[:, :self._fill])
+            self._fill = 0
+            if i == self._last:
+                self.counter.finish()
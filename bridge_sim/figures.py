@@ -0,0 +1,426 @@
+"""Figures and tables of the project, shared by the root scripts and targets.
+
+Every builder takes the simulated data and returns the finished figure
+(or table); it neither shows nor saves it.  A root script calls it and
+then plt.show() / savefig as it always did, and the matching build target
+in targets.py calls the same function and writes the file, so the two
+cannot drift apart.  matplotlib, plotly and pandas are imported inside
+the builders; callers pick the matplotlib backend before calling.
+
+    t, results = ...                         # {zeta: x(t)}
+    fig = time_history_figure(t, results)
+"""
+import numpy as np
+
+from .refine import refine_axis
+
+
+def _pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# === 3_scenarios_oscillation.py / SetUp_table.py ===
+
+def time_history_figure(t, results):
+    """x(t) over the whole run for each damping ratio in results {zeta: x}."""
+    plt = _pyplot()
+    fig = plt.figure()
+    for z, x in results.items():
+        plt.plot(t, x, label=f'zeta={z}')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Displacement x (m)')
+    plt.legend()
+    plt.title('Time-History for Different Damping Ratios')
+    return fig
+
+
+def steady_state_figure(t, results, t_start=10.0):
+    """The same histories from t_start on (the steady-state part)."""
+    plt = _pyplot()
+    mask = t >= t_start
+    fig = plt.figure()
+    for z, x in results.items():
+        plt.plot(t[mask], x[mask], label=f'zeta={z}')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Displacement x (m)')
+    plt.legend()
+    plt.title(f'Steady-State (t ≥ {t_start:g} s) for Different Damping Ratios')
+    return fig
+
+
+def log_decay_figure(t, results):
+    """|x(t)| on a log scale, comparing the displacement envelopes."""
+    plt = _pyplot()
+    fig = plt.figure()
+    for z, x in results.items():
+        plt.semilogy(t, np.abs(x), label=f'zeta={z}')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Absolute Displacement |x| (m)')
+    plt.legend()
+    plt.title('Logarithmic Decay of Displacement Envelope')
+    return fig
+
+
+def sample_table(t, results, times, absolute=False):
+    """pandas table of x (or |x| if absolute) at the given times, one column per zeta."""
+    import pandas as pd
+    indices = [np.searchsorted(t, time) for time in times]
+    data = {'Time (s)': times}
+    for z, x in results.items():
+        data[f'zeta={z}'] = np.abs(x[indices]) if absolute else x[indices]
+    return pd.DataFrame(data)
+
+
+# === Build_Data_Table.py / Error vs Time plot.py ===
+
+def bridge_response_figure(t, x, x_exact, static):
+    """RK4 and analytical x(t) with the static deflection F0/k."""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(14, 6))
+    ax.plot(t, x,       label="RK4 Numerical", linewidth=2)
+    ax.plot(t, x_exact, '--', label="Analytical",  linewidth=2)
+    ax.axhline(static, color='gray', linestyle='--', label='$F_0/k$')
+    ax.set(xlabel="Time (s)", ylabel="Displacement $x(t)$ [m]",
+           title="Bridge Response Under Harmonic Wind Load")
+    ax.legend(); ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+def error_table_figure(frame, n_rows=20):
+    """The first n_rows of the steady-state error table drawn as an image."""
+    plt = _pyplot()
+    table_df = frame.head(n_rows).copy()
+    table_df["Time (s)"]           = table_df["Time (s)"].map(lambda x: f"{x:.2f}")
+    table_df["X_exact (m)"]        = table_df["X_exact (m)"].map(lambda x: f"{x:.6f}")
+    table_df["X_predicted (m)"]    = table_df["X_predicted (m)"].map(lambda x: f"{x:.6f}")
+    table_df["Absolute Error (m)"] = table_df["Absolute Error (m)"].map(lambda x: f"{x:.8f}")
+    table_df["Relative Error (%)"] = table_df["Relative Error (%)"].map(lambda x: f"{x:.6f}")
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.axis("off")
+    tbl = ax.table(cellText=table_df.values, colLabels=table_df.columns, loc="center")
+    tbl.auto_set_font_size(False)
+    tbl.set_fontsize(10)
+    tbl.scale(1, 1.5)
+    # carve out a bottom margin and centre the title in it
+    bottom_margin = 0.15
+    fig.subplots_adjust(bottom=bottom_margin)
+    fig.text(0.5, bottom_margin / 2, f"Table: Steady‑State Error (First {n_rows} Rows)",
+             ha="center", va="center", fontsize=12)
+    return fig
+
+
+def error_vs_time_figure(frame):
+    """Absolute (left axis) and relative (right axis) error of the error table."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 5))
+    ax1 = plt.gca()
+    ax1.plot(frame["Time (s)"], frame["Absolute Error (m)"],
+             color="tab:blue", lw=2, label="Absolute Error (m)")
+    ax1.set_ylabel("Absolute Error (m)", color="tab:blue")
+    ax1.tick_params(axis="y", labelcolor="tab:blue")
+    ax2 = ax1.twinx()
+    ax2.plot(frame["Time (s)"], frame["Relative Error (%)"],
+             color="tab:red", lw=2, label="Relative Error (%)")
+    ax2.set_ylabel("Relative Error (%)", color="tab:red")
+    ax2.tick_params(axis="y", labelcolor="tab:red")
+    plt.title("Error vs. Time in Steady-State Region (t ≥ 10 s)")
+    ax1.set_xlabel("Time (s)")
+    ax1.grid(which="both", ls="--", alpha=0.5)
+    fig.tight_layout()
+    return fig
+
+
+# === Time_History_of_Displacement(2D Plot).py ===
+
+def displacement_over_time_figure(t, x, x_exact, static):
+    """RK4 and analytical x(t) at resonance with the static deflection."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(t, x,       label="Numerical Solution (RK4)",      lw=2)
+    plt.plot(t, x_exact, '--', label="Analytical Solution",            lw=2)
+    plt.axhline(static, color='gray', ls='--', label='Static Deflection F₀/k')
+    plt.xlabel("Time (s)")
+    plt.ylabel("Displacement x(t) [m]")
+    plt.title("Bridge Displacement Over Time")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    return fig
+
+
+# === Bode_Plot_of_System Response(2D Plot).py / frequency_Response(2D Plot).py ===
+
+def bode_figure(w, mag, phase, res):
+    """Magnitude (dB) and phase (deg) over w, with the peaks of res (frf.Resonances)."""
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), sharex=True)
+    ax1.semilogx(w, mag, 'b', lw=2)
+    for w_p, X_p, Q in zip(res.omega, res.amplitude, res.Q):
+        ax1.plot(w_p, 20*np.log10(X_p), 'ko')
+        ax1.annotate(f'ω = {w_p:.3f} rad/s, Q = {Q:.1f}', (w_p, 20*np.log10(X_p)),
+                     textcoords='offset points', xytext=(10, 0))
+    ax1.set_ylabel('Magnitude (dB)')
+    ax1.set_title('Bode Plot of Bridge SDOF Transfer Function')
+    ax1.grid(True, which='both', ls='--', alpha=0.5)
+    ax2.semilogx(w, phase, 'r', lw=2)
+    ax2.set_xlabel('Frequency (rad/s)')
+    ax2.set_ylabel('Phase (deg)')
+    ax2.grid(True, which='both', ls='--', alpha=0.5)
+    fig.tight_layout()
+    return fig
+
+
+def frequency_response_figure(frequencies, amplitudes, res, zeta):
+    """Steady-state amplitude over frequency with the peak and half-power band of res."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(frequencies, amplitudes, lw=2)
+    plt.plot(res.omega, res.amplitude, 'ro', label='Resonance peak')
+    plt.hlines(res.amplitude/np.sqrt(2), res.omega_lo, res.omega_hi, colors='r',
+               linestyles='--', label='Half-power bandwidth')
+    plt.legend()
+    plt.xlabel("Frequency (rad/s)")
+    plt.ylabel("Steady-State Amplitude, X (m)")
+    plt.title(f"Frequency Response of the SDOF Bridge Model (ζ={zeta:g})")
+    plt.grid(True)
+    plt.tight_layout()
+    return fig
+
+
+# === Damped_Vibration_Response(2D Plot).py / Effect_of_Damping_on_Displacement.py ===
+
+def free_vibration(omega_n, t, zetas=(0.5, 1.0, 2.0)):
+    """x(0)=1, x'(0)=0 free responses (one row per zeta), from the closed form."""
+    from .analytic import sdof_closed_form
+    return sdof_closed_form(1.0, omega_n**2, list(zetas), 0.0, 0.0, t, x0=1.0)
+
+
+def damping_comparison_figure(t, under, critical, over):
+    """Under-, critically and overdamped free vibration over a short window."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(t, under,    label="Underdamped (ζ=0.5)",  color="blue",  lw=2)
+    plt.plot(t, critical, label="Critical (ζ=1.0)",   color="green", lw=2)
+    plt.plot(t, over,     label="Overdamped (ζ=2.0)", color="red",   lw=2)
+    plt.xlabel("Time (s)")
+    plt.ylabel("Displacement x(t) (m)")
+    plt.title("Damping Comparison: Under, Critical, Over")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    return fig
+
+
+def damping_effect_figure(t, under, critical, over):
+    """The same three free responses over a long window, large fonts."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(10, 6))
+    plt.plot(t, over,     label="Overdamped (ζ=2.0)",   color="red",    lw=2)
+    plt.plot(t, under,    label="Underdamped (ζ=0.5)",  color="blue",   lw=2)
+    plt.plot(t, critical, label="Critically Damped (ζ=1)", color="green", lw=2)
+    plt.xlabel("Time (s)", fontsize=14)
+    plt.ylabel("Displacement $x(t)$ (m)", fontsize=14)
+    plt.title("Effect of Damping on Free Vibration Response", fontsize=16)
+    plt.legend(fontsize=12)
+    plt.grid(True)
+    plt.tight_layout()
+    return fig
+
+
+# === Wanted_3D_Plot2.py / Wanted_3D_Plot3.py / Wanted_3D_Combined.py ===
+
+def mass_displacement_figure(time, x1):
+    """Displacement history of mass 1 of the 4-mass deck."""
+    plt = _pyplot()
+    fig = plt.figure(figsize=(6, 4))
+    plt.plot(time, x1, color='tab:blue')
+    plt.xlabel('Time (s)')
+    plt.ylabel('Displacement of Mass 1 (m)')
+    plt.title('Bridge Mass Displacement Over Time')
+    plt.grid(True)
+    plt.tight_layout()
+    return fig
+
+
+def deck_deformation_figure(disp, L=100.0, W=20.0):
+    """3-D surface of an L x W deck through the four corner displacements disp."""
+    plt = _pyplot()
+    X = np.array([[0, L], [0, L]])
+    Y = np.array([[0, 0], [W, W]])
+    Z = np.array([[disp[0], disp[1]], [disp[2], disp[3]]])
+    fig = plt.figure(figsize=(6, 4))
+    ax = fig.add_subplot(111, projection='3d')
+    ax.plot_surface(X, Y, Z, color='orange', alpha=0.8)
+    ax.set_xlabel('Bridge Length (m)')
+    ax.set_ylabel('Bridge Width (m)')
+    ax.set_zlabel('Lateral Deflection (m)')
+    ax.set_title('Bridge Deck Deformation under Wind Load')
+    plt.tight_layout()
+    return fig
+
+
+def combined_deck_figure(times, x1, final, F0, k0, L=100, W=20):
+    """
+    Plotly page of the 4-mass deck: deformed deck at the final state,
+    wind cones at the corners and the time history x1 of corner 1.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    X2, X3, X4 = final[1], final[2], final[3]
+    corners = np.array([[0, 0], [L, 0], [L, W], [0, W]])
+    fig = make_subplots(
+        rows=1, cols=3,
+        specs=[[{"type": "surface"}, {"type": "cone"}, {"type": "scene"}]],
+        subplot_titles=["Deck Deformation", "Wind Vectors", "Time History"]
+    )
+    Z_final = np.array([[x1[-1], X2], [X4, X3]])
+    fig.add_trace(go.Surface(x=np.array([[0, L], [0, L]]), y=np.array([[0, 0], [W, W]]),
+                             z=Z_final, colorscale="Oranges", opacity=0.8,
+                             showscale=False),
+                  row=1, col=1)
+    # cones anchored at the corners, pointing in +x, scaled by F0/k0
+    fig.add_trace(go.Cone(x=corners[:, 0], y=corners[:, 1], z=[0]*4,
+                          u=np.array([F0/k0]*4), v=np.zeros(4), w=np.zeros(4),
+                          sizemode="absolute", sizeref=2,
+                          anchor="tip", colorscale="Blues"),
+                  row=1, col=2)
+    fig.add_trace(go.Scatter3d(x=times, y=x1, z=x1*0+5, mode="lines",
+                               line=dict(color="firebrick", width=4)),
+                  row=1, col=3)
+    fig.update_layout(height=500, width=1500,
+                      title_text="Unified 3D Visualizations: Deck, Wind & Time History")
+    axes = dict(xaxis_title="X (m)", yaxis_title="Y (m)", zaxis_title="Z (m)")
+    fig.update_scenes(axes, row=1, col=1)
+    fig.update_scenes(axes, row=1, col=3)
+    return fig
+
+
+# === 3D_Oscillation_interation_02.py / 3D_Oscillating_interaction.py ===
+
+def _steady_surfaces(m, k, F0, T, Z, Omega):
+    """Steady displacement and F/m surfaces over the (time, zeta) grid T, Z."""
+    omega_n = np.sqrt(k/m)
+    denom = np.sqrt((omega_n**2 - Omega**2)**2 + (2*Z*omega_n*Omega)**2)
+    # the zeta=0 row is unbounded at resonance on purpose
+    with np.errstate(divide="ignore", invalid="ignore"):
+        X = (F0/m) / denom
+        disp = X * np.sin(Omega*T - np.arctan2(2*Z*omega_n*Omega, omega_n**2 - Omega**2))
+    accel = (F0*np.sin(Omega*T)) / m
+    return disp, accel
+
+
+def response_slider_figure(m, k, F0, t, zetas, ratios=(0.8, 0.9, 1.0, 1.1, 1.2)):
+    """
+    Plotly surfaces of the steady displacement and the wind acceleration
+    over (t, zeta), with a slider over the forcing ratios Omega/omega_n.
+    """
+    import plotly.graph_objects as go
+    omega_n = np.sqrt(k / m)
+    T, Z = np.meshgrid(t, zetas)
+    frames = []
+    for r in ratios:
+        disp, accel = _steady_surfaces(m, k, F0, T, Z, r*omega_n)
+        frames.append(go.Frame(
+            name=f"{r:.1f}·ωₙ",
+            data=[
+                go.Surface(x=T, y=Z, z=disp, showscale=False, opacity=0.9,
+                           hovertemplate="t=%{x:.1f}s, ζ=%{y:.1f}, x=%{z:.3f}m"),
+                go.Surface(x=T, y=Z, z=accel, showscale=False, opacity=0.5,
+                           colorscale="Viridis",
+                           hovertemplate="t=%{x:.1f}s, ζ=%{y:.1f}, a=%{z:.2f}m/s²")
+            ]
+        ))
+
+    active = len(frames)//2
+    fig = go.Figure(data=frames[active].data, frames=frames)
+    steps = [dict(method="animate",
+                  args=[[fr.name], {"mode": "immediate", "frame": {"duration": 0}}],
+                  label=fr.name) for fr in frames]
+    fig.update_layout(
+        title="3D Bridge Response & Wind Force vs. Frequency",
+        scene=dict(xaxis_title="Time (s)", yaxis_title="Damping ζ", zaxis_title="Magnitude"),
+        sliders=[dict(active=active, currentvalue={"prefix": "Ω = "}, pad={"t": 60},
+                      steps=steps)]
+    )
+    return fig
+
+
+def multi_viz_figure(m, k, F0, t, zetas, L=10.0):
+    """
+    Plotly page: steady response surfaces at resonance over (t, zeta) next
+    to an animated first mode shape of a span of length L.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    wn = np.sqrt(k/m)
+    T, Z = np.meshgrid(t, zetas)
+    disp, accel = _steady_surfaces(m, k, F0, T, Z, wn)
+
+    x = np.linspace(0, L, 100)
+    mode = np.sin(np.pi * x / L)
+    A2 = np.sin(wn * np.linspace(0, 5, 50)) * 0.1
+
+    fig = make_subplots(rows=1, cols=2,
+                        specs=[[{"type": "surface"}, {"type": "scene"}]],
+                        subplot_titles=["Steady‑State Response", "Mode‑Shape Animation"])
+    fig.add_trace(go.Surface(x=T, y=Z, z=disp, showscale=False, opacity=0.9), row=1, col=1)
+    fig.add_trace(go.Surface(x=T, y=Z, z=accel, showscale=False, opacity=0.5,
+                             colorscale="Viridis"), row=1, col=1)
+
+    def line(Ai):
+        return go.Scatter3d(x=x, y=np.zeros_like(x), z=Ai * mode, mode="lines",
+                            line=dict(color="crimson", width=4))
+    fig.add_trace(line(A2[0]), row=1, col=2)
+    # each frame repeats the two surfaces and moves the line
+    fig.frames = [go.Frame(data=[fig.data[0], fig.data[1], line(Ai)]) for Ai in A2]
+    fig.update_layout(
+        updatemenus=[dict(type="buttons", showactive=False,
+                          buttons=[dict(label="▶ Play", method="animate",
+                                        args=[None, {"frame": {"duration": 100, "redraw": True},
+                                                     "fromcurrent": True}])])],
+        height=600, width=1000,
+        title="3D Bridge Response & Mode‑Shape Animation"
+    )
+    return fig
+
+
+# === 3D Time–Frequency Surface of Bridge Response.py ===
+
+def time_frequency_surface_figure(m, k, F0, zeta, t, rtol=2e-3):
+    """
+    Plotly surface of the steady response X sin(Omega t - phi) over time
+    and Omega = 0.5 .. 1.5 omega_n.  The Omega rows are refined where the
+    response curves (the resonance ridge) and left coarse where it is flat.
+    """
+    import plotly.graph_objects as go
+    omega_n = np.sqrt(k/m)
+
+    def steady_phasor(r):
+        """X·cos φ and X·sin φ at frequency ratios r (what the surface is made of)."""
+        W = r*omega_n
+        X = (F0/m) / np.sqrt((omega_n**2 - W**2)**2 + (2*zeta*omega_n*W)**2)
+        phi = np.arctan2(2*zeta*omega_n*W, omega_n**2 - W**2)
+        return np.column_stack([X*np.cos(phi), X*np.sin(phi)])
+
+    ratio, _ = refine_axis(steady_phasor, 0.5, 1.5, rtol=rtol, keep_passed=False)
+    T, R = np.meshgrid(t, ratio)
+    denom = np.sqrt((omega_n**2 - (R*omega_n)**2)**2 + (2*zeta*omega_n*(R*omega_n))**2)
+    X = (F0/m) / denom
+    phi = np.arctan2(2*zeta*omega_n*(R*omega_n), omega_n**2 - (R*omega_n)**2)
+    Disp = X * np.sin(R*omega_n*T - phi)
+
+    fig = go.Figure(data=go.Surface(
+        x=T, y=R*omega_n, z=Disp,
+        colorscale='Viridis', cmin=-X.max(), cmax=X.max(),
+        colorbar=dict(title='x (m)')
+    ))
+    fig.update_layout(
+        title="Bridge Steady-State Response vs Time & Forcing Frequency",
+        scene=dict(xaxis_title="Time (s)", yaxis_title="Ω (rad/s)",
+                   zaxis_title="Displacement x (m)"),
+        autosize=False, width=800, height=600
+    )
+    return fig
@@ -0,0 +1,164 @@
+"""Sampled (measured) forcing read through memory maps.
+
+A recorded force or anemometer-derived load is a table of samples every
+dt, possibly far larger than RAM.  SampledForce wraps such a table as a
+read-only memory map (.npy, raw binary, or a CSV converted once to .npy)
+and run_sampled drives a MatrixRK4 model with it chunk by chunk: for each
+block of steps the RK4 stage loads M^-1 F at t, t + h/2 and t + h are
+interpolated in bulk with array operations, so the step loop never
+evaluates or looks up the force itself.  Only one block of the record
+is resident at a time; pass recorders to keep the output small as well.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from .recorders import History, run_recorded
+
+
+class SampledForce:
+    """
+    Force channels sampled every dt starting at t0; data has shape
+    (n_samples,) or (n_samples, n_channels) and may be a np.memmap.
+    Values are linearly interpolated between samples.
+    """
+
+    def __init__(self, data, dt, t0=0.0, scale=1.0):
+        self.data = data if data.ndim == 2 else data.reshape(-1, 1)
+        self.dt = float(dt)
+        self.t0 = float(t0)
+        self.scale = scale
+        if self.n_samples < 2:
+            raise ValueError("a sampled force needs at least two samples")
+
+    @property
+    def n_samples(self):
+        return self.data.shape[0]
+
+    @property
+    def n_channels(self):
+        return self.data.shape[1]
+
+    @property
+    def duration(self):
+        return (self.n_samples - 1)*self.dt
+
+    def block(self, start, stop):
+        """Samples [start, stop) as an in-memory float array (scaled)."""
+        return np.asarray(self.data[start:stop], dtype=float)*self.scale
+
+    def __call__(self, t):
+        """Force vector at time t (usable as MatrixRK4(force=...))."""
+        s = (t - self.t0)/self.dt
+        i = min(max(int(np.floor(s)), 0), self.n_samples - 2)
+        w = s - i
+        lo, hi = self.block(i, i + 2)
+        return (1 - w)*lo + w*hi
+
+    def stages(self, start, stop, substeps=1):
+        """
+        Stage values for RK4 steps of h = dt/substeps covering samples
+        start..stop: arrays F(t_j), F(t_j + h/2), F(t_j + h), each of shape
+        ((stop - start)*substeps, n_channels).
+        """
+        V = self.block(start, stop + 1)
+        lo, hi = V[:-1], V[1:]
+        frac = np.arange(substeps)/substeps         # step starts within a sample
+
+        def at(offset):
+            w = (frac + offset/substeps)[None, :, None]
+            return ((1 - w)*lo[:, None] + w*hi[:, None]).reshape(-1, self.n_channels)
+        return at(0.0), at(0.5), at(1.0)
+
+
+def open_force(path, dt, t0=0.0, dtype="float64", n_channels=1, columns=None,
+               scale=1.0):
+    """
+    SampledForce over a file, memory-mapped read-only:
+
+    * .npy        -- np.load(mmap_mode="r")
+    * .csv        -- converted once to .npy (chunked, see csv_to_npy),
+                     then mapped; columns selects columns by name
+                     (default: all)
+    * other       -- raw binary of `dtype`, n_channels interleaved per sample
+    """
+    if path.endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+    elif path.endswith(".csv"):
+        data = np.load(csv_to_npy(path, columns=columns), mmap_mode="r")
+    else:
+        raw = np.memmap(path, dtype=dtype, mode="r")
+        if raw.size % n_channels:
+            raise ValueError(f"{path}: size is not a multiple of {n_channels} channels")
+        data = raw.reshape(-1, n_channels)
+    return SampledForce(data, dt, t0, scale)
+
+
+def csv_to_npy(path, out=None, columns=None, chunksize=1_000_000):
+    """
+    Convert a numeric CSV to a float64 .npy without holding it in memory;
+    skipped if the .npy is newer than the CSV.  The default output is
+    <path>.npy for all columns and <path>.<hash>.npy for a selection, the
+    hash naming the selected columns so each selection gets its own file.
+    """
+    import pandas as pd
+    if out is None:
+        out = path + ".npy"
+        if columns is not None:
+            key = hashlib.sha1(repr(list(columns)).encode()).hexdigest()[:8]
+            out = f"{path}.{key}.npy"
+    if os.path.exists(out) and os.path.getmtime(out) >= os.path.getmtime(path):
+        return out
+    n_rows = 0
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+        n_cols = chunk.shape[1]
+        n_rows += len(chunk)
+    tmp = out + ".tmp.npy"
+    arr = np.lib.format.open_memmap(tmp, mode="w+", dtype=float, shape=(n_rows, n_cols))
+    row = 0
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+        arr[row:row + len(chunk)] = chunk.to_numpy(dtype=float)
+        row += len(chunk)
+    arr.flush()
+    del arr
+    os.replace(tmp, out)
+    return out
+
+
+def run_sampled(rk4, force, y0=None, substeps=1, distribution=None,
+                chunk_samples=65536, recorders=None):
+    """
+    Integrate a MatrixRK4 model over the whole record of a SampledForce
+    with steps h = force.dt/substeps.
+
+    distribution (n_dof x n_channels) maps force channels onto DOFs; by
+    default channel i loads DOF i (or one channel loads every DOF).
+    Returns the (n_steps+1, 2n) state history, or with recorders the final
+    state (the recorders then see every step, as in MatrixRK4.run).
+    """
+    n = rk4.n
+    if distribution is None:
+        if force.n_channels not in (1, n):
+            raise ValueError(f"{force.n_channels} force channels for {n} DOFs; "
+                             "give a distribution matrix")
+        distribution = np.eye(n) if force.n_channels == n else np.ones((n, 1))
+    # one matrix takes channel values straight to M^-1 F
+    G = np.asarray(rk4.Minv @ np.asarray(distribution, dtype=float)).T
+    h = force.dt/substeps
+    n_steps = (force.n_samples - 1)*substeps
+    y0 = np.zeros(2*n) if y0 is None else y0
+
+    def blocks():
+        for start in range(0, force.n_samples - 1, chunk_samples):
+            stop = min(start + chunk_samples, force.n_samples - 1)
+            F0, Fh, F1 = force.stages(start, stop, substeps)
+            yield F0 @ G, Fh @ G, F1 @ G
+
+    loads = (stage for block in blocks() for stage in zip(*block))
+    advance = lambda y, t: rk4.step_loads(y, h, *next(loads))
+    if recorders is not None:
+        return run_recorded(advance, y0, h, n_steps, recorders, force.t0)
+    history = History()
+    run_recorded(advance, y0, h, n_steps, [history], force.t0)
+    return history.values
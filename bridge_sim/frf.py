@@ -0,0 +1,238 @@
+"""Direct frequency-domain steady-state response of multi-DOF models.
+
+For a load F sin(omega t) the steady state is x(t) = Im(X e^{i omega t})
+with the complex response X solving
+
+    (K - omega^2 M + i omega C) X = F
+
+so a full frequency-response function needs one linear solve per
+frequency instead of a long time integration.  Amplitude |X| and phase
+lag phi (x = |X| sin(omega t - phi)) follow the convention of the SDOF
+scripts, phi = arctan2(c omega, k - m omega^2).
+
+method="solve"  batched np.linalg.solve over stacked frequencies (dense)
+                or one sparse LU per frequency shared by all load cases
+method="eig"    dense only: diagonalize the state matrix once and reuse
+                it for every frequency (O(n^2) per frequency afterwards)
+
+find_resonances locates the peaks of |X| and their half-power bandwidth
+to a relative tolerance with a few hundred evaluations instead of a
+dense sweep (see its docstring).
+"""
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from .models import is_sparse, state_space
+from .refine import refine_axis
+
+FrequencyResponse = namedtuple("FrequencyResponse",
+                               ["omega", "response", "amplitude", "phase"])
+FrequencyResponse.__doc__ = """\
+omega (n_freq,), complex response (n_freq, n_dof[, n_loads]) and its
+amplitude and phase lag (same shape)."""
+
+Resonances = namedtuple("Resonances", ["omega", "amplitude", "phase", "omega_lo",
+                                       "omega_hi", "bandwidth", "Q", "n_eval"])
+Resonances.__doc__ = """\
+Per peak (arrays of length n_peaks): peak frequency omega (rad/s),
+amplitude and phase lag there, half-power frequencies omega_lo/omega_hi,
+bandwidth = omega_hi - omega_lo and Q = omega / bandwidth (nan where a
+half-power point lies outside the searched band).  n_eval is the total
+number of frequencies evaluated."""
+
+# complex entries per batched dense solve
+_CHUNK_ENTRIES = 2**22
+
+
+def _dense_solve(M, C, K, F, omegas):
+    n = M.shape[0]
+    F2 = F.reshape(n, -1)
+    out = np.empty((omegas.size,) + F.shape, dtype=complex)
+    chunk = max(1, _CHUNK_ENTRIES // (n*n))
+    for s in range(0, omegas.size, chunk):
+        w = omegas[s:s+chunk, None, None]
+        Z = K - w**2*M + 1j*w*C           # (chunk, n, n)
+        rhs = np.broadcast_to(F2, (Z.shape[0],) + F2.shape)
+        out[s:s+chunk] = np.linalg.solve(Z, rhs).reshape((Z.shape[0],) + F.shape)
+    return out
+
+
+def _dense_eig(M, C, K, F, omegas):
+    # y' = A y + B F,  X(omega) = [I 0] V (i omega - Lambda)^-1 V^-1 B F
+    n = M.shape[0]
+    A, B = state_space(M, C, K)
+    lam, V = np.linalg.eig(A)
+    G = np.linalg.solve(V, B @ F.reshape(n, -1))          # modal input, (2n, n_loads)
+    W = 1.0/(1j*omegas[:, None] - lam[None, :])           # (n_freq, 2n)
+    X = np.einsum("ik,fk,kl->fil", V[:n], W, G)
+    return X.reshape((omegas.size,) + F.shape)
+
+
+def _sparse_solve(M, C, K, F, omegas):
+    M, C, K = (sp.csc_matrix(a, dtype=complex) for a in (M, C, K))
+    Fc = F.astype(complex)
+    out = np.empty((omegas.size,) + F.shape, dtype=complex)
+    lu, lu_omega = None, None
+    for i, w in enumerate(omegas):
+        # one factorization serves every load case (column of F) and is
+        # kept while the frequency repeats
+        if w != lu_omega:
+            lu, lu_omega = spla.splu((K - w**2*M + 1j*w*C).tocsc()), w
+        out[i] = lu.solve(Fc)
+    return out
+
+
+def frequency_response(M, C, K, F, omegas, dofs=None, method="solve"):
+    """
+    Complex steady-state response for force amplitudes F at every
+    frequency in omegas (rad/s).
+
+    F has shape (n_dof,) or (n_dof, n_loads) for several load cases;
+    dofs optionally restricts the returned DOFs.  M, C, K may be dense or
+    scipy.sparse.  Returns a FrequencyResponse.
+    """
+    omegas = np.atleast_1d(np.asarray(omegas, dtype=float))
+    F = np.asarray(F, dtype=float)
+    n = M.shape[0] if hasattr(M, "shape") else 1
+    if F.ndim == 0:
+        F = np.full(n, float(F))
+
+    if is_sparse(M, C, K):
+        if method != "solve":
+            raise ValueError("sparse systems only support method='solve'")
+        X = _sparse_solve(M, C, K, F, omegas)
+    else:
+        M, C, K = (np.atleast_2d(np.asarray(a, dtype=float)) for a in (M, C, K))
+        if method == "solve":
+            X = _dense_solve(M, C, K, F, omegas)
+        elif method == "eig":
+            X = _dense_eig(M, C, K, F, omegas)
+        else:
+            raise ValueError(f"unknown method {method!r}")
+
+    if dofs is not None:
+        X = X[:, dofs]
+    return FrequencyResponse(omegas, X, np.abs(X), -np.angle(X))
+
+
+def sdof_response(m, c, k, F0, omegas):
+    """Closed-form SDOF counterpart: amplitude and phase lag arrays."""
+    omegas = np.asarray(omegas, dtype=float)
+    amplitude = F0/np.sqrt((k - m*omegas**2)**2 + (c*omegas)**2)
+    phase = np.arctan2(c*omegas, k - m*omegas**2)
+    return amplitude, phase
+
+
+def _narrow(f, near, far, test, n_sub, rtol):
+    """
+    Shrink the brackets [near, far] (log-frequency, one per row) to the
+    first grid point, going from near to far, that passes test(values,
+    row); n_sub interior points per bracket are evaluated per pass, all
+    brackets in one call.  Returns the final (near, far).
+    """
+    near, far = near.copy(), far.copy()
+    steps = np.linspace(0.0, 1.0, n_sub + 2)
+    active = np.abs(far - near) > rtol
+    while active.any():
+        a, b = near[active], far[active]
+        grid = a[:, None] + (b - a)[:, None]*steps[None, 1:-1]
+        vals = f(grid.ravel()).reshape(grid.shape)
+        hit = test(vals, np.flatnonzero(active))
+        # first passing point (the far end if none passes)
+        j = np.where(hit.any(axis=1), hit.argmax(axis=1), n_sub)
+        full = np.column_stack([a, grid, b])
+        near[active], far[active] = full[np.arange(a.size), j], full[np.arange(a.size), j + 1]
+        active = np.abs(far - near) > rtol
+    return near, far
+
+
+def find_resonances(M, C, K, F, omega_min, omega_max, dof=None, rtol=1e-6,
+                    n_init=33, n_sub=8, method="solve"):
+    """
+    Resonance peaks of the steady-state amplitude between omega_min and
+    omega_max (rad/s) for the load amplitudes F (shape (n_dof,)).
+
+    The amplitude of DOF dof (default: the norm of the whole response) is
+    first sampled with refine_axis on a log-frequency axis, which puts its
+    points on the resonance ridges.  Every interior local maximum is then
+    narrowed to rtol (relative, in frequency) by repeated n_sub-point
+    subdivision, and the half-power points |X| = peak / sqrt(2) on either
+    side are bracketed from the same samples and narrowed the same way.
+    All peaks are refined together, one frequency_response call per
+    pass.  For the SDOF model pass sdof_matrices(m, c, k) and F0.
+    Returns Resonances.
+    """
+    F = np.asarray(F, dtype=float)
+    n = M.shape[0] if hasattr(M, "shape") else 1
+    if F.ndim == 0:
+        F = np.full(n, float(F))
+    if F.ndim != 1:
+        raise ValueError("find_resonances needs a single load case, F of shape (n_dof,)")
+    if not 0 < omega_min < omega_max:
+        raise ValueError("need 0 < omega_min < omega_max")
+    n_eval = 0
+
+    def response(logw):
+        nonlocal n_eval
+        n_eval += logw.size
+        X = frequency_response(M, C, K, F, np.exp(logw), method=method).response
+        return X[:, dof] if dof is not None else X
+
+    def amplitude(logw):
+        X = response(logw)
+        return np.abs(X) if X.ndim == 1 else np.linalg.norm(X, axis=1)
+
+    x, a = refine_axis(lambda u: np.log(amplitude(u)), np.log(omega_min),
+                       np.log(omega_max), n_init=n_init, rtol=1e-3)
+    peaks = np.flatnonzero((a[1:-1] > a[:-2]) & (a[1:-1] >= a[2:])) + 1
+
+    # peak: keep the bracket around the running maximum
+    lo, hi = x[peaks - 1], x[peaks + 1]
+    best, f_best = x[peaks], a[peaks]
+    steps = np.linspace(0.0, 1.0, n_sub + 2)
+    active = hi - lo > rtol
+    while active.any():
+        grid = lo[active, None] + (hi - lo)[active, None]*steps[None, :]
+        vals = np.log(amplitude(grid[:, 1:-1].ravel())).reshape(-1, n_sub)
+        vals = np.column_stack([np.full(len(grid), -np.inf), vals, np.full(len(grid), -np.inf)])
+        j = vals.argmax(axis=1)
+        rows = np.arange(len(grid))
+        improved = vals[rows, j] > f_best[active]
+        idx = np.flatnonzero(active)
+        best[idx[improved]] = grid[rows, j][improved]
+        f_best[idx[improved]] = vals[rows, j][improved]
+        # the new bracket is one grid step either side of the best point
+        centre = np.where(improved, grid[rows, j], best[idx])
+        step = (hi - lo)[active]/(n_sub + 1)
+        lo[active], hi[active] = centre - step, centre + step
+        active = hi - lo > rtol
+
+    peak_omega = np.exp(best)
+    peak_amp = np.exp(f_best)
+    X_peak = response(best)
+    X_peak = X_peak if X_peak.ndim == 1 else X_peak[np.arange(best.size), np.abs(X_peak).argmax(axis=1)]
+    half = f_best - 0.5*np.log(2.0)
+
+    # half-power points: from the peak outwards to the first sample below half power
+    edges = []
+    for side in (-1, 1):
+        far = np.full(best.size, np.nan)
+        for i, p in enumerate(peaks):
+            below = np.flatnonzero(a < half[i])
+            below = below[below < p][-1:] if side < 0 else below[below > p][:1]
+            if below.size:
+                far[i] = x[below[0]]
+        ok = ~np.isnan(far)
+        edge = np.full(best.size, np.nan)
+        if ok.any():
+            near, farther = _narrow(lambda u: np.log(amplitude(u)), best[ok], far[ok],
+                                    lambda v, rows: v < half[ok][rows, None], n_sub, rtol)
+            edge[ok] = 0.5*(near + farther)
+        edges.append(np.exp(edge))
+    omega_lo, omega_hi = edges
+    bandwidth = omega_hi - omega_lo
+    return Resonances(peak_omega, peak_amp, -np.angle(X_peak), omega_lo, omega_hi,
+                      bandwidth, peak_omega/bandwidth, n_eval)
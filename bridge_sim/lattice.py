@@ -0,0 +1,66 @@
+"""Sparse rows x cols lattice of lumped deck masses.
+
+Generalizes the hard-coded 4-corner deck to an arbitrary grid: every mass
+is tied to ground by (k0, c0) and to its span-wise and cross-wise
+neighbours by per-edge springs and dampers.  M, C and K come back as
+``scipy.sparse`` matrices, so storage and mat-vec cost scale with the
+number of nonzeros (about 5 per row) instead of N^2.
+
+Masses are numbered row by row: node = r*cols + c, with c running along
+the span and r across the width, matching the 5x5 grid of
+Wanted_3D_Plot1.py.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+
+def lattice_edges(rows, cols):
+    """
+    (n_edges, 2) array of connected node pairs of a rows x cols grid:
+    the rows*(cols-1) span-wise edges first, then the (rows-1)*cols
+    cross-wise edges.
+    """
+    node = np.arange(rows*cols).reshape(rows, cols)
+    span = np.column_stack([node[:, :-1].ravel(), node[:, 1:].ravel()])
+    cross = np.column_stack([node[:-1, :].ravel(), node[1:, :].ravel()])
+    return np.vstack([span, cross])
+
+
+def lattice_coordinates(rows, cols, length, width):
+    """X, Y positions (each rows x cols) of the masses on a length x width deck."""
+    return np.meshgrid(np.linspace(0, length, cols), np.linspace(0, width, rows))
+
+
+def sparse_coupled_matrices(n, m, k0, c0, edges, kc, cc, fmt="csr"):
+    """
+    Sparse counterpart of models.coupled_matrices: n grounded masses
+    coupled along `edges` by springs kc and dampers cc (scalars or one
+    value per edge).  Returns M, C, K in the given scipy.sparse format.
+    """
+    edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+    n_edges = len(edges)
+    i, j = edges[:, 0], edges[:, 1]
+    rows = np.concatenate([np.arange(n), i, j, i, j])
+    cols = np.concatenate([np.arange(n), i, j, j, i])
+
+    def assemble(ground, coupling):
+        ground = np.broadcast_to(np.asarray(ground, dtype=float), (n,))
+        coupling = np.broadcast_to(np.asarray(coupling, dtype=float), (n_edges,))
+        data = np.concatenate([ground, coupling, coupling, -coupling, -coupling])
+        # duplicate (row, col) entries are summed on conversion
+        return sp.coo_matrix((data, (rows, cols)), shape=(n, n)).asformat(fmt)
+
+    M = sp.diags(np.broadcast_to(np.asarray(m, dtype=float), (n,)), format=fmt)
+    return M, assemble(c0, cc), assemble(k0, kc)
+
+
+def deck_lattice(rows, cols, m, k0, c0, k_edge, c_edge, fmt="csr"):
+    """
+    Sparse M, C, K of a rows x cols deck lattice.
+
+    m, k0, c0   -- scalars or one value per mass (length rows*cols)
+    k_edge,
+    c_edge      -- scalars or one value per edge, ordered as lattice_edges()
+    """
+    return sparse_coupled_matrices(rows*cols, m, k0, c0, lattice_edges(rows, cols),
+                                   k_edge, c_edge, fmt=fmt)
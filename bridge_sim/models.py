@@ -0,0 +1,90 @@
+"""Mass, damping and stiffness matrices for the bridge models.
+
+All multi-DOF models are written as  M x'' + C x' + K x = F(t)  with the
+displacements of the n masses in x.  The first-order (state-space) form
+uses the block state  y = [x_1..x_n, v_1..v_n]  so that  y' = A y + B F.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+# Corner numbering used by the 4-mass deck scripts:
+#   1 --- 2        coupling springs/dampers along 1-2, 1-3, 2-4, 3-4
+#   |     |        (0-based below)
+#   3 --- 4
+FOUR_MASS_EDGES = [(0, 1), (0, 2), (1, 3), (2, 3)]
+
+
+def sdof_matrices(m, c, k):
+    """1x1 M, C, K for the single-degree-of-freedom bridge model."""
+    return (np.array([[float(m)]]), np.array([[float(c)]]),
+            np.array([[float(k)]]))
+
+
+def coupled_matrices(n, m, k0, c0, edges, kc, cc):
+    """
+    Dense M, C, K for n masses, each tied to ground by (k0, c0) and tied to
+    each other along `edges` by coupling springs kc and dampers cc.
+    m, k0, c0 may be scalars or length-n arrays; kc, cc scalars or
+    one value per edge.
+    """
+    m = np.broadcast_to(np.asarray(m, dtype=float), (n,))
+    k0 = np.broadcast_to(np.asarray(k0, dtype=float), (n,))
+    c0 = np.broadcast_to(np.asarray(c0, dtype=float), (n,))
+    kc = np.broadcast_to(np.asarray(kc, dtype=float), (len(edges),))
+    cc = np.broadcast_to(np.asarray(cc, dtype=float), (len(edges),))
+
+    M = np.diag(m)
+    K = np.diag(k0)
+    C = np.diag(c0)
+    for (i, j), ke, ce in zip(edges, kc, cc):
+        K[i, i] += ke; K[j, j] += ke; K[i, j] -= ke; K[j, i] -= ke
+        C[i, i] += ce; C[j, j] += ce; C[i, j] -= ce; C[j, i] -= ce
+    return M, C, K
+
+
+def four_mass_matrices(m, k0, c0, kc, cc):
+    """M, C, K of the 4-corner deck used in the Wanted_3D_* scripts."""
+    return coupled_matrices(4, m, k0, c0, FOUR_MASS_EDGES, kc, cc)
+
+
+def is_sparse(*matrices):
+    """True if any of the matrices is a scipy.sparse matrix."""
+    return any(sp.issparse(a) for a in matrices)
+
+
+def mass_inverse(M):
+    """
+    M^-1 -- dense inverse for dense M, sparse diagonal inverse for a
+    sparse (lumped) mass matrix.
+    """
+    if sp.issparse(M):
+        d = M.diagonal()
+        if (M != sp.diags(d)).nnz:
+            raise ValueError("sparse models need a lumped (diagonal) mass matrix")
+        return sp.diags(1.0/d, format="csr")
+    return np.linalg.inv(np.atleast_2d(np.asarray(M, dtype=float)))
+
+
+def state_space(M, C, K):
+    """
+    First-order form y' = A y + B F of  M x'' + C x' + K x = F.
+    Returns A (2n x 2n) and B (2n x n) for the block state [x, v];
+    both are CSR matrices if any of M, C, K is sparse.
+    """
+    if is_sparse(M, C, K):
+        Minv = mass_inverse(M)
+        n = Minv.shape[0]
+        A = sp.bmat([[None, sp.identity(n)],
+                     [-(Minv @ sp.csr_matrix(K)), -(Minv @ sp.csr_matrix(C))]],
+                    format="csr")
+        B = sp.vstack([sp.csr_matrix((n, n)), Minv], format="csr")
+        return A, B
+    Minv = mass_inverse(M)
+    n = Minv.shape[0]
+    A = np.zeros((2*n, 2*n))
+    A[:n, n:] = np.eye(n)
+    A[n:, :n] = -Minv @ np.atleast_2d(K)
+    A[n:, n:] = -Minv @ np.atleast_2d(C)
+    B = np.zeros((2*n, n))
+    B[n:, :] = Minv
+    return A, B
@@ -0,0 +1,154 @@
+"""Recorders: keep only the part of a run that is actually used.
+
+Storing the full (n_steps+1, 2n) state history costs n_steps x 2n floats
+even when a script only plots x1, or only needs the last few seconds, or
+only the peak amplitude.  A recorder is handed every state as the
+integrator produces it and keeps what it was configured for:
+
+* History    -- selected DOFs, every k-th step
+* RingBuffer -- selected DOFs over the last N seconds (or samples)
+* Stats      -- running min / max / mean / RMS of selected DOFs
+
+so memory scales with the request, not with n_steps x n_dof.  Pass them
+as ``recorders=[...]`` to MatrixRK4.run, HarmonicPropagator.run or
+ExactPropagator.run, or drive any advance(y, t) step with run_recorded.
+"""
+import numpy as np
+
+
+def _index(dofs):
+    if dofs is None:
+        return slice(None)
+    return np.atleast_1d(np.asarray(dofs, dtype=int))
+
+
+def _width(index, size):
+    return len(range(size)[index]) if isinstance(index, slice) else index.size
+
+
+class History:
+    """States y[dofs] at every k-th step (steps 0, every, 2*every, ...)."""
+
+    def __init__(self, dofs=None, every=1):
+        if every < 1:
+            raise ValueError("every must be a positive integer")
+        self.dofs = dofs
+        self.every = int(every)
+        self._idx = _index(dofs)
+
+    def start(self, t0, dt, n_steps, size):
+        n = n_steps//self.every + 1
+        self.t = np.empty(n)
+        self.values = np.empty((n, _width(self._idx, size)))
+
+    def record(self, i, t, y):
+        if i % self.every == 0:
+            j = i//self.every
+            self.t[j] = t
+            self.values[j] = y[self._idx]
+
+
+class RingBuffer:
+    """
+    The most recent samples of y[dofs], covering `duration` seconds (or a
+    fixed n_samples), optionally only every k-th step.  t and values are
+    returned oldest first.
+    """
+
+    def __init__(self, dofs=None, duration=None, n_samples=None, every=1):
+        if (duration is None) == (n_samples is None):
+            raise ValueError("give exactly one of duration or n_samples")
+        if every < 1:
+            raise ValueError("every must be a positive integer")
+        self.dofs = dofs
+        self.duration = duration
+        self.n_samples = n_samples
+        self.every = int(every)
+        self._idx = _index(dofs)
+
+    def start(self, t0, dt, n_steps, size):
+        if self.n_samples is None:
+            capacity = int(round(self.duration/(dt*self.every))) + 1
+        else:
+            capacity = int(self.n_samples)
+        self.capacity = max(capacity, 1)
+        self._t = np.empty(self.capacity)
+        self._values = np.empty((self.capacity, _width(self._idx, size)))
+        self._count = 0
+
+    def record(self, i, t, y):
+        if i % self.every == 0:
+            pos = self._count % self.capacity
+            self._t[pos] = t
+            self._values[pos] = y[self._idx]
+            self._count += 1
+
+    def _ordered(self, a):
+        if self._count <= self.capacity:
+            return a[:self._count]
+        return np.roll(a, -(self._count % self.capacity), axis=0)
+
+    @property
+    def t(self):
+        return self._ordered(self._t)
+
+    @property
+    def values(self):
+        return self._ordered(self._values)
+
+
+class Stats:
+    """Running min, max, mean and RMS of y[dofs] for samples with t >= t_start."""
+
+    def __init__(self, dofs=None, t_start=-np.inf):
+        self.dofs = dofs
+        self.t_start = t_start
+        self._idx = _index(dofs)
+
+    def start(self, t0, dt, n_steps, size):
+        n = _width(self._idx, size)
+        self.min = np.full(n, np.inf)
+        self.max = np.full(n, -np.inf)
+        self._sum = np.zeros(n)
+        self._sumsq = np.zeros(n)
+        self.count = 0
+
+    def record(self, i, t, y):
+        if t < self.t_start:
+            return
+        x = y[self._idx]
+        np.minimum(self.min, x, out=self.min)
+        np.maximum(self.max, x, out=self.max)
+        self._sum += x
+        self._sumsq += x*x
+        self.count += 1
+
+    @property
+    def mean(self):
+        return self._sum / max(self.count, 1)
+
+    @property
+    def rms(self):
+        return np.sqrt(self._sumsq / max(self.count, 1))
+
+    @property
+    def peak(self):
+        """Largest |y| seen, per DOF."""
+        return np.maximum(np.abs(self.min), np.abs(self.max))
+
+
+def run_recorded(advance, y0, dt, n_steps, recorders, t0=0.0):
+    """
+    Step y from t0 with advance(y, t) -> y(t+dt) for n_steps, handing each
+    state (y0 included) to every recorder.  Returns the final state.
+    """
+    y = np.array(y0, dtype=float)
+    for r in recorders:
+        r.start(t0, dt, n_steps, y.size)
+        r.record(0, t0, y)
+    for i in range(n_steps):
+        y = advance(y, t0 + i*dt)
+        t = t0 + (i + 1)*dt
+        for r in recorders:
+            r.record(i + 1, t, y)
+    return y
@@ -0,0 +1,64 @@
+"""Adaptive refinement of a 1-D sampling axis.
+
+Uniform grids spend most of their points where a response is flat and
+too few on a narrow resonance ridge.  refine_axis starts from a coarse
+uniform grid and repeatedly bisects every interval whose midpoint value
+differs from the straight line between its end points by more than
+rtol * (range of the values) -- a curvature test, since that deviation
+is about h^2 |f''| / 8.  Only the two halves of a bisected interval are
+tested on the next pass, and by default the midpoints of intervals that
+passed are kept as samples while the point budget allows, so f is never
+called twice for the same point.  The result is a sorted, non-uniform axis that a
+Plotly surface (or any line plot) can use directly.
+"""
+import numpy as np
+
+
+def refine_axis(f, lo, hi, n_init=17, rtol=2e-3, max_points=1000, min_step=0.0,
+                keep_passed=True):
+    """
+    Sample f on [lo, hi] adaptively.
+
+    f maps a 1-D array of axis points to values of shape (n,) or (n, m)
+    (several quantities are refined together, e.g. real and imaginary
+    part of a complex amplitude).  Returns (points, values), sorted.
+    Refinement stops when every interval passes the test, at max_points
+    (the last pass then bisects only the worst intervals), or when all
+    remaining intervals are narrower than 2*min_step.  keep_passed=False
+    drops the midpoints of intervals that passed (fewer output points for
+    the same number of f calls, e.g. for the rows of a surface).
+    """
+    x = np.linspace(lo, hi, n_init)
+    y = np.asarray(f(x), dtype=float)
+    y = y.reshape(len(x), -1)
+    # done[i]: the interval starting at x[i] has passed (the last entry is unused);
+    # the scale only grows as points are added, so a passed interval stays passed
+    done = np.zeros(len(x), dtype=bool)
+    while True:
+        budget = max_points - x.size
+        todo = np.flatnonzero(~done[:-1] & (np.diff(x) > 2*min_step))
+        if not todo.size or budget <= 0:
+            break
+        mid = 0.5*(x[todo] + x[todo + 1])
+        y_mid = np.asarray(f(mid), dtype=float).reshape(len(mid), -1)
+        scale = np.ptp(y, axis=0)
+        scale[scale == 0] = 1.0
+        line = 0.5*(y[todo] + y[todo + 1])
+        err = np.max(np.abs(y_mid - line) / scale, axis=1)
+        bad = err > rtol
+        done[todo[~bad]] = True
+        # insert the failed midpoints, worst first, then (if kept) the
+        # passed ones, already paid for, while the budget lasts
+        order = np.lexsort((-err, ~bad))[:budget if keep_passed else min(budget, bad.sum())]
+        keep = np.zeros(len(mid), dtype=bool)
+        keep[order] = True
+        x = np.concatenate([x, mid[keep]])
+        y = np.concatenate([y, y_mid[keep]])
+        done = np.concatenate([done, done[todo[keep]]])      # right child
+        if not bad.any():
+            break
+        order = np.argsort(x, kind="stable")
+        x, y, done = x[order], y[order], done[order]
+    order = np.argsort(x)
+    x, y = x[order], y[order]
+    return x, (y[:, 0] if y.shape[1] == 1 else y)
@@ -0,0 +1,218 @@
+"""Chunked short-time Fourier analysis of long response histories.
+
+Spectrogram turns a displacement (or acceleration, or force) history into
+a time x frequency power surface without holding the history in memory.
+Samples are fed in chunks of any size -- blocks from rk4_sdof_chunks, a
+ColumnStore column, slices of a memory-mapped record -- and every
+complete frame of nperseg samples (hop nperseg - noverlap) is windowed
+and transformed as soon as it is available.  Only the last nperseg - 1
+samples are carried over between chunks.
+
+All frames of a chunk go through one batched real FFT; the window (and
+its power normalisation) is built once per (window, nperseg) and cached,
+and scipy.fft keeps the FFT plan for a given length between calls.  The
+output can be limited to a frequency band and averaged over groups of
+frames, so the surface stays small however long the record is:
+
+    spec = Spectrogram(fs=100, nperseg=1024, noverlap=768, f_range=(0, 3))
+    for t, x, v in rk4_sdof_chunks(m, k, zeta, F0, Omega, dt, T):
+        spec.feed(x[0])
+    fig = spectrogram_figure(*spec.result())
+
+swept_sine_spectrogram does this for the SDOF bridge under a wind load
+whose frequency sweeps linearly through a band.
+"""
+import numpy as np
+import scipy.fft
+
+_WINDOWS = {}
+
+
+def _window(window, nperseg):
+    """(window, sum of squares) for a scipy.signal window spec, cached."""
+    key = (window if isinstance(window, (str, tuple)) else None, nperseg)
+    if key[0] is None:
+        w = np.asarray(window, dtype=float)
+        if w.shape != (nperseg,):
+            raise ValueError(f"window has {w.size} samples, nperseg is {nperseg}")
+        return w, float(w @ w)
+    if key not in _WINDOWS:
+        from scipy.signal import get_window
+        w = get_window(window, nperseg)
+        _WINDOWS[key] = (w, float(w @ w))
+    return _WINDOWS[key]
+
+
+def clear_cache():
+    """Drop the cached windows."""
+    _WINDOWS.clear()
+
+
+class Spectrogram:
+    """
+    Streaming one-sided power spectral density of a signal sampled at fs.
+
+    Frames of nperseg samples overlap by noverlap (default nperseg // 2)
+    and are zero-padded to nfft.  detrend removes each frame's mean.
+    f_range=(lo, hi) keeps only the frequencies in that band; average=n
+    averages the power of n consecutive frames into one output row.  The
+    time of a row is the centre of its frames, counted from t0.
+    """
+
+    def __init__(self, fs, nperseg=256, noverlap=None, nfft=None, window="hann",
+                 f_range=None, average=1, detrend=True, t0=0.0, workers=None):
+        self.fs = float(fs)
+        self.nperseg = int(nperseg)
+        self.noverlap = self.nperseg//2 if noverlap is None else int(noverlap)
+        if not 0 <= self.noverlap < self.nperseg:
+            raise ValueError("noverlap must be in [0, nperseg)")
+        self.hop = self.nperseg - self.noverlap
+        self.nfft = self.nperseg if nfft is None else int(nfft)
+        if self.nfft < self.nperseg:
+            raise ValueError("nfft must be at least nperseg")
+        self.window, wss = _window(window, self.nperseg)
+        self.average = int(average)
+        self.detrend = detrend
+        self.t0 = float(t0)
+        self.workers = workers
+
+        freqs = np.fft.rfftfreq(self.nfft, 1/self.fs)
+        band = np.ones(freqs.size, dtype=bool)
+        if f_range is not None:
+            band = (freqs >= f_range[0]) & (freqs <= f_range[1])
+        self._band = np.flatnonzero(band)
+        self.freqs = freqs[self._band]
+        # density scaling, doubled for the bins that have a negative twin
+        scale = np.full(freqs.size, 2.0/(self.fs*wss))
+        scale[0] /= 2
+        if self.nfft % 2 == 0:
+            scale[-1] /= 2
+        self._scale = scale[self._band]
+        self.reset()
+
+    def reset(self):
+        """Forget all samples and output."""
+        self._carry = np.empty(0)
+        self._next = 0                  # sample index of the next frame start
+        self._seen = 0                  # samples consumed so far
+        self._acc = np.zeros(self.freqs.size)
+        self._acc_t = 0.0
+        self._acc_n = 0
+        self._times, self._rows = [], []
+
+    def feed(self, x):
+        """
+        Add the next samples of the signal.  Returns (times, power) of the
+        output rows completed by them, power of shape (n_rows, n_freqs).
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        buf = np.concatenate([self._carry, x]) if self._carry.size else x
+        start = self._seen - self._carry.size      # sample index of buf[0]
+        self._seen += x.size
+        first = self._next - start
+        n_frames = max((buf.size - first - self.nperseg)//self.hop + 1, 0)
+        if n_frames:
+            frames = np.lib.stride_tricks.sliding_window_view(
+                buf[first:], self.nperseg)[::self.hop][:n_frames]
+            if self.detrend:
+                frames = frames - frames.mean(axis=1, keepdims=True)
+            spec = scipy.fft.rfft(frames*self.window, n=self.nfft, axis=1,
+                                  workers=self.workers)[:, self._band]
+            power = (spec.real**2 + spec.imag**2)*self._scale
+            centres = self.t0 + (self._next + self.hop*np.arange(n_frames)
+                                 + self.nperseg/2)/self.fs
+            self._next += n_frames*self.hop
+            times, rows = self._group(centres, power)
+        else:
+            times, rows = np.empty(0), np.empty((0, self.freqs.size))
+        self._carry = buf[self._next - start:].copy()
+        self._times.append(times)
+        self._rows.append(rows)
+        return times, rows
+
+    def _group(self, centres, power):
+        """Average frames in groups of self.average, carrying partial groups."""
+        if self.average == 1:
+            return centres, power
+        times, rows = [], []
+        for t, p in zip(centres, power):
+            self._acc += p
+            self._acc_t += t
+            self._acc_n += 1
+            if self._acc_n == self.average:
+                times.append(self._acc_t/self.average)
+                rows.append(self._acc/self.average)
+                self._acc = np.zeros(self.freqs.size)
+                self._acc_t, self._acc_n = 0.0, 0
+        return np.array(times), np.array(rows).reshape(-1, self.freqs.size)
+
+    def run(self, x, chunk=1 << 16):
+        """Feed an iterable of chunks, or an array (e.g. a np.memmap) in slices of chunk."""
+        blocks = x
+        if isinstance(x, np.ndarray):
+            blocks = (x[i:i + chunk] for i in range(0, x.shape[0], chunk))
+        for block in blocks:
+            self.feed(block)
+        return self.result()
+
+    def result(self):
+        """(times, freqs, power) of every row produced so far; power is (n_rows, n_freqs)."""
+        times = np.concatenate(self._times) if self._times else np.empty(0)
+        rows = [r for r in self._rows if r.size]
+        power = np.concatenate(rows) if rows else np.empty((0, self.freqs.size))
+        return times, self.freqs, power
+
+
+def spectrogram(x, fs, **kwargs):
+    """(times, freqs, power) of a whole signal (array or iterable of chunks)."""
+    return Spectrogram(fs, **kwargs).run(x)
+
+
+def swept_sine_spectrogram(m, k, zeta, F0, W0, W1, T, dt, block=4096, **kwargs):
+    """
+    (times, freqs, power) of the SDOF bridge displacement under
+    F0 sin(W0 t + (W1 - W0) t^2 / (2 T)), a load whose frequency sweeps
+    linearly from W0 to W1 (rad/s) over T seconds from rest.  The response
+    is propagated exactly (exact.ExactPropagator) block samples at a time
+    and each block goes straight into a Spectrogram(fs=1/dt, **kwargs), so
+    the history is never held in memory.
+    """
+    from .exact import ExactPropagator
+    from .models import sdof_matrices, state_space
+    A, B = state_space(*sdof_matrices(m, 2*zeta*np.sqrt(k*m), k))
+    prop = ExactPropagator(A, B, dt)
+    spec = Spectrogram(1/dt, **kwargs)
+    y = np.zeros(2)
+    n_steps = int(round(T/dt))
+    for start in range(0, n_steps, block):
+        stop = min(start + block, n_steps)
+        tb = np.arange(start, stop + 1)*dt
+        ys = prop.run(y, F0*np.sin(W0*tb + (W1 - W0)*tb**2/(2*T)))
+        # the last row starts the next block; the final block keeps it
+        spec.feed(ys[:, 0] if stop == n_steps else ys[:-1, 0])
+        y = ys[-1]
+    return spec.result()
+
+
+def spectrogram_figure(times, freqs, power, db=True, angular=True, floor=1e-12,
+                       title="Bridge Response Spectrogram"):
+    """
+    Plotly Surface of a spectrogram in the layout of the time-frequency
+    page: time on x, frequency on y (rad/s if angular, else Hz), power
+    (in dB re 1 if db) on z.
+    """
+    import plotly.graph_objects as go
+    z = power.T
+    if db:
+        z = 10*np.log10(np.maximum(z, floor))
+    y = 2*np.pi*freqs if angular else freqs
+    fig = go.Figure(data=go.Surface(x=times, y=y, z=z, colorscale='Viridis',
+                                    colorbar=dict(title='PSD (dB)' if db else 'PSD')))
+    fig.update_layout(
+        title=title,
+        scene=dict(xaxis_title="Time (s)",
+                   yaxis_title="ω (rad/s)" if angular else "f (Hz)",
+                   zaxis_title="PSD (dB)" if db else "PSD"),
+        autosize=False, width=800, height=600
+    )
+    return fig
@@ -0,0 +1,151 @@
+"""Automatic steady-state detection for harmonically forced runs.
+
+Instead of simulating a fixed horizon and keeping "the last 20%" (or
+t >= 40 s), the detector fits  x ~ a sin(Omega t) + b cos(Omega t)  to
+every forcing cycle as samples arrive.  Consecutive cycles agreeing is
+not enough: a lightly damped transient near resonance changes by less
+than rtol per cycle long before it has died out.  The cycle phasors
+a + i b approach their limit geometrically, with a per-cycle contraction
+rho = exp(-zeta omega_n T) of the slowest mode, so rho is estimated from
+the ratio of successive phasor changes |dz| and the change still to come
+is extrapolated as |dz| rho / (1 - rho) (Aitken).  Once that bound is
+within tolerance for a few cycles in a row, the response is steady and
+the integration can stop.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+SteadyState = namedtuple(
+    "SteadyState",
+    ["amplitude", "phase", "settling_time", "stop_time", "converged"])
+SteadyState.__doc__ = """\
+Result of a steady-state run.  amplitude and phase (lag behind the
+forcing, rad) describe  x = amplitude*sin(Omega t - phase); settling_time
+is the start of the converged stretch of cycles and stop_time the time
+at which integration stopped."""
+
+
+class SteadyStateDetector:
+    """
+    Watch a scalar or vector signal cycle by cycle.
+
+    rtol       -- allowed relative error of the steady amplitude
+    phase_tol  -- allowed error of the steady phase (rad)
+    n_cycles   -- number of consecutive cycles that must pass
+
+    The extrapolated remaining change has to be within rtol (of the
+    largest amplitude) and phase_tol (relative to each moving component),
+    and rho is the largest ratio seen over the last n_cycles + 1 cycles.
+    Changes below 1e-3 of the tolerance count as converged whatever rho
+    is (round-off of an already steady run).
+    """
+
+    def __init__(self, Omega, t0=0.0, rtol=1e-3, phase_tol=1e-3, n_cycles=3):
+        self.Omega = float(Omega)
+        self.period = 2*np.pi/self.Omega
+        self.rtol = rtol
+        self.phase_tol = phase_tol
+        self.n_cycles = n_cycles
+        self._cycle_start = t0
+        self._reset_sums()
+        self._phasors = []          # a + i b of the recent cycles
+        self._streak = 0
+        self.cycles = []            # (cycle end time, amplitude, phase)
+        self.converged = False
+
+    def _reset_sums(self):
+        self._ss = self._cc = self._sc = 0.0
+        self._xs = self._xc = 0.0
+        self._count = 0
+
+    def update(self, t, x):
+        """Feed the sample x(t); returns True once the response is steady."""
+        if t >= self._cycle_start + self.period*(1 - 1e-9):
+            self._close_cycle()
+        s, c = np.sin(self.Omega*t), np.cos(self.Omega*t)
+        self._ss += s*s; self._cc += c*c; self._sc += s*c
+        self._xs = self._xs + x*s
+        self._xc = self._xc + x*c
+        self._count += 1
+        return self.converged
+
+    def _close_cycle(self):
+        end = self._cycle_start + self.period
+        if self._count >= 3:
+            # least-squares fit of a sin + b cos over the cycle
+            det = self._ss*self._cc - self._sc**2
+            a = (self._cc*self._xs - self._sc*self._xc) / det
+            b = (self._ss*self._xc - self._sc*self._xs) / det
+            amp = np.hypot(a, b)
+            phase = np.arctan2(-b, a)
+            self.cycles.append((end, amp, phase))
+            self._phasors = (self._phasors + [np.asarray(a + 1j*b)])[-(self.n_cycles + 3):]
+            if not self.converged:
+                self._streak = self._streak + 1 if self._settled() else 0
+                if self._streak >= self.n_cycles:
+                    self.converged = True
+        self._cycle_start = end
+        self._reset_sums()
+
+    def _settled(self):
+        """Is the extrapolated change still to come within tolerance?"""
+        if len(self._phasors) < 3:
+            return False
+        z = np.array(self._phasors)
+        amp = np.abs(z[-1])
+        scale = np.max(amp)
+        d = np.abs(np.diff(z, axis=0))               # (n_recent - 1, ...) per cycle
+        if scale == 0:
+            return bool(np.all(d[-1] == 0))
+        # only hold the phase to tolerance on components that actually move
+        tol = np.where(amp > 1e-2*scale,
+                       np.minimum(self.rtol*scale, self.phase_tol*amp), self.rtol*scale)
+        if np.all(d[-1] <= 1e-3*tol):
+            return True
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = d[1:]/d[:-1]
+        rho = np.max(np.nan_to_num(ratios[-(self.n_cycles + 1):], nan=0.0, posinf=np.inf),
+                     axis=0)
+        if np.any(rho >= 1):
+            return False
+        remaining = np.max(d[-self.n_cycles:], axis=0)*rho/(1 - rho)
+        return bool(np.all(remaining <= tol))
+
+    def result(self, stop_time):
+        """SteadyState summary from the latest completed cycle."""
+        if not self.cycles:
+            return SteadyState(np.nan, np.nan, np.nan, stop_time, False)
+        _, amp, phase = self.cycles[-1]
+        settle = np.nan
+        if self.converged:
+            first = self.cycles[-(self.n_cycles + 1)][0]
+            settle = first - self.period
+        return SteadyState(amp, phase, settle, stop_time, self.converged)
+
+
+def integrate_until_steady(advance, y0, dt, Omega, t_max, observe=None,
+                           t0=0.0, rtol=1e-3, phase_tol=1e-3, n_cycles=3):
+    """
+    Step y from t0 with advance(y, t) -> y(t+dt) until the observed signal
+    is steady or t_max is reached.  observe(y) picks the watched quantity
+    (default y[0]).  Returns (y, SteadyState).
+
+    Example with the 4-mass kernel:
+        rk4 = MatrixRK4(M, C, K, load=F0, Omega=omega)
+        y, ss = integrate_until_steady(lambda y, t: rk4.step(y, t, dt),
+                                       np.zeros(8), dt, omega, 200.0)
+    """
+    if observe is None:
+        observe = lambda y: y[0]
+    det = SteadyStateDetector(Omega, t0, rtol, phase_tol, n_cycles)
+    y = np.array(y0, dtype=float)
+    n_max = int(round((t_max - t0)/dt))
+    t = t0
+    det.update(t, observe(y))
+    for i in range(n_max):
+        y = advance(y, t)
+        t = t0 + (i + 1)*dt
+        if det.update(t, observe(y)):
+            break
+    return y, det.result(t)
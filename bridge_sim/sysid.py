@@ -0,0 +1,177 @@
+"""Calibrate the bridge models against measured response histories.
+
+The forward simulations use hand-picked parameters (m = 1000, k = 4e4,
+zeta = 0.05, kc, cc ...).  identify fits them to a measured displacement
+or acceleration record under a known harmonic load by nonlinear least
+squares on the logarithms of the parameters (which keeps them positive
+and evens out their very different scales):
+
+    model = SDOFModel(t, F0=1000.0, Omega=omega_n)
+    fit = identify(model, x_measured, p0=dict(m=900, k=3.5e4, zeta=0.08))
+    fit.values, fit.ci_lo, fit.ci_hi, fit.n_eval
+
+A model simulates a whole batch of parameter sets in one call -- the
+closed form for the SDOF model, a stacked RK4 (batched.rk4_linear_batch)
+for the 4-mass deck -- so every Levenberg-Marquardt iteration costs one
+call for the residual and one for all Jacobian columns, and the optional
+global search evaluates each differential-evolution generation as one
+batch.  Confidence intervals come from the Jacobian at the optimum
+(linearized covariance s^2 (J^T J)^-1, Student t quantiles).
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy import optimize, stats
+
+from .analytic import sdof_closed_form
+from .batched import rk4_linear_batch
+from .models import four_mass_matrices, state_space
+
+Identification = namedtuple("Identification", ["names", "values", "ci_lo", "ci_hi",
+                                               "std_err", "rmse", "n_eval", "n_batches",
+                                               "success"])
+Identification.__doc__ = """\
+Free parameter names and, per parameter, the fitted value, the
+confidence interval (ci_lo, ci_hi) and the standard error; the RMS
+residual; n_eval model runs in n_batches batched simulation calls."""
+
+MEASURES = ("displacement", "acceleration")
+
+
+class SDOFModel:
+    """
+    m x'' + c x' + k x = F0 sin(Omega t), c = 2 zeta sqrt(k m), observed at
+    times t (displacement or acceleration), from x0, v0.
+    """
+
+    names = ("m", "k", "zeta")
+
+    def __init__(self, t, F0, Omega, measure="displacement", x0=0.0, v0=0.0):
+        if measure not in MEASURES:
+            raise ValueError(f"unknown measure {measure!r}; use one of {MEASURES}")
+        self.t = np.asarray(t, dtype=float)
+        self.F0, self.Omega = float(F0), float(Omega)
+        self.measure = measure
+        self.x0, self.v0 = x0, v0
+
+    def simulate(self, params):
+        """Responses for parameter rows [m, k, zeta], shape (S, len(t))."""
+        m, k, zeta = np.asarray(params, dtype=float).T
+        x, v = sdof_closed_form(m, k, zeta, self.F0, self.Omega, self.t,
+                                self.x0, self.v0, return_velocity=True)
+        if self.measure == "displacement":
+            return x
+        c = 2*zeta*np.sqrt(k*m)
+        F = self.F0*np.sin(self.Omega*self.t)
+        return (F[None, :] - c[:, None]*v - k[:, None]*x)/m[:, None]
+
+
+class FourMassModel:
+    """
+    4-corner deck of four_mass_matrices under load*sin(Omega t), with
+    c0 = 2 zeta sqrt(k m) to ground, observed on the DOFs in dofs (default
+    all) at the uniformly spaced times t.  The coupling kc, cc only shows
+    in the response if the load is not the same on every corner.
+    """
+
+    names = ("m", "k", "zeta", "kc", "cc")
+
+    def __init__(self, t, load, Omega, dofs=None, measure="displacement"):
+        if measure not in MEASURES:
+            raise ValueError(f"unknown measure {measure!r}; use one of {MEASURES}")
+        self.t = np.asarray(t, dtype=float)
+        self.load = np.broadcast_to(np.asarray(load, dtype=float), (4,))
+        self.Omega = float(Omega)
+        self.dofs = np.arange(4) if dofs is None else np.atleast_1d(dofs)
+        self.measure = measure
+
+    def simulate(self, params):
+        """Responses for parameter rows [m, k, zeta, kc, cc], shape (S, len(t)*len(dofs))."""
+        params = np.asarray(params, dtype=float)
+        A = np.empty((len(params), 8, 8))
+        b = np.empty((len(params), 8))
+        for s, (m, k, zeta, kc, cc) in enumerate(params):
+            A[s], B = state_space(*four_mass_matrices(m, k, 2*zeta*np.sqrt(k*m), kc, cc))
+            b[s] = B @ self.load
+        ys = rk4_linear_batch(A, b, self.Omega, self.t)
+        if self.measure == "displacement":
+            out = ys[:, :, self.dofs]
+        else:
+            rows = 4 + self.dofs
+            out = (np.einsum("stj,srj->str", ys, A[:, rows])
+                   + b[:, None, rows]*np.sin(self.Omega*self.t)[None, :, None])
+        return out.reshape(len(params), -1)
+
+
+def identify(model, data, p0, fixed=None, bounds=None, global_search=False,
+             confidence=0.95, popsize=15, maxiter=100, rng=None, diff_step=1e-6):
+    """
+    Fit the parameters of model (SDOFModel, FourMassModel or any object
+    with names and a batched simulate(params)) to the measured data,
+    shape (len(t),) or (len(t), len(dofs)).
+
+    p0 maps every parameter name to its starting value; names listed in
+    fixed (a dict of values) are held there.  With global_search=True a
+    vectorized differential evolution over bounds (name -> (lo, hi);
+    default p0/10 .. 10 p0) runs first and Levenberg-Marquardt polishes
+    its best member.  Jacobians are forward differences of relative step
+    diff_step.  Returns an Identification.
+    """
+    fixed = dict(fixed or {})
+    names = [n for n in model.names if n not in fixed]
+    missing = set(names) - set(p0)
+    if missing:
+        raise ValueError(f"no starting value for {', '.join(sorted(missing))}")
+    free = np.array([model.names.index(n) for n in names])
+    base = np.array([fixed.get(n, p0.get(n, np.nan)) for n in model.names], dtype=float)
+    if np.any(base[free] <= 0):
+        raise ValueError("parameters are fitted on a log scale and must start positive")
+    y = np.asarray(data, dtype=float).ravel()
+    counts = {"eval": 0, "batches": 0}
+
+    def simulate(theta):
+        """Residuals for log-parameter rows theta, shape (S, n_obs)."""
+        P = np.tile(base, (len(theta), 1))
+        P[:, free] = np.exp(theta)
+        counts["eval"] += len(theta)
+        counts["batches"] += 1
+        return model.simulate(P) - y
+
+    last = {}
+
+    def residual(theta):
+        r = simulate(theta[None])[0]
+        last["theta"], last["r"] = theta.copy(), r
+        return r
+
+    def jacobian(theta):
+        steps = np.eye(theta.size)*diff_step
+        if last.get("theta") is not None and np.array_equal(last["theta"], theta):
+            r0, R = last["r"], simulate(theta + steps)
+        else:
+            R = simulate(np.vstack([theta, theta + steps]))
+            r0, R = R[0], R[1:]
+        return ((R - r0)/diff_step).T
+
+    theta0 = np.log(base[free])
+    if global_search:
+        bounds = bounds or {}
+        box = [np.log(bounds.get(n, (p0[n]/10, p0[n]*10))) for n in names]
+        de = optimize.differential_evolution(
+            lambda th: np.sum(simulate(th.T)**2, axis=1), box, vectorized=True,
+            updating="deferred", popsize=popsize, maxiter=maxiter, seed=rng,
+            polish=False, x0=np.clip(theta0, *np.array(box).T))
+        theta0 = de.x
+    res = optimize.least_squares(residual, theta0, jac=jacobian, method="lm")
+
+    # linearized covariance of the log-parameters at the optimum
+    J = jacobian(res.x)
+    dof = max(y.size - res.x.size, 1)
+    s2 = 2*res.cost/dof
+    cov = s2*np.linalg.pinv(J.T @ J)
+    se = np.sqrt(np.maximum(np.diag(cov), 0.0))
+    q = stats.t.ppf(0.5 + confidence/2, dof)
+    values = np.exp(res.x)
+    return Identification(tuple(names), values, np.exp(res.x - q*se), np.exp(res.x + q*se),
+                          values*se, np.sqrt(2*res.cost/y.size), counts["eval"],
+                          counts["batches"], bool(res.success))
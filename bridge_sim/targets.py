@@ -0,0 +1,376 @@
+"""Every figure, table and page of the project as a named build target.
+
+Each builder reproduces one of the root scripts without any interactive
+step: it runs the script's simulation, draws the figure with the same
+function from figures.py that the script calls, on the non-interactive
+Agg backend, then saves and closes it (never ``plt.show()``); Plotly
+pages are written straight to HTML.  matplotlib, plotly, pandas and
+scipy.signal are only imported by the builders that need them.
+
+Simulations used by several targets (e.g. the four-damping-ratio run
+behind Time_history.png, Steady_State.png and the sample CSVs) are run
+once per Session and shared.
+"""
+import functools
+import os
+
+import numpy as np
+
+from . import figures
+from .analytic import sdof_closed_form
+from .batched import rk4_sdof_batch
+from .webexport import write_compact_html
+
+TARGETS = {}
+
+
+def target(*names):
+    """Register a builder for one or more artifact file names."""
+    def register(func):
+        for name in names:
+            TARGETS[name] = func
+        return func
+    return register
+
+
+class Session:
+    """Output directory, optional result cache and shared simulation results."""
+
+    def __init__(self, out_dir=".", cache=None):
+        self.out_dir = out_dir
+        self.cache = cache
+        self._memo = {}
+        os.makedirs(out_dir, exist_ok=True)
+
+    def path(self, name):
+        return os.path.join(self.out_dir, name)
+
+    def shared(self, name, compute):
+        """Result of compute(), evaluated at most once per session."""
+        if name not in self._memo:
+            self._memo[name] = compute()
+        return self._memo[name]
+
+    def sdof_batch(self, m, k, zeta, F0, Omega, t):
+        """rk4_sdof_batch, through the on-disk cache when one is configured."""
+        run = lambda: rk4_sdof_batch(m, k, zeta, F0, Omega, t)
+        if self.cache is None:
+            return run()
+        return self.cache.cached(run, model="sdof", integrator=rk4_sdof_batch,
+                                 m=m, k=k, zeta=zeta, F0=F0, Omega=Omega,
+                                 dt=t[1] - t[0], T=t[-1], x0=0.0, v0=0.0)
+
+
+def _pyplot():
+    """pyplot on the Agg backend (selected before figures.py imports pyplot)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _save(session, fig, name, **kwargs):
+    fig.savefig(session.path(name), **kwargs)
+    _pyplot().close(fig)
+
+
+# === Shared simulations ===
+
+def _scenarios(session):
+    """3_scenarios_oscillation.py / SetUp_table.py: four damping ratios at resonance."""
+    def compute():
+        m, k, F0 = 1000.0, 4e4, 1000.0
+        Omega = np.sqrt(k / m)
+        h = 0.01
+        t = np.arange(0, 20 + h, h)
+        zetas = [0.0, 0.05, 0.5, 2.0]
+        X = session.sdof_batch(m, k, np.array(zetas), F0, Omega, t)
+        return t, zetas, {z: X[i] for i, z in enumerate(zetas)}
+    return session.shared("scenarios", compute)
+
+
+def _steady_error(session):
+    """Build_Data_Table.py: RK4 vs. analytical solution over 60 s."""
+    def compute():
+        m, k, zeta, F0 = 1000, 20000, 0.05, 1000
+        omega_n = np.sqrt(k / m)
+        Omega = omega_n
+        T, dt = 60, 0.01
+        t_vals = np.arange(0, T + dt, dt)
+        x_vals = session.sdof_batch(m, k, zeta, F0, Omega, t_vals)[0]
+        x_exact = sdof_closed_form(m, k, zeta, F0, Omega, t_vals)[0]
+
+        mask = t_vals >= 40
+        abs_error = np.abs(x_vals[mask] - x_exact[mask])
+        columns = {
+            "Time (s)":           t_vals[mask],
+            "X_exact (m)":        x_exact[mask],
+            "X_predicted (m)":    x_vals[mask],
+            "Absolute Error (m)": abs_error,
+            "Relative Error (%)": abs_error/np.maximum(np.abs(x_exact[mask]), 1e-10)*100,
+        }
+        return dict(m=m, k=k, F0=F0, t=t_vals, x=x_vals, x_exact=x_exact, columns=columns)
+    return session.shared("steady_error", compute)
+
+
+def _error_frame(session):
+    import pandas as pd
+    return pd.DataFrame(_steady_error(session)["columns"])
+
+
+# === 3_scenarios_oscillation.py ===
+
+@target("Time_history.png")
+def time_history(session):
+    _pyplot()
+    t, zetas, results = _scenarios(session)
+    _save(session, figures.time_history_figure(t, results), "Time_history.png")
+
+
+@target("Steady_State.png")
+def steady_state(session):
+    _pyplot()
+    t, zetas, results = _scenarios(session)
+    _save(session, figures.steady_state_figure(t, results), "Steady_State.png")
+
+
+@target("Logarithmic_Decay.png")
+def logarithmic_decay(session):
+    _pyplot()
+    t, zetas, results = _scenarios(session)
+    _save(session, figures.log_decay_figure(t, results), "Logarithmic_Decay.png")
+
+
+# === SetUp_table.py ===
+
+_SAMPLE_TABLES = {
+    "time_history_samples.csv": ([0, 4, 8, 12, 16, 20], False),
+    "steady_state_samples.csv": ([10, 12, 14, 16, 18, 20], False),
+    "envelope_samples.csv":     ([1, 5, 10, 15, 20], True),
+}
+
+
+def sample_tables(session, name):
+    t, zetas, results = _scenarios(session)
+    table = figures.sample_table(t, results, *_SAMPLE_TABLES[name])
+    table.to_csv(session.path(name), index=False)
+
+
+for _name in _SAMPLE_TABLES:
+    TARGETS[_name] = functools.partial(sample_tables, name=_name)
+
+
+# === Build_Data_Table.py ===
+
+@target("steady_state_error.csv")
+def steady_state_error_csv(session):
+    _error_frame(session).to_csv(session.path("steady_state_error.csv"), index=False)
+
+
+@target("steady_state_error.xlsx")
+def steady_state_error_xlsx(session):
+    _error_frame(session).to_excel(session.path("steady_state_error.xlsx"), index=False)
+
+
+@target("bridge_response.png")
+def bridge_response(session):
+    _pyplot()
+    d = _steady_error(session)
+    fig = figures.bridge_response_figure(d["t"], d["x"], d["x_exact"], d["F0"]/d["k"])
+    _save(session, fig, "bridge_response.png", dpi=300, bbox_inches='tight')
+
+
+@target("steady_state_error_table.png")
+def steady_state_error_table(session):
+    _pyplot()
+    fig = figures.error_table_figure(_error_frame(session))
+    _save(session, fig, "steady_state_error_table.png", dpi=300, bbox_inches='tight')
+
+
+# === Error vs Time plot.py ===
+
+@target("error_vs_time.png")
+def error_vs_time(session):
+    _pyplot()
+    _save(session, figures.error_vs_time_figure(_error_frame(session)),
+          "error_vs_time.png", dpi=300)
+
+
+# === Time_History_of_Displacement(2D Plot).py ===
+
+@target("Bridge_Displacement_Over_Time.png")
+def bridge_displacement_over_time(session):
+    _pyplot()
+    m, k, zeta, F0 = 1000.0, 4e4, 0.05, 1000.0
+    omega_n = np.sqrt(k/m)
+    Omega = omega_n
+    h = 0.005
+    t_vals = np.arange(0, 20+h, h)
+    x_vals = session.sdof_batch(m, k, zeta, F0, Omega, t_vals)[0]
+    x_exact = sdof_closed_form(m, k, zeta, F0, Omega, t_vals)[0]
+    fig = figures.displacement_over_time_figure(t_vals, x_vals, x_exact, F0/k)
+    _save(session, fig, "Bridge_Displacement_Over_Time.png", dpi=300)
+
+
+# === Bode_Plot_of_System Response(2D Plot).py ===
+
+@target("Bode_Plot_Bridge_SDOF.png")
+def bode_plot(session):
+    from scipy.signal import TransferFunction, bode
+    from .frf import find_resonances
+    from .models import sdof_matrices
+    _pyplot()
+    m, k, zeta = 1000.0, 4e4, 0.05
+    c = 2 * zeta * np.sqrt(k * m)
+    w, mag, phase = bode(TransferFunction([1.0], [m, c, k]), w=np.logspace(-1, 2, 500))
+    res = find_resonances(*sdof_matrices(m, c, k), 1.0, w[0], w[-1])
+    _save(session, figures.bode_figure(w, mag, phase, res), "Bode_Plot_Bridge_SDOF.png",
+          dpi=300)
+
+
+# === Damped_Vibration_Response / Effect_of_Damping_on_Displacement ===
+
+@target("Damping_Comparison.png")
+def damping_comparison(session):
+    _pyplot()
+    t_vals = np.linspace(0, 10, 500)
+    fig = figures.damping_comparison_figure(t_vals, *figures.free_vibration(1.0, t_vals))
+    _save(session, fig, "Damping_Comparison.png", dpi=300)
+
+
+@target("Effect_of_Damping_on_Displacement.png")
+def effect_of_damping(session):
+    _pyplot()
+    t_vals = np.linspace(0, 60, 2000)
+    fig = figures.damping_effect_figure(t_vals, *figures.free_vibration(1.0, t_vals))
+    _save(session, fig, "Effect_of_Damping_on_Displacement.png", dpi=300)
+
+
+# === frequency_Response(2D Plot).py ===
+
+@target("Frequency_Response.png")
+def frequency_response_plot(session):
+    from .frf import find_resonances
+    from .models import sdof_matrices
+    _pyplot()
+    m, k, zeta, F0 = 1000.0, 4e4, 0.05, 1000.0
+    omega_n = np.sqrt(k / m)
+    frequencies = np.linspace(0.5 * omega_n, 2 * omega_n, 100)
+    amplitudes = (F0 / m) / np.sqrt((omega_n**2 - frequencies**2)**2
+                                    + (2*zeta*omega_n*frequencies)**2)
+    res = find_resonances(*sdof_matrices(m, 2*zeta*np.sqrt(k*m), k), F0,
+                          0.5*omega_n, 2*omega_n)
+    _save(session, figures.frequency_response_figure(frequencies, amplitudes, res, zeta),
+          "Frequency_Response.png")
+
+
+# === Wanted_3D_Plot2.py / Wanted_3D_Plot3.py / Wanted_3D_Combined.py ===
+
+def _four_mass_run(m, k0, c0, kc, cc, load, omega, dt, T, dofs=None):
+    """(times, x[dofs] history, final state); dofs=None keeps no history."""
+    from .kernel import MatrixRK4
+    from .models import four_mass_matrices
+    from .recorders import History
+    n_steps = int(T/dt)
+    rk4 = MatrixRK4(*four_mass_matrices(m, k0, c0, kc, cc), load=load, Omega=omega)
+    recorders = [] if dofs is None else [History(dofs)]
+    final = rk4.run(np.zeros(8), dt, n_steps, recorders=recorders)
+    values = recorders[0].values if recorders else None
+    return np.linspace(0, T, n_steps+1), values, final
+
+
+@target("amplitude_time.png")
+def amplitude_time(session):
+    _pyplot()
+    m, k0, kc = 1e5, 2e7, 1e7
+    c0 = 2*np.sqrt(k0*m)*0.01
+    time, x, _ = _four_mass_run(m, k0, c0, kc, c0, 1e6, 2*np.pi*2.25, 0.005, 50, dofs=[0])
+    _save(session, figures.mass_displacement_figure(time, x[:, 0]), "amplitude_time.png")
+
+
+def _corner_deck():
+    """Parameters shared by Wanted_3D_Plot3.py and Wanted_3D_Combined.py."""
+    m, k0 = 1000.0, 4e4
+    F0 = 1e3
+    return dict(m=m, k0=k0, c0=2 * 0.05 * np.sqrt(k0*m), kc=1e4, cc=500.0,
+                load=[F0, 0.0, F0, 0.0], omega=2 * np.pi * 2.25)
+
+
+@target("deformation_3d.png")
+def deformation_3d(session):
+    _pyplot()
+    _, _, final = _four_mass_run(dt=0.001, T=10.0, **_corner_deck())
+    _save(session, figures.deck_deformation_figure(final[:4]), "deformation_3d.png", dpi=200)
+
+
+@target("index.html")
+def combined_page(session):
+    deck = _corner_deck()
+    times, x, final = _four_mass_run(dt=0.005, T=10.0, dofs=[0], **deck)
+    fig = figures.combined_deck_figure(times, x[:, 0], final, deck["load"][0], deck["k0"])
+    write_compact_html(fig, session.path("index.html"))
+
+
+# === 3D_Oscillating_Image.py ===
+
+@target("bridge_oscillation_slow.gif")
+def mode_shape_gif(session):
+    from .animate import ModeShapeScene, render_frames, write_animation
+    m, k, F0, zeta = 1000.0, 4e4, 1000.0, 0.05
+    omega_n = np.sqrt(k/m)
+    t = np.linspace(0, 20, 400)
+    A = session.sdof_batch(m, k, zeta, F0, omega_n, t)[0]
+
+    L = 10.0
+    x = np.linspace(0, L, 100)
+    phi = np.sin(np.pi * x / L)
+    frames_idx = np.linspace(0, len(t)-1, 100, dtype=int)
+
+    scene = ModeShapeScene(x, phi, A[frames_idx[0]], zeta=zeta)
+    write_animation(render_frames(scene, A[frames_idx]),
+                    session.path("bridge_oscillation_slow.gif"), fps=10)
+
+
+# === 3D_Oscillation_interation_02.py ===
+
+@target("bridge_response_3d.html")
+def bridge_response_3d(session):
+    fig = figures.response_slider_figure(1000.0, 4e4, 1000.0, np.linspace(0, 20, 60),
+                                         np.linspace(0, 2, 30))
+    write_compact_html(fig, session.path("bridge_response_3d.html"))
+
+
+# === 3D Time–Frequency Surface of Bridge Response.py ===
+
+@target("time_frequency_surface.html")
+def time_frequency_surface(session):
+    fig = figures.time_frequency_surface_figure(1000.0, 4e4, 1000.0, 0.05,
+                                                np.linspace(0, 20, 200))
+    write_compact_html(fig, session.path("time_frequency_surface.html"))
+
+
+@target("time_frequency_spectrogram.html")
+def time_frequency_spectrogram(session):
+    from .spectral import spectrogram_figure, swept_sine_spectrogram
+    m, k, F0, zeta = 1000.0, 4e4, 1000.0, 0.05
+    omega_n = np.sqrt(k/m)
+    result = swept_sine_spectrogram(m, k, zeta, F0, 0.5*omega_n, 1.5*omega_n, T=240.0,
+                                    dt=0.01, nperseg=2048, noverlap=1792, nfft=4096,
+                                    f_range=(0, 2.5))
+    fig = spectrogram_figure(*result,
+                             title="Bridge Response Spectrogram (swept wind frequency)")
+    write_compact_html(fig, session.path("time_frequency_spectrogram.html"))
+
+
+# === 3D_Oscillating_interaction.py ===
+
+@target("multi_viz.html")
+def multi_viz(session):
+    fig = figures.multi_viz_figure(1000, 4e4, 1000, np.linspace(0, 20, 60),
+                                   np.linspace(0, 2, 30))
+    write_compact_html(fig, session.path("multi_viz.html"))
+
+
+def build(name, session):
+    """Build one named artifact."""
+    TARGETS[name](session)
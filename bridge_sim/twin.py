@@ -0,0 +1,446 @@
+"""Online digital twin: a streaming Kalman estimator fed by accelerometers.
+
+The SDOF bridge model (or any M, C, K model) runs next to the sensors.
+Acceleration samples arrive from an async source -- a TCP stream, or a
+file replayed at the sensor rate as the local stand-in -- and every
+sample advances a Kalman filter built on the model's exact discrete
+state-space form.  Estimated displacement and velocity are published
+sample by sample:
+
+    kf = sdof_filter(m=1000, k=4e4, zeta=0.05, dt=1e-3, force_std=1000, accel_std=0.05)
+    report = asyncio.run(run_twin(replay("accel.csv", dt=1e-3), kf, sink=publish))
+    print(report.latency.summary())
+
+Without a modelled load the whole wind force is estimated as process
+noise; giving the model's F0 sin(Omega t) (sdof_filter(..., F0, Omega))
+makes the estimate far tighter.
+
+Samples pass through a bounded queue.  When the estimator falls behind,
+the backpressure policy either blocks the source (a socket then stops
+being read and TCP throttles the sender) or drops samples; the filter
+bridges dropped samples with prediction-only steps so its clock stays
+right.  Latency (sample arrival to publish) and service time are kept in
+log-spaced histograms, so a 1 kHz run can be checked against its 1 ms
+budget:
+
+    python -m bridge_sim.twin --demo 30 --F0 1000      # synthetic 1 kHz record
+    python -m bridge_sim.twin --replay accel.csv --dt 0.001
+    python -m bridge_sim.twin --connect 10.0.0.5:9000 --policy drop_oldest
+"""
+import argparse
+import asyncio
+import inspect
+import math
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import expm, solve_discrete_are
+
+from .exact import ExactPropagator
+from .models import sdof_matrices, state_space
+
+Estimate = namedtuple("Estimate", "t x v")
+TwinReport = namedtuple("TwinReport",
+                        "n_samples n_dropped n_late queue_peak latency service wall_s")
+
+POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+def _process_noise(A, B, W, dt):
+    """Discrete covariance of the white input noise B w, E[w w^T] = W delta(t) (Van Loan)."""
+    n = A.shape[0]
+    Z = np.zeros((2*n, 2*n))
+    Z[:n, :n] = -A
+    Z[:n, n:] = B @ W @ B.T
+    Z[n:, n:] = A.T
+    E = expm(Z*dt)
+    Q = E[n:, n:].T @ E[:n, n:]
+    return 0.5*(Q + Q.T)
+
+
+class KalmanFilter:
+    """
+    Kalman filter for M x'' + C x' + K x = F(t) sampled every dt and
+    observed by accelerometers on the DOFs in `sensors` (default all):
+
+        a = H y + D F + noise,   [H, D] = acceleration rows of [A, B].
+
+    force(t) is the modelled load (length-n vector), or None.  Whatever
+    the model misses is treated as a white force of standard deviation
+    force_std on every DOF; accel_std is the sensor noise.  With
+    steady=True the gain is the stationary one from the discrete Riccati
+    equation, so every sample costs the same few small matrix products.
+    """
+
+    def __init__(self, M, C, K, dt, force_std, accel_std, sensors=None, force=None,
+                 steady=True, y0=None):
+        if sp.issparse(M) or sp.issparse(C) or sp.issparse(K):
+            M, C, K = (a.toarray() if sp.issparse(a) else a for a in (M, C, K))
+        A, B = state_space(M, C, K)
+        self.n = n = B.shape[1]
+        self.dt = float(dt)
+        self.force = force
+        self.sensors = np.arange(n) if sensors is None else np.atleast_1d(sensors)
+        prop = ExactPropagator(A, B, self.dt)
+        self.Phi, self.Bd0, self.Bd1 = prop.Phi, prop.Bd0, prop.Bd1
+        self.H = A[n + self.sensors]
+        self.D = B[n + self.sensors]
+
+        W = force_std**2*self.dt*np.eye(n)      # white force at the sample rate
+        self.Q = _process_noise(A, B, W, self.dt)
+        # the unmodelled force also reaches the accelerometers directly
+        self.R = accel_std**2*np.eye(self.sensors.size) + force_std**2*self.D @ self.D.T
+        self.steady = steady
+        # a priori covariance of the stationary filter
+        self.P = solve_discrete_are(self.Phi.T, self.H.T, self.Q, self.R)
+        self.gain = self._gain(self.P)
+        self.reset(y0)
+
+    def _gain(self, P):
+        S = self.H @ P @ self.H.T + self.R
+        return np.linalg.solve(S, self.H @ P).T
+
+    def reset(self, y0=None, P0=None):
+        """Restart from state y0 (default rest) and covariance P0 (default stationary)."""
+        self.y = np.zeros(2*self.n) if y0 is None else np.array(y0, dtype=float)
+        self._P = self.P.copy() if P0 is None else np.array(P0, dtype=float)
+        self.t = None
+
+    def predict(self):
+        """Advance the estimate one sample without a measurement."""
+        y = self.Phi @ self.y
+        if self.force is not None:
+            y += self.Bd0 @ self.force(self.t) + self.Bd1 @ self.force(self.t + self.dt)
+        self.y = y
+        if not self.steady:
+            self._P = self.Phi @ self._P @ self.Phi.T + self.Q
+        self.t += self.dt
+
+    def update(self, a):
+        """Correct the estimate with the accelerations a measured at self.t."""
+        innovation = np.asarray(a, dtype=float) - self.H @ self.y
+        if self.force is not None:
+            innovation -= self.D @ self.force(self.t)
+        if self.steady:
+            self.y = self.y + self.gain @ innovation
+            return
+        G = self._gain(self._P)
+        self.y = self.y + G @ innovation
+        self._P = self._P - G @ self.H @ self._P
+
+    def step(self, t, a):
+        """
+        Filter the sample a taken at time t and return the state estimate.
+        Samples missing since the previous one (t jumped by several dt) are
+        bridged with prediction-only steps.
+        """
+        if self.t is None:
+            self.t = float(t)
+        else:
+            for _ in range(max(int(round((t - self.t)/self.dt)), 1)):
+                self.predict()
+        self.update(a)
+        return self.y
+
+
+def sdof_filter(m, k, zeta, dt, force_std, accel_std, F0=None, Omega=None, steady=True):
+    """
+    KalmanFilter for the SDOF bridge model of the time-history script,
+    c = 2 zeta sqrt(k m).  With F0 and Omega the load F0 sin(Omega t) is
+    part of the model; otherwise the whole load is estimated as noise.
+    """
+    c = 2*zeta*np.sqrt(k*m)
+    force = None
+    if F0 is not None:
+        force = lambda t: np.array([F0*np.sin(Omega*t)])
+    return KalmanFilter(*sdof_matrices(m, c, k), dt, force_std, accel_std,
+                        force=force, steady=steady)
+
+
+class LatencyHistogram:
+    """
+    Log-spaced histogram of latencies in seconds, bins_per_decade bins per
+    decade between lo and hi (plus under- and overflow bins).  Quantiles
+    are reported as the upper edge of their bin.
+    """
+
+    def __init__(self, lo=1e-6, hi=10.0, bins_per_decade=20):
+        self.lo = lo
+        self.bins_per_decade = bins_per_decade
+        n = int(math.ceil(math.log10(hi/lo)*bins_per_decade))
+        self.edges = lo*10.0**(np.arange(n + 1)/bins_per_decade)
+        self.counts = np.zeros(n + 2, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds < self.lo:
+            i = 0
+        else:
+            i = min(int(math.log10(seconds/self.lo)*self.bins_per_decade) + 1,
+                    self.counts.size - 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same bins."""
+        self.counts += other.counts
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self):
+        return self.total/max(self.count, 1)
+
+    def quantile(self, q):
+        if not self.count:
+            return float("nan")
+        i = int(np.searchsorted(np.cumsum(self.counts), q*self.count))
+        if i == 0:
+            return self.lo
+        return min(float(self.edges[min(i, self.edges.size - 1)]), self.max)
+
+    def fraction_over(self, limit):
+        """Share of samples slower than limit (to bin resolution)."""
+        if not self.count:
+            return 0.0
+        i = int(np.searchsorted(self.edges, limit, side="right"))
+        return float(self.counts[i + 1:].sum())/self.count
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99, 0.999)):
+        out = {"count": self.count, "mean": self.mean}
+        for q in quantiles:
+            out[f"p{q*100:g}"] = self.quantile(q)
+        out["max"] = self.max
+        return out
+
+
+async def replay(samples, dt, rate=None, t0=0.0, columns=None, block=4096):
+    """
+    Yield (t, accelerations) from a recorded file (.npy / .csv / raw
+    float64, memory-mapped as in forcing.open_force) or an array of shape
+    (n_samples,) or (n_samples, n_sensors).  Samples are paced at `rate`
+    per second (default 1/dt, i.e. real time); rate=0 replays as fast as
+    the consumer allows.
+    """
+    if isinstance(samples, str):
+        from .forcing import open_force
+        data = open_force(samples, dt, columns=columns).data
+    else:
+        data = np.asarray(samples, dtype=float)
+        data = data if data.ndim == 2 else data.reshape(-1, 1)
+    rate = 1.0/dt if rate is None else rate
+    start = time.perf_counter()
+    for first in range(0, data.shape[0], block):
+        chunk = np.asarray(data[first:first + block], dtype=float)
+        for j, a in enumerate(chunk):
+            i = first + j
+            if rate:
+                delay = start + i/rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)
+            yield t0 + i*dt, a
+
+
+async def socket_source(host, port):
+    """
+    Yield (t, accelerations) from a TCP stream of text lines
+    "t,a1[,a2,...]" (one line per sample, blank lines ignored).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        async for line in reader:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                values = [float(v) for v in line.split(b",")]
+            except ValueError:
+                raise ValueError(f"malformed sample line {line[:80]!r}") from None
+            if len(values) < 2:
+                raise ValueError(f"sample line needs t and at least one acceleration: {line!r}")
+            yield values[0], np.array(values[1:])
+    finally:
+        writer.close()
+
+
+async def run_twin(source, kf, sink=None, queue_size=256, policy="block", deadline=None):
+    """
+    Run the estimator kf (a KalmanFilter) on every (t, a) sample of the
+    async iterable source and hand each Estimate(t, x, v) to sink (a
+    function or coroutine function), until the source ends.
+
+    At most queue_size samples wait between source and estimator; when
+    the queue is full, policy "block" pauses the source, "drop_oldest"
+    discards the oldest waiting sample and "drop_newest" the arriving one.
+    Latency runs from the moment a sample is taken off the source to the
+    return of sink; samples slower than deadline (seconds, default dt)
+    count as late.  Returns a TwinReport.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}; use one of {POLICIES}")
+    deadline = kf.dt if deadline is None else deadline
+    queue = asyncio.Queue(maxsize=queue_size)
+    latency, service = LatencyHistogram(), LatencyHistogram()
+    counts = {"dropped": 0, "late": 0, "samples": 0, "peak": 0}
+    is_async = sink is not None and inspect.iscoroutinefunction(sink)
+    n = kf.n
+
+    async def produce():
+        try:
+            async for t, a in source:
+                item = (t, a, time.perf_counter())
+                if policy == "block":
+                    await queue.put(item)
+                elif queue.full():
+                    counts["dropped"] += 1
+                    if policy == "drop_newest":
+                        continue
+                    queue.get_nowait()
+                    queue.put_nowait(item)
+                else:
+                    queue.put_nowait(item)
+                counts["peak"] = max(counts["peak"], queue.qsize())
+            await queue.put(None)          # end of the source
+        finally:
+            # never block here: when the consumer has failed nobody drains
+            # the queue; consume() also stops on an empty queue once the
+            # producer is done, in case there was no room for the marker
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    async def consume():
+        while True:
+            if queue.empty() and producer.done():
+                return
+            item = await queue.get()
+            if item is None:
+                return
+            t, a, arrived = item
+            began = time.perf_counter()
+            y = kf.step(t, a)
+            if sink is not None:
+                est = Estimate(t, y[:n].copy(), y[n:].copy())
+                if is_async:
+                    await sink(est)
+                else:
+                    sink(est)
+            done = time.perf_counter()
+            latency.record(done - arrived)
+            service.record(done - began)
+            counts["samples"] += 1
+            if done - arrived > deadline:
+                counts["late"] += 1
+
+    start = time.perf_counter()
+    producer = asyncio.create_task(produce())
+    try:
+        await consume()
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+    if not producer.cancelled() and producer.exception():
+        raise producer.exception()
+    return TwinReport(counts["samples"], counts["dropped"], counts["late"], counts["peak"],
+                      latency, service, time.perf_counter() - start)
+
+
+def synthetic_record(m, k, zeta, F0, Omega, dt, duration, accel_std=0.0, rng=None):
+    """
+    (t, a, x, v) of the SDOF bridge from rest under F0 sin(Omega t), with
+    Gaussian noise of accel_std added to the acceleration a.
+    """
+    from .analytic import sdof_closed_form
+    t = np.arange(int(round(duration/dt)) + 1)*dt
+    x, v = sdof_closed_form(m, k, zeta, F0, Omega, t, return_velocity=True)
+    x, v = x[0], v[0]
+    c = 2*zeta*np.sqrt(k*m)
+    a = (F0*np.sin(Omega*t) - c*v - k*x)/m
+    a = a + np.random.default_rng(rng).normal(0.0, accel_std, t.size)
+    return t, a, x, v
+
+
+def _ms(seconds):
+    return f"{seconds*1e3:.3f} ms"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bridge_sim.twin",
+        description="Stream accelerometer samples through the SDOF Kalman twin.")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--replay", metavar="PATH", help="replay a .npy/.csv/raw float64 record")
+    src.add_argument("--connect", metavar="HOST:PORT", help="read 't,a' lines from a TCP stream")
+    src.add_argument("--demo", type=float, metavar="SECONDS",
+                     help="replay a synthetic noisy record of the SDOF model")
+    parser.add_argument("--dt", type=float, default=1e-3, help="sample interval (s)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="replay rate in samples/s (default real time, 0 = unpaced)")
+    parser.add_argument("--queue", type=int, default=256, help="queue size (samples)")
+    parser.add_argument("--policy", choices=POLICIES, default="block")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="latency budget per sample in s (default dt)")
+    parser.add_argument("--m", type=float, default=1000.0)
+    parser.add_argument("--k", type=float, default=4e4)
+    parser.add_argument("--zeta", type=float, default=0.05)
+    parser.add_argument("--F0", type=float, default=None,
+                        help="amplitude of a modelled load F0 sin(Omega t) (N); "
+                             "omit to estimate the whole load as noise")
+    parser.add_argument("--Omega", type=float, default=None,
+                        help="modelled forcing frequency (rad/s, default omega_n)")
+    parser.add_argument("--force-std", type=float, default=1000.0,
+                        help="standard deviation of the unmodelled force (N)")
+    parser.add_argument("--accel-std", type=float, default=0.05,
+                        help="accelerometer noise (m/s^2)")
+    args = parser.parse_args(argv)
+
+    Omega = np.sqrt(args.k/args.m) if args.Omega is None else args.Omega
+    kf = sdof_filter(args.m, args.k, args.zeta, args.dt, args.force_std, args.accel_std,
+                     F0=args.F0, Omega=Omega)
+    truth = None
+    if args.replay:
+        source = replay(args.replay, args.dt, args.rate)
+    elif args.connect:
+        host, _, port = args.connect.rpartition(":")
+        source = socket_source(host, int(port))
+    else:
+        F0 = 1000.0 if args.F0 is None else args.F0
+        t, a, x, _ = synthetic_record(args.m, args.k, args.zeta, F0, Omega, args.dt,
+                                      args.demo, args.accel_std, rng=0)
+        source = replay(a, args.dt, args.rate)
+        truth = x
+    estimates = []
+    sink = (lambda est: estimates.append(est.x[0])) if truth is not None else None
+
+    report = asyncio.run(run_twin(source, kf, sink, args.queue, args.policy, args.deadline))
+    deadline = args.deadline or args.dt
+    print(f"{report.n_samples} samples in {report.wall_s:.2f} s "
+          f"({report.n_samples/max(report.wall_s, 1e-9):.0f}/s), "
+          f"{report.n_dropped} dropped, {report.n_late} over {_ms(deadline)}, "
+          f"queue peak {report.queue_peak}")
+    for name, hist in (("latency", report.latency), ("service", report.service)):
+        s = hist.summary()
+        print(f"  {name:8s} mean {_ms(s['mean'])}  p50 {_ms(s['p50'])}  p99 {_ms(s['p99'])}"
+              f"  p99.9 {_ms(s['p99.9'])}  max {_ms(s['max'])}")
+    if truth is not None and report.n_dropped == 0:
+        err = np.asarray(estimates) - truth[:len(estimates)]
+        print(f"  displacement error rms {np.sqrt(np.mean(err**2)):.3g} m "
+              f"(peak |x| {np.abs(truth).max():.3g} m)")
+    return 1 if report.n_late else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
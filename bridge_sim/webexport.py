@@ -0,0 +1,133 @@
+"""Compact Plotly HTML export for animated and slider figures.
+
+fig.write_html embeds every frame in full: a slider over five frequency
+ratios repeats the (unchanged) time and damping grids ten times, and the
+mode-shape animation re-embeds both static surfaces in all 50 frames.
+write_compact_html writes the same page with
+
+* delta frames   -- each frame carries only the traces, and within them
+                    only the attributes, that change somewhere in the
+                    animation, addressed with frame.traces indices;
+* packed arrays  -- numeric arrays as base64 typed arrays (float32 by
+                    default) instead of decimal JSON;
+* 1-D grids      -- surface x/y given as meshgrid matrices are reduced
+                    to the equivalent vectors;
+* decimation     -- optionally every n-th row/column of surface grids.
+"""
+import base64
+
+import numpy as np
+
+_TYPED = {"float32": "f4", "float64": "f8", "int8": "i1", "uint8": "u1",
+          "int16": "i2", "uint16": "u2", "int32": "i4", "uint32": "u4"}
+
+
+def _keep(n, step):
+    """Every step-th index of range(n), always including the last one."""
+    idx = np.arange(0, n, step)
+    return idx if idx[-1] == n - 1 else np.append(idx, n - 1)
+
+
+def _compact_surface(trace, decimate):
+    """Reduce meshgrid x/y to vectors and optionally decimate a surface trace."""
+    x, y, z = (trace.get(c) for c in "xyz")
+    if isinstance(x, np.ndarray) and x.ndim == 2 and (x == x[:1]).all():
+        trace["x"] = x = x[0]
+    if isinstance(y, np.ndarray) and y.ndim == 2 and (y == y[:, :1]).all():
+        trace["y"] = y = y[:, 0]
+    if not decimate or not isinstance(z, np.ndarray) or z.ndim != 2:
+        return trace
+    rows, cols = _keep(z.shape[0], decimate), _keep(z.shape[1], decimate)
+    for key in ("z", "surfacecolor"):
+        if isinstance(trace.get(key), np.ndarray):
+            trace[key] = trace[key][np.ix_(rows, cols)]
+    for key, axis in (("x", cols), ("y", rows)):
+        v = trace.get(key)
+        if isinstance(v, np.ndarray):
+            trace[key] = v[axis] if v.ndim == 1 else v[np.ix_(rows, cols)]
+    return trace
+
+
+def _equal(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.shape != b.shape or a.dtype.kind != b.dtype.kind:
+            return False
+        return np.array_equal(a, b, equal_nan=a.dtype.kind in "fc")
+    return a == b
+
+
+def _delta_frames(data, frames):
+    """
+    Strip from every frame the trace attributes that are identical in the
+    base figure and in all frames; frames then address the remaining
+    traces by index (frame["traces"]).
+    """
+    entries = []            # per frame: [(trace index, trace dict), ...]
+    varying = {}            # trace index -> attribute names that change
+    for frame in frames:
+        items = list(zip(frame.get("traces", range(len(frame.get("data", [])))),
+                         frame.get("data", [])))
+        entries.append(items)
+        for i, tr in items:
+            base = data[i] if i < len(data) else {}
+            changed = varying.setdefault(i, set())
+            changed.update(k for k in tr if k != "type" and
+                           (k not in base or not _equal(tr[k], base[k])))
+    for frame, items in zip(frames, entries):
+        kept = [(i, {k: v for k, v in tr.items() if k in varying[i] or k == "type"})
+                for i, tr in items if varying[i] & tr.keys()]
+        frame["traces"] = [i for i, _ in kept]
+        frame["data"] = [tr for _, tr in kept]
+    return frames
+
+
+def _pack(obj, dtype):
+    """Numeric ndarrays -> plotly.js typed-array specs (floats cast to dtype)."""
+    if isinstance(obj, dict):
+        return {k: _pack(v, dtype) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_pack(v, dtype) for v in obj]
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            obj = obj.astype(dtype)
+        elif obj.dtype.kind in "iu" and str(obj.dtype) not in _TYPED:
+            obj = obj.astype("int32")
+        if str(obj.dtype) not in _TYPED or obj.size == 0:
+            return obj.tolist()
+        spec = {"dtype": _TYPED[str(obj.dtype)],
+                "bdata": base64.b64encode(np.ascontiguousarray(obj)).decode("ascii")}
+        if obj.ndim > 1:
+            spec["shape"] = ", ".join(map(str, obj.shape))
+        return spec
+    return obj
+
+
+def compact_figure(fig, dtype="float32", decimate=None, delta=True):
+    """
+    Plain figure dict of a plotly Figure with delta frames, packed arrays
+    and reduced surface grids (see module docstring).  decimate=n keeps
+    every n-th row and column of surface grids (plus the last ones).
+    """
+    data = [tr.to_plotly_json() for tr in fig.data]
+    frames = [fr.to_plotly_json() for fr in fig.frames]
+    for tr in data + [tr for fr in frames for tr in fr.get("data", [])]:
+        if tr.get("type") == "surface":
+            _compact_surface(tr, decimate)
+    if delta and frames:
+        frames = _delta_frames(data, frames)
+    out = {"data": data, "layout": fig.to_dict()["layout"]}
+    if frames:
+        out["frames"] = frames
+    return _pack(out, dtype)
+
+
+def write_compact_html(fig, path, dtype="float32", decimate=None, delta=True,
+                       include_plotlyjs="cdn", full_html=True, **kwargs):
+    """fig.write_html with a compact_figure payload; returns path."""
+    import plotly.io as pio
+    pio.write_html(compact_figure(fig, dtype, decimate, delta), path, validate=False,
+                   include_plotlyjs=include_plotlyjs, full_html=full_html, **kwargs)
+    return path
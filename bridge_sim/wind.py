@@ -0,0 +1,254 @@
+"""Turbulent wind loads and Monte Carlo response statistics.
+
+Instead of a single sinusoid F0 sin(Omega t), the along-wind gust u(t)
+at every loaded DOF is synthesized from a target spectrum by the
+spectral representation method: at each FFT frequency the one-sided
+cross-spectral matrix
+
+    S_jk(f) = S_u(f) * exp(-decay * f * |r_j - r_k| / U)      (Davenport coherence)
+
+is factored as H H^T, and every realization is the inverse real FFT of
+H times independent random phases.  The coherence is factored once per
+frequency band (not per FFT frequency), keeping only its numerically
+nonzero eigenvalues.  Bands of relative width coh_step change any
+coherence exp(-x) by at most coh_step/e, whatever the distance, and above
+the frequency where even the closest points are incoherent the coherence
+is the identity and needs no factor at all.
+All realizations of a batch come out of one FFT, and the quasi-steady
+drag  F = 1/2 rho Cd A (U + u)|U + u|  turns them into forces.
+
+monte_carlo integrates a whole batch of realizations as one state array
+with the exact first-order-hold propagator (exact for the piecewise-
+linear sampled loads) and keeps only running peak / RMS, plus optionally
+the rainflow fatigue damage counted in the same pass.  Large (sparse)
+models are reduced to their first n_modes modes before propagation.
+"""
+from collections import namedtuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from .exact import ExactPropagator
+from .fatigue import MinerDamage, RainflowCounter
+from .modal import ModalSolver
+from .models import mass_inverse, state_space
+
+MonteCarloResult = namedtuple("MonteCarloResult", "peak rms std mean dofs t_skip damage",
+                              defaults=(None,))
+
+
+def kaimal_spectrum(f, U, sigma, L=100.0):
+    """One-sided Kaimal spectrum (EN 1991-1-4 form) of the gust u, in (m/s)^2/Hz."""
+    x = np.asarray(f, dtype=float)*L/U
+    with np.errstate(divide="ignore", invalid="ignore"):
+        S = sigma**2 * 6.8*L/U / (1 + 10.2*x)**(5/3)
+    return S
+
+
+def davenport_spectrum(f, U, sigma, L=1200.0):
+    """One-sided Davenport spectrum of the gust u (length scale 1200 m), in (m/s)^2/Hz."""
+    f = np.asarray(f, dtype=float)
+    x = f*L/U
+    with np.errstate(divide="ignore", invalid="ignore"):
+        S = np.where(f > 0, sigma**2 * (2/3)*x**2 / (1 + x**2)**(4/3) / f, 0.0)
+    return S
+
+
+SPECTRA = {"kaimal": kaimal_spectrum, "davenport": davenport_spectrum}
+
+
+class TurbulentWind:
+    """
+    Gust and force histories at n loaded points on t = 0, dt, ..., duration.
+
+    positions are the point coordinates, shape (n,) along the span or
+    (n, 2) on the deck (e.g. the stacked X, Y of lattice_coordinates).
+    spectrum is "kaimal", "davenport" or a callable S(f) in (m/s)^2/Hz;
+    the turbulence intensity I_u sets sigma_u = I_u U.  Frequencies above
+    f_max are left out.
+
+    The n x n coherence is factored once per frequency band of relative
+    width coh_step, up to the frequency where it drops below coh_tol for
+    the closest points; each factor costs O(n^3) time and O(n^2) memory,
+    so keep n to a few thousand points.
+    """
+
+    def __init__(self, positions, U, dt, duration, spectrum="kaimal", I_u=0.15,
+                 L=None, decay=10.0, f_max=None, coh_step=0.05, coh_tol=1e-6):
+        pos = np.asarray(positions, dtype=float)
+        self.positions = pos.reshape(len(pos), -1)
+        self.n_points = len(pos)
+        self.U = float(U)
+        self.dt = float(dt)
+        self.n_samples = int(round(duration/dt)) + 1
+        self.t = np.arange(self.n_samples)*self.dt
+        self.sigma = I_u*self.U
+
+        # FFT length and frequencies f_k = k / (N dt); the mean (k = 0) is excluded
+        self._N = self.n_samples
+        self.freqs = np.fft.rfftfreq(self._N, self.dt)
+        if callable(spectrum):
+            S = spectrum(self.freqs)
+        else:
+            if spectrum not in SPECTRA:
+                raise ValueError(f"unknown spectrum {spectrum!r}; use one of {list(SPECTRA)}")
+            kw = {} if L is None else {"L": L}
+            S = SPECTRA[spectrum](self.freqs, self.U, self.sigma, **kw)
+        S = np.where(self.freqs > 0, np.nan_to_num(S), 0.0)
+        if f_max is not None:
+            S = np.where(self.freqs <= f_max, S, 0.0)
+        self.spectrum = S
+
+        # H(f) = sqrt(S(f)) W with W W^T = Coh(f), W from the eigen-
+        # decomposition of the coherence (robust where it is close to
+        # singular), one W per band of frequencies (freq indices, W)
+        dist = np.linalg.norm(self.positions[:, None] - self.positions[None], axis=-1)
+        self._sqrt_s = np.sqrt(S)
+        active = np.flatnonzero(S > 0)
+        d_min = dist[dist > 0].min() if np.any(dist > 0) else np.inf
+        f_coherent = -np.log(coh_tol)*self.U/(decay*d_min)
+        coherent = active[self.freqs[active] < f_coherent]
+        self._bands = []
+        band = np.floor(np.log(self.freqs[coherent]/self.freqs[1])/np.log1p(coh_step))
+        for b in np.unique(band):
+            idx = coherent[band == b]
+            f_mid = np.sqrt(self.freqs[idx[0]]*self.freqs[idx[-1]])
+            coh = np.exp(-decay*f_mid*dist/self.U)
+            lam, V = np.linalg.eigh(coh)
+            keep = lam > 1e-12*lam[-1]
+            self._bands.append((idx, V[:, keep]*np.sqrt(lam[keep])))
+        incoherent = active[self.freqs[active] >= f_coherent]
+        if incoherent.size:
+            self._bands.append((incoherent, None))
+
+    def gusts(self, n_realizations, rng=None):
+        """Gust velocities u, shape (n_realizations, n_samples, n_points)."""
+        rng = np.random.default_rng(rng)
+        X = np.zeros((n_realizations, self.freqs.size, self.n_points), dtype=complex)
+        for idx, W in self._bands:
+            width = self.n_points if W is None else W.shape[1]
+            phases = np.exp(2j*np.pi*rng.random((n_realizations, idx.size, width)))
+            X[:, idx] = (phases if W is None else phases @ W.T)*self._sqrt_s[idx, None]
+        df = 1.0/(self._N*self.dt)
+        # irfft(X)[n] = sum_k (2/N) Re(X_k e^{2 pi i k n / N}) for 0 < k < N/2
+        X *= 0.5*self._N*np.sqrt(2*df)
+        return np.fft.irfft(X, n=self._N, axis=1)
+
+    def forces(self, n_realizations, rng=None, rho=1.25, Cd=1.0, area=1.0,
+               linear=False):
+        """
+        Drag forces 1/2 rho Cd area (U + u)|U + u| per point, shape
+        (n_realizations, n_samples, n_points).  area may be per point.
+        linear=True gives only the fluctuating part rho Cd area U u.
+        """
+        u = self.gusts(n_realizations, rng)
+        q = 0.5*rho*Cd*np.broadcast_to(np.asarray(area, dtype=float), (self.n_points,))
+        if linear:
+            return 2*q*self.U*u
+        w = self.U + u
+        return q*w*np.abs(w)
+
+
+def monte_carlo(M, C, K, wind, n_realizations, load_dofs=None, dofs=None,
+                t_skip=0.0, batch_size=256, rng=None, sn_curve=None, stress_scale=1.0,
+                chunk=1024, n_modes=None, **force_kw):
+    """
+    Response statistics of M x'' + C x' + K x = F(t) under n_realizations
+    independent wind-force histories from `wind` (a TurbulentWind).
+
+    load_dofs lists the DOF loaded by each wind point (default: point i on
+    DOF i); dofs selects the DOFs whose statistics are kept (default all).
+    Samples before t_skip (the start-up transient from rest) are ignored.
+    Realizations are integrated batch_size at a time as one state array.
+    Returns MonteCarloResult with peak |x|, RMS, standard deviation (RMS
+    about the mean) and mean of x, each of shape (n_realizations, len(dofs)).
+    With an sn_curve (fatigue.SNCurve) the kept samples are also rainflow
+    counted, chunk steps at a time, and damage holds the Miner damage sum
+    for stress ranges stress_scale * (displacement range).
+
+    With n_modes the model is first reduced to its first n_modes modes
+    (modal.ModalSolver, classical modal damping) and the modal coordinates
+    are propagated instead; sparse M, C, K (e.g. deck_lattice) need it.
+    force_kw is passed to wind.forces.
+    """
+    load_dofs = np.arange(wind.n_points) if load_dofs is None else np.asarray(load_dofs)
+    if n_modes is not None:
+        modes = ModalSolver(M, C, K, n_modes)
+        n = modes.Phi.shape[0]
+        # q'' + 2 zeta omega q' + omega^2 q = Phi^T F, observed as x = Phi q
+        A, _ = state_space(np.eye(n_modes), np.diag(2*modes.zeta*modes.omega),
+                           np.diag(modes.omega**2))
+        B = np.vstack([np.zeros((n_modes, load_dofs.size)), modes.Phi[load_dofs].T])
+    elif sp.issparse(M) or sp.issparse(C) or sp.issparse(K):
+        raise ValueError("n_modes is required for sparse systems")
+    else:
+        n = mass_inverse(M).shape[0]
+        A, B = state_space(M, C, K)
+        B = B[:, load_dofs]
+    dofs = np.arange(n) if dofs is None else np.atleast_1d(np.asarray(dofs))
+    observe = None if n_modes is None else modes.Phi[dofs]
+    prop = ExactPropagator(A, B, wind.dt)
+    Phi, Bd0, Bd1 = prop.Phi, prop.Bd0, prop.Bd1
+    rng = np.random.default_rng(rng)
+    first = int(np.ceil(t_skip/wind.dt - 1e-9))
+    n_kept = wind.n_samples - first
+    if n_kept <= 0:
+        raise ValueError("t_skip leaves no samples")
+
+    peak = np.empty((n_realizations, dofs.size))
+    sumsq = np.empty_like(peak)
+    total = np.empty_like(peak)
+    damage = None if sn_curve is None else np.empty_like(peak)
+    for start in range(0, n_realizations, batch_size):
+        R = min(batch_size, n_realizations - start)
+        # (n_samples, n_points, R): each step reads one contiguous slab
+        F = np.ascontiguousarray(wind.forces(R, rng, **force_kw).transpose(1, 2, 0))
+        y = np.zeros((A.shape[0], R))
+        pk, s1, s2 = np.zeros((dofs.size, R)), np.zeros((dofs.size, R)), np.zeros((dofs.size, R))
+        if sn_curve is not None:
+            miner = MinerDamage(sn_curve, stress_scale, dofs.size*R)
+            counter = RainflowCounter(dofs.size*R, miner=miner)
+            buf = np.empty((chunk, dofs.size, R))
+            fill = 0
+        for i in range(wind.n_samples):
+            if i >= first:
+                x = y[dofs] if observe is None else observe @ y[:n_modes]
+                np.maximum(pk, np.abs(x), out=pk)
+                s1 += x
+                s2 += x*x
+                if sn_curve is not None:
+                    buf[fill] = x
+                    fill += 1
+                    if fill == chunk or i + 1 == wind.n_samples:
+                        counter.feed(buf[:fill].reshape(fill, -1).T)
+                        fill = 0
+            if i + 1 < wind.n_samples:
+                y = Phi @ y + Bd0 @ F[i] + Bd1 @ F[i + 1]
+        peak[start:start + R] = pk.T
+        total[start:start + R] = s1.T
+        sumsq[start:start + R] = s2.T
+        if sn_curve is not None:
+            counter.finish()
+            damage[start:start + R] = miner.damage.reshape(dofs.size, R).T
+    mean = total/n_kept
+    return MonteCarloResult(peak=peak, rms=np.sqrt(sumsq/n_kept),
+                            std=np.sqrt(np.maximum(sumsq/n_kept - mean**2, 0.0)),
+                            mean=mean, dofs=dofs, t_skip=first*wind.dt, damage=damage)
+
+
+def summarize(result, quantiles=(0.5, 0.95, 0.99)):
+    """
+    pandas table per DOF: mean/std of the peak, peak quantiles, mean RMS /
+    std / x, and the mean and largest fatigue damage if it was counted.
+    """
+    import pandas as pd
+    rows = {"mean_peak": result.peak.mean(axis=0), "std_peak": result.peak.std(axis=0)}
+    for q in quantiles:
+        rows[f"peak_q{q:g}"] = np.quantile(result.peak, q, axis=0)
+    rows["mean_rms"] = result.rms.mean(axis=0)
+    rows["mean_std"] = result.std.mean(axis=0)
+    rows["mean_x"] = result.mean.mean(axis=0)
+    if result.damage is not None:
+        rows["mean_damage"] = result.damage.mean(axis=0)
+        rows["max_damage"] = result.damage.max(axis=0)
+    return pd.DataFrame(rows, index=pd.Index(result.dofs, name="dof"))
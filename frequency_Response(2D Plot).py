@@ -1,5 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from bridge_sim.figures import frequency_response_figure
+from bridge_sim.frf import find_resonances
+from bridge_sim.models import sdof_matrices
 
 # === SYSTEM PARAMETERS ===
 m = 1000.0         # Mass (kg)
@@ -22,14 +25,13 @@ def calculate_amplitude(omega):
 
 # === FREQUENCY RESPONSE DATA ===
 frequencies = np.linspace(0.5 * omega_n, 2 * omega_n, 100)
-amplitudes = np.array([calculate_amplitude(omega) for omega in frequencies])
+amplitudes = calculate_amplitude(frequencies)      # vectorized over the grid
+
+# Resonance peak and half-power band, refined to 1e-6 (relative)
+res = find_resonances(*sdof_matrices(m, c, k), F0, 0.5*omega_n, 2*omega_n)
+for w_p, X_p, bw, Q in zip(res.omega, res.amplitude, res.bandwidth, res.Q):
+    print(f"peak {w_p:.6f} rad/s  X = {X_p:.6f} m  bandwidth {bw:.6f} rad/s  Q = {Q:.3f}")
 
 # === PLOT ===
-plt.figure(figsize=(10, 6))
-plt.plot(frequencies, amplitudes, lw=2)
-plt.xlabel("Frequency (rad/s)")
-plt.ylabel("Steady-State Amplitude, X (m)")
-plt.title("Frequency Response of the SDOF Bridge Model (ζ=0.05)")
-plt.grid(True)
-plt.tight_layout()
+frequency_response_figure(frequencies, amplitudes, res, zeta)
 plt.show()